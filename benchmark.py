@@ -0,0 +1,142 @@
+# pylint: disable=wrong-import-position, duplicate-code
+"""
+Benchmark of the ingestion pipeline of main on synthetic data at 1x, 10x and 100x.
+The results are compared to the baseline and the regressions are printed.
+
+    python benchmark.py --scales 1 10 --save-baseline
+    python benchmark.py --scales 1 10
+"""
+from sys import exit as sys_exit, path
+
+path.append("src")
+from argparse import ArgumentParser
+from datetime import datetime
+from os import makedirs
+from os import path as os_path
+from warnings import filterwarnings
+from colored import Fore, Style
+from src.utility.environment import Environment
+from src.data.ingestion_pipeline.benchmark import (
+    SCALES,
+    benchmark_pipeline,
+    compare_to_baseline,
+    load_benchmark_results,
+    save_benchmark_results,
+)
+from src.data.ingestion_pipeline.stages.cleaning.client_data_cleaning_calculated_fields_stage import (
+    build_client_data_cleaning_calculated_fields_stage,
+)
+from src.data.ingestion_pipeline.stages.cleaning.clock_data_cleaning_calculated_fields_stage import (
+    build_clock_data_cleaning_calculated_fields_stage,
+)
+from src.data.ingestion_pipeline.stages.cleaning.employee_data_cleaning_calculated_fields_stage import (
+    build_employee_data_cleaning_calculated_fields_stage,
+)
+from src.data.ingestion_pipeline.stages.cleaning.visit_data_cleaning_calculated_fields_stage import (
+    build_visit_data_cleaning_calculated_fields_stage,
+)
+from src.data.ingestion_pipeline.stages.augmented_visit_stage import (
+    build_augmented_visit_stage,
+)
+from src.data.ingestion_pipeline.stages.employee_history_aggregation_stage import (
+    build_employee_history_aggregation_stage,
+)
+from src.data.ingestion_pipeline.stages.employee_history_fill_gaps_stage import (
+    build_employee_history_fill_gaps_stage,
+)
+from src.data.ingestion_pipeline.stages.employee_history_calculated_fields_stage import (
+    build_employee_history_calculated_fields_stage,
+)
+from src.data.ingestion_pipeline.stages.employee_history_fill_na_stage import (
+    build_employee_history_fill_na_stage,
+)
+from src.data.ingestion_pipeline.stages.segmentation_stage import (
+    build_segmentation_stage,
+)
+from src.data.ingestion_pipeline.stages.training_employee_history_stage import (
+    build_training_employee_history_stage,
+)
+from src.data.ingestion_pipeline.stages.y_labels_generation_stage import (
+    build_y_labels_generation_stage,
+)
+from src.data.ingestion_pipeline.stages.employee_rolling_features_stage import (
+    build_employee_history_rolling_features_stage,
+)
+from src.utility.configs.configs import Configs
+
+filterwarnings("ignore")
+
+
+def build_stages(conf, env):
+    """
+    Build the stages of main.
+    """
+    return [
+        build_client_data_cleaning_calculated_fields_stage(conf, env),
+        build_clock_data_cleaning_calculated_fields_stage(conf, env),
+        build_employee_data_cleaning_calculated_fields_stage(conf, env),
+        build_visit_data_cleaning_calculated_fields_stage(conf, env),
+        build_augmented_visit_stage(conf, env),
+        build_employee_history_aggregation_stage(conf, env),
+        build_employee_history_fill_gaps_stage(conf, env),
+        build_employee_history_calculated_fields_stage(conf, env),
+        build_employee_history_rolling_features_stage(conf, env),
+        build_employee_history_fill_na_stage(conf, env),
+        build_y_labels_generation_stage(conf, env),
+        build_segmentation_stage(conf, env),
+        build_training_employee_history_stage(conf, env),
+    ]
+
+
+parser = ArgumentParser(description=__doc__)
+parser.add_argument("--scales", type=int, nargs="+", default=SCALES)
+parser.add_argument("--n-employees", type=int, default=50)
+parser.add_argument("--n-days", type=int, default=365)
+parser.add_argument("--max-workers", type=int, default=1)
+parser.add_argument("--directory", default=".benchmark")
+parser.add_argument("--save-baseline", action="store_true")
+parser.add_argument("--tolerance", type=float, default=0.2)
+arguments = parser.parse_args()
+
+env = Environment()
+conf = Configs.EXPLAINABLE_BOOSTING_MACHINE_CONFIG
+
+results = {
+    f"{scale}x": benchmark_pipeline(
+        build_stages=build_stages,
+        config=conf,
+        directory=arguments.directory,
+        scale=scale,
+        stage_name="Training_Employee_History_Stage",
+        n_employees=arguments.n_employees,
+        n_days=arguments.n_days,
+        max_workers=arguments.max_workers,
+    )
+    for scale in arguments.scales
+}
+
+results_dir = os_path.join(arguments.directory, "results")
+if not os_path.exists(results_dir):
+    makedirs(results_dir)
+save_benchmark_results(
+    results,
+    os_path.join(results_dir, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"),
+)
+
+baseline_path = os_path.join(arguments.directory, "baseline.json")
+if arguments.save_baseline:
+    save_benchmark_results(results, baseline_path)
+    print(f"{Fore.cyan}BASELINE: {Style.reset}{baseline_path}")
+    sys_exit(0)
+
+baseline = load_benchmark_results(baseline_path)
+if baseline is None:
+    print(f"{Fore.yellow}WARNING: {Style.reset}no baseline at {baseline_path}")
+    sys_exit(0)
+
+regressions = compare_to_baseline(results, baseline, tolerance=arguments.tolerance)
+for regression in regressions:
+    print(f"{Fore.red}REGRESSION: {Style.reset}{regression}")
+if len(regressions) == 0:
+    print(f"{Fore.green}SUCCESS: {Style.reset}no regression against the baseline")
+sys_exit(1 if len(regressions) > 0 else 0)
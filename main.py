@@ -64,6 +64,9 @@ ingestion_pipeline = (
         environment=env,
         use_caching=True,
         limit_dataframe_size=conf.limit_dataframe_size,
+        max_workers=4,
+        eliminate_dead_columns=True,
+        release_dataframes=True,
         stages=[
             build_client_data_cleaning_calculated_fields_stage(conf, env),
             build_clock_data_cleaning_calculated_fields_stage(conf, env),
@@ -1,53 +1,85 @@
 """
-This module contains the function to create an error table from a dataframe.
+This module contains the class to store the errors of a dataframe.
 """
 
-from typing import Optional
-from pandas import DataFrame, Series, concat
+from hashlib import new
+from typing import Dict, List, Optional, Tuple
+from weakref import ReferenceType, ref
+from numpy import (
+    argpartition,
+    asarray,
+    concatenate,
+    cumsum,
+    empty,
+    flatnonzero,
+    full,
+    inf,
+    ndarray,
+    partition,
+    searchsorted,
+    unique,
+    zeros,
+)
+from numpy.random import default_rng
+from pandas import DataFrame, Series, concat, to_pickle
 from src.data.error.error_id import ErrorId
 from src.utility.configs.config import Config
 
 
-class ErrorDataFrame(DataFrame):
+class ErrorDataFrame:
     """
-    This class is the error dataframe.
+    This class is the append-only store of the errors of a dataframe. Every call to
+    add_errors keeps a chunk of the positions of the error rows in their dataframe, with
+    the error id and the error, and the error dataframe is only built when to_dataframe
+    is called, so adding errors does not copy the errors already added.
+
+    The data of the dataframe of the latest errors is held as is and its error rows are
+    only looked up when the errors of another dataframe are added or when the errors are
+    compacted or pickled, so that the dataframes replaced by the transforms are not held.
+
+    The errors are always counted by error id and error. When the config sets
+    max_error_examples, only that many example rows are kept by error id and error,
+    chosen with reservoir sampling, instead of every row, and only the sampled rows are
+    looked up. The random keys of the sample are drawn from the split seed, the stage
+    name and the stream, so that a run samples the same rows every time.
 
     Args:
-        data: Data to initialize the dataframe's columns with.
-        fill: Fill the dataframe with the data.
-        load_id: The load id.
-        error_id: The error id.
-        error: The error.
-        copy: Copy data from inputs.
-        shallow_copy: Copy data from inputs.
+        data: The dataframe whose columns are the columns of the error dataframe.
+        config: The config holding the load id, the maximum number of examples and the
+            split seed.
+        stage_name: The name of the stage of the errors. Defaults to None.
+        stream: The number of the store among the stores of the chunks or of the
+            partitions of the stage, which are concatenated and must not draw the same
+            random keys. Defaults to 0.
     """
 
     def __init__(
         self,
         data=None,
-        fill=False,
         config: Optional[Config] = None,
-        error_id: Optional[ErrorId] = None,
-        error: Optional[str] = None,
-        shallow_copy=False,
-        copy: Optional[bool] = None,
+        *,
+        stage_name: Optional[str] = None,
+        stream: int = 0,
     ) -> None:
-        assert not (config is None and not shallow_copy)
-        if not shallow_copy:
-            dataframe = DataFrame(data)
-            error_dataframe = DataFrame(
-                columns=dataframe.columns, index=dataframe.index if fill else None
-            )
-            if fill:
-                error_dataframe[dataframe.columns] = dataframe[dataframe.columns]
-            error_dataframe.insert(0, "error", error)
-            error_dataframe.insert(0, "error_id", error_id)
-            error_dataframe.insert(0, "load_id", config.load_id)
-
-        super().__init__(
-            data=error_dataframe if not shallow_copy else data,
-            copy=copy,
+        assert config is not None
+        assert config.max_error_examples is None or config.max_error_examples > 0
+        self.load_id = config.load_id
+        self.columns = list(DataFrame(data).columns)
+        self.max_examples = config.max_error_examples
+        self.counts: Dict[Tuple[str, str], int] = {}
+        # the dataframes of the errors, every one but the latest only holds error rows
+        self.sources: List[DataFrame] = []
+        # the number of the source and the positions of the rows of every chunk
+        self.chunks: List[Tuple[int, ndarray, str, str]] = []
+        # the source numbers, the positions and the random keys of the sampled rows by
+        # error id and error, the rows with the smallest keys are kept
+        self.examples: Dict[Tuple[str, str], Tuple[ndarray, ndarray, ndarray]] = {}
+        self.random_state = default_rng(
+            [config.split_seed, get_name_seed(stage_name or ""), stream]
         )
+        self.__dataframe: Optional[DataFrame] = None
+        # the dataframe of the latest source, which the source is a shallow copy of
+        self.__latest_dataframe: Optional[ReferenceType] = None
 
     def add_errors(
         self,
@@ -56,47 +88,291 @@ class ErrorDataFrame(DataFrame):
         config: Optional[Config],
         error_id: ErrorId,
         error: str,
-    ) -> DataFrame:
+    ) -> "ErrorDataFrame":
         """
         This function adds errors to the error dataframe.
 
         Args:
             dataframe: The dataframe from which the errors ocurred.
             idx: The indexes for the error.
-            load_id: The load id.
+            config: The config.
             error_id: The error id.
             error: The error.
 
         Returns:
             The error dataframe.
         """
+        assert config is None or config.load_id == self.load_id
+        positions = flatnonzero(asarray(idx, dtype=bool))
+        if len(positions) == 0:
+            return self
+        key = (error_id.name, error)
+        self.counts[key] = self.counts.get(key, 0) + len(positions)
+        if (
+            self.__latest_dataframe is None
+            or self.__latest_dataframe() is not dataframe
+        ):
+            self.compact()
+            # the shallow copy shares the data without holding the dataframe, which the
+            # dataframes filtered from it would warn about when they are modified
+            self.sources.append(dataframe.copy(deep=False))
+            self.__latest_dataframe = ref(dataframe)
+        source_number = len(self.sources) - 1
+        if self.max_examples is None:
+            self.chunks.append((source_number, positions, error_id.name, error))
+        else:
+            random_keys = self.random_state.random(len(positions))
+            # only the rows which can enter the sample are kept
+            threshold = self.__get_threshold(key, random_keys)
+            selected = random_keys <= threshold
+            self.__add_examples(
+                key,
+                full(selected.sum(), source_number),
+                positions[selected],
+                random_keys[selected],
+            )
+        self.__dataframe = None
+        return self
 
-        errors = ErrorDataFrame(
-            dataframe.loc[idx],
-            fill=True,
-            config=config,
-            error_id=error_id.name,
-            error=error,
+    @staticmethod
+    def concat(errors: List["ErrorDataFrame"]) -> "ErrorDataFrame":
+        """
+        This function concatenates the errors of several dataframes, the errors of the
+        chunks of a csv file.
+
+        Args:
+            errors: The errors, with the same load id.
+
+        Returns:
+            The error dataframe.
+        """
+        assert len(errors) > 0
+        concatenated = errors[0]
+        for other in errors[1:]:
+            concatenated = concatenated.merge(other)
+        return concatenated
+
+    def merge(self, other: "ErrorDataFrame") -> "ErrorDataFrame":
+        """
+        This function adds the errors of another store to the errors, the errors of
+        another chunk of the same dataframe.
+
+        Args:
+            other: The errors to add, with the same load id.
+
+        Returns:
+            The error dataframe.
+        """
+        assert other.load_id == self.load_id
+        for key, error_count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + error_count
+        self.compact()
+        offset = len(self.sources)
+        self.sources.extend(other.sources)
+        self.chunks.extend(
+            (source_number + offset, positions, error_id, error)
+            for source_number, positions, error_id, error in other.chunks
         )
+        for key, (source_numbers, positions, random_keys) in other.examples.items():
+            self.__add_examples(key, source_numbers + offset, positions, random_keys)
+        self.__dataframe = None
+        return self
+
+    def compact(self) -> "ErrorDataFrame":
+        """
+        This function looks up the error rows of the dataframe of the latest errors, so
+        that the errors do not hold this dataframe anymore. The dataframes whose sampled
+        rows were all replaced are dropped.
+
+        Returns:
+            The error dataframe.
+        """
+        self.__drop_replaced_sources()
+        self.__latest_dataframe = None
+        latest = len(self.sources) - 1
+        if latest < 0:
+            return self
+        # the chunks of the latest source are the last chunks
+        first_chunk = len(self.chunks)
+        while first_chunk > 0 and self.chunks[first_chunk - 1][0] == latest:
+            first_chunk -= 1
+        used_positions = [
+            positions for _, positions, _, _ in self.chunks[first_chunk:]
+        ] + [
+            positions[source_numbers == latest]
+            for source_numbers, positions, _ in self.examples.values()
+        ]
+        kept_positions = unique(concatenate(used_positions or [empty(0, int)]))
+        self.sources[latest] = self.sources[latest].iloc[kept_positions]
+        for index in range(first_chunk, len(self.chunks)):
+            source_number, positions, error_id, error = self.chunks[index]
+            self.chunks[index] = (
+                source_number,
+                searchsorted(kept_positions, positions),
+                error_id,
+                error,
+            )
+        for key, (source_numbers, positions, random_keys) in self.examples.items():
+            selected = source_numbers == latest
+            if selected.any():
+                positions = positions.copy()
+                positions[selected] = searchsorted(kept_positions, positions[selected])
+                self.examples[key] = (source_numbers, positions, random_keys)
+        return self
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        This function builds the error dataframe, with the load id, the error id and the
+        error of every row followed by its columns. The dataframe is built once until
+        errors are added.
+
+        Returns:
+            The error dataframe.
+        """
+        if self.__dataframe is not None:
+            return self.__dataframe
+        dataframes = [
+            DataFrame(columns=["load_id", "error_id", "error", *self.columns])
+        ]
+        example_chunks = [
+            (source_number, source_positions, error_id, error)
+            for (error_id, error), (
+                source_numbers,
+                positions,
+                _,
+            ) in self.examples.items()
+            for source_number, source_positions in get_positions_by_source(
+                source_numbers, positions
+            )
+        ]
+        for source_number, positions, error_id, error in self.chunks + example_chunks:
+            dataframe = self.sources[source_number].iloc[positions]
+            dataframe.insert(0, "error", error)
+            dataframe.insert(0, "error_id", error_id)
+            dataframe.insert(0, "load_id", self.load_id)
+            dataframes.append(dataframe)
+        self.__dataframe = concat(dataframes, axis="rows", ignore_index=True)
+        return self.__dataframe
+
+    def get_counts(self) -> DataFrame:
+        """
+        This function counts the errors by error id and error without building the
+        error dataframe.
 
-        if len(self) == 0:
-            return errors
-
-        errors = ErrorDataFrame(
-            concat(
-                [
-                    self,
-                    errors,
-                ],
-                axis="rows",
-                ignore_index=True,
-            ),
-            shallow_copy=True,
+        Returns:
+            The error_id, error and count of every error.
+        """
+        return DataFrame(
+            [
+                [error_id, error, count]
+                for (error_id, error), count in self.counts.items()
+            ],
+            columns=["error_id", "error", "count"],
         )
-        return errors
 
-    @property
-    def _constructor_expanddim(
+    def to_pickle(self, path: str) -> None:
+        """
+        This function pickles the errors, to be cached as a dataframe.
+
+        Args:
+            path: The path of the pickle file.
+        """
+        to_pickle(self, path)
+
+    def __get_threshold(self, key: Tuple[str, str], random_keys) -> float:
+        """
+        Get the largest random key which is kept in the sample of the error.
+        """
+        _, _, kept_keys = self.examples.get(key, (None, None, empty(0)))
+        all_keys = concatenate([kept_keys, random_keys])
+        if len(all_keys) <= self.max_examples:
+            return inf
+        return partition(all_keys, self.max_examples - 1)[self.max_examples - 1]
+
+    def __add_examples(
         self,
-    ):
-        return ErrorDataFrame
+        key: Tuple[str, str],
+        source_numbers: ndarray,
+        positions: ndarray,
+        random_keys: ndarray,
+    ) -> None:
+        """
+        Add the rows to the sample of the error and keep the max_examples rows with the
+        smallest random keys.
+        """
+        if key in self.examples:
+            kept_sources, kept_positions, kept_keys = self.examples[key]
+            source_numbers = concatenate([kept_sources, source_numbers])
+            positions = concatenate([kept_positions, positions])
+            random_keys = concatenate([kept_keys, random_keys])
+        if len(random_keys) > self.max_examples:
+            kept = argpartition(random_keys, self.max_examples - 1)[: self.max_examples]
+            kept.sort()
+            source_numbers, positions, random_keys = (
+                source_numbers[kept],
+                positions[kept],
+                random_keys[kept],
+            )
+        self.examples[key] = (source_numbers, positions, random_keys)
+
+    def __drop_replaced_sources(self) -> None:
+        """
+        Drop the sources whose sampled rows were all replaced by rows of other sources.
+        """
+        if self.max_examples is None:
+            return
+        used = zeros(len(self.sources), dtype=bool)
+        for source_numbers, _, _ in self.examples.values():
+            used[source_numbers] = True
+        kept_source_numbers = cumsum(used) - 1
+        self.sources = [
+            source for source, is_used in zip(self.sources, used) if is_used
+        ]
+        self.examples = {
+            key: (kept_source_numbers[source_numbers], positions, random_keys)
+            for key, (source_numbers, positions, random_keys) in self.examples.items()
+        }
+
+    def __getstate__(self) -> dict:
+        # only the error rows of the dataframes are pickled and the built dataframe is
+        # not pickled, it is built again on demand
+        self.compact()
+        state = dict(self.__dict__)
+        state["_ErrorDataFrame__dataframe"] = None
+        return state
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+
+def get_positions_by_source(
+    source_numbers: ndarray, positions: ndarray
+) -> List[Tuple[int, ndarray]]:
+    """
+    This function groups the positions of sampled rows by the number of their source.
+
+    Args:
+        source_numbers: The source number of every row.
+        positions: The position of every row in its source.
+
+    Returns:
+        The source number and the positions of the rows of every source.
+    """
+    return [
+        (source_number, positions[source_numbers == source_number])
+        for source_number in unique(source_numbers)
+    ]
+
+
+def get_name_seed(name: str) -> int:
+    """
+    This function derives a seed from a name which, unlike hash, does not change
+    between the processes.
+
+    Args:
+        name: The name.
+
+    Returns:
+        The seed.
+    """
+    return int(new("sha256", name.encode()).hexdigest()[:15], 16)
@@ -0,0 +1,165 @@
+"""
+This module is used to benchmark the ingestion pipeline on synthetic data at several
+scales and to flag the regressions against a baseline.
+"""
+
+from json import dump, load
+from os import path
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+from src.data.ingestion_pipeline.ingestion_pipeline import IngestionPipeline
+from src.data.ingestion_pipeline.ingestion_pipeline_stage import IngestionPipelineStage
+from src.data.synthetic_data import generate_synthetic_data
+from src.utility.configs.config import Config
+from src.utility.environment import Environment
+
+SCALES = [1, 10, 100]
+
+
+def benchmark_pipeline(
+    *,
+    build_stages: Callable[[Config, Environment], List[IngestionPipelineStage]],
+    config: Config,
+    directory: str,
+    scale: int = 1,
+    stage_name: Optional[str] = None,
+    n_employees: int = 50,
+    n_days: int = 365,
+    max_workers: int = 1,
+    seed: int = 0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    This function is used to time the pipeline, every stage and every transform on
+    synthetic data. The data of a scale is generated once and reused by the next runs,
+    the stages are always computed, without the cache.
+
+    Args:
+        build_stages (Callable[[Config, Environment], List[IngestionPipelineStage]]):
+            The function building the stages of the pipeline from the environment whose
+            data directory holds the synthetic data
+        config (Config): The config
+        directory (str): The directory of the synthetic data and of the profile reports
+        scale (int): The multiplier of the number of employees. Defaults to 1.
+        stage_name (Optional[str]): The stage to produce. Defaults to None which runs
+            every stage.
+        n_employees (int): The number of employees at scale 1. Defaults to 50.
+        n_days (int): The number of days of visits. Defaults to 365.
+        max_workers (int): The number of processes of the pipeline. Defaults to 1.
+        seed (int): The seed of the synthetic data. Defaults to 0.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The durations in seconds of the "pipeline", of the
+            "stages" by stage name and of the "transforms" by stage and transform name.
+    """
+    assert scale > 0
+    scale_directory = path.join(
+        directory, f"{n_employees * scale}_employees_{n_days}_days_{seed}"
+    )
+    environment = Environment()
+    environment.data_dir = path.join(scale_directory, "data")
+    environment.cache_dir = path.join(scale_directory, "cache")
+    if not path.exists(path.join(environment.data_dir, "visit_data.csv")):
+        generate_synthetic_data(
+            environment.data_dir,
+            n_employees=n_employees * scale,
+            n_days=n_days,
+            seed=seed,
+        )
+
+    pipeline = IngestionPipeline(
+        config=config,
+        environment=environment,
+        stages=build_stages(config, environment),
+        max_workers=max_workers,
+        profile=True,
+    ).build_pipeline()
+    start_time = perf_counter()
+    pipeline.run_pipeline(stage_name=stage_name)
+    duration = perf_counter() - start_time
+
+    transforms_durations: Dict[str, float] = {}
+    for record in pipeline.profile_records:
+        # the transforms used several times in a stage are summed
+        name = f"{record['stage']}/{record['step']}"
+        transforms_durations[name] = (
+            transforms_durations.get(name, 0.0) + record["wall_time"]
+        )
+    return {
+        "pipeline": {"pipeline": duration},
+        "stages": dict(pipeline.stage_durations),
+        "transforms": transforms_durations,
+    }
+
+
+def compare_to_baseline(
+    results: Dict[str, Dict[str, Dict[str, float]]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    *,
+    tolerance: float = 0.2,
+    min_duration: float = 0.5,
+) -> List[str]:
+    """
+    This function is used to find the durations that regressed against the baseline.
+    A duration regresses when it is more than tolerance slower than the baseline and
+    slower by more than min_duration seconds, so that the noise of the short steps is
+    not flagged.
+
+    Args:
+        results (Dict[str, Dict[str, Dict[str, float]]]): The benchmark results by scale
+        baseline (Dict[str, Dict[str, Dict[str, float]]]): The baseline results by scale
+        tolerance (float): The relative slowdown allowed. Defaults to 0.2.
+        min_duration (float): The absolute slowdown allowed in seconds. Defaults to 0.5.
+
+    Returns:
+        List[str]: The description of every regression.
+    """
+    regressions = []
+    for scale, scale_results in results.items():
+        for kind, durations in scale_results.items():
+            baseline_durations = baseline.get(scale, {}).get(kind, {})
+            for name, duration in durations.items():
+                if name not in baseline_durations:
+                    continue
+                baseline_duration = baseline_durations[name]
+                if (
+                    duration > baseline_duration * (1 + tolerance)
+                    and duration - baseline_duration > min_duration
+                ):
+                    regressions.append(
+                        f"{scale} {kind} {name}: {baseline_duration:.2f}s"
+                        + f" -> {duration:.2f}s"
+                    )
+    return regressions
+
+
+def save_benchmark_results(
+    results: Dict[str, Dict[str, Dict[str, float]]], file_path: str
+) -> None:
+    """
+    This function is used to save the benchmark results as JSON
+
+    Args:
+        results (Dict[str, Dict[str, Dict[str, float]]]): The benchmark results by scale
+        file_path (str): The path of the JSON file
+    """
+    with open(file_path, "w", encoding="utf-8") as file:
+        dump(results, file, indent=4, sort_keys=True)
+
+
+def load_benchmark_results(
+    file_path: str,
+) -> Optional[Dict[str, Dict[str, Dict[str, float]]]]:
+    """
+    This function is used to load the benchmark results saved as JSON
+
+    Args:
+        file_path (str): The path of the JSON file
+
+    Returns:
+        Optional[Dict[str, Dict[str, Dict[str, float]]]]: The benchmark results by scale
+            or None if the file does not exist
+    """
+    if not path.exists(file_path):
+        return None
+    with open(file_path, "r", encoding="utf-8") as file:
+        return load(file)
@@ -0,0 +1,386 @@
+"""
+The incremental ingestion pipeline module.
+"""
+from hashlib import new
+from json import dump, load
+from os import makedirs, path
+from typing import Dict, List, Optional
+from pandas import DataFrame, Series, Timedelta, Timestamp, concat, to_datetime
+from src.data.error.error_dataframe import ErrorDataFrame
+from src.data.ingestion_pipeline.ingestion_pipeline import IngestionPipeline
+from src.data.ingestion_pipeline.ingestion_pipeline_stage import IngestionPipelineStage
+from src.data.read_schema_csv import read_schema_csv
+from src.data.schema.employee_history_schema import EmployeeHistorySchema
+from src.data.transforms.clean.keep_rows_from import KeepRowsFrom
+
+KEY_COLUMNS = [
+    EmployeeHistorySchema.EMPLOYEE_ID.name,
+    EmployeeHistorySchema.PERIOD_START.name,
+]
+
+
+class IncrementalIngestionPipeline(IngestionPipeline):
+    """
+    An ingestion pipeline that can refresh its cached outputs with the rows that arrived
+    after a watermark instead of running the whole history again.
+
+    The root stages with a watermark column only read the rows of the employees with new
+    rows, from their first new day minus the sum of the lookbacks, which is the history
+    that the last incremental stage needs for the keys of that day. The stages with an
+    incremental lookback are computed on these rows and their keys from the first new day
+    replace the same keys of their previous output. The stages after them are then run on
+    the merged outputs without caching. The merged outputs are cached under incremental
+    keys, made of the hashes of the stages and the watermark, that run_pipeline never
+    reads, since they were not computed from the whole history.
+
+    When a stage computed on the new rows has a transform which needs the whole history
+    of an employee, such as the first visit date, the whole history is run instead.
+
+    Args:
+        See IngestionPipeline. The pipeline must use caching.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        assert self.use_caching
+
+    def run_incremental(
+        self, stage_name: str, watermark: Optional[Timestamp] = None
+    ) -> "IncrementalIngestionPipeline":
+        """
+        Run the pipeline on the rows after the watermark and merge them into the previous
+        outputs. The whole history is run when there is no previous output.
+
+        Args:
+            stage_name (str): The stage name to run.
+            watermark (Optional[Timestamp]): The date after which the rows are new.
+                Defaults to None which uses the watermark of the previous run.
+        """
+        ordered_stages_names = self.get_ordered_stages_names([stage_name])
+        root_stages = [
+            self.stages[name]
+            for name in ordered_stages_names
+            if self.stages[name].watermark_column is not None
+        ]
+        incremental_stages = [
+            self.stages[name]
+            for name in ordered_stages_names
+            if self.stages[name].incremental_lookback is not None
+        ]
+        if self.eliminate_dead_columns:
+            self.plan_columns([stage_name])
+
+        state = self.load_incremental_state(stage_name)
+        if watermark is None and state is not None:
+            watermark = Timestamp(state["watermark"])
+        previous_dataframes = self.__load_previous_dataframes(incremental_stages, state)
+        watermark_dataframes = [read_watermark_column(stage) for stage in root_stages]
+        new_watermark = max(
+            (
+                dataframe["date"].max()
+                for dataframe in watermark_dataframes
+                if dataframe["date"].notna().any()
+            ),
+            default=watermark,
+        )
+        if (
+            watermark is None
+            or previous_dataframes is None
+            or self.__needs_whole_history(incremental_stages)
+        ):
+            self.run_pipeline(stage_name=stage_name)
+            self.save_incremental_state(stage_name, new_watermark)
+            return self
+
+        start_dates = get_new_rows_start_dates(watermark_dataframes, watermark)
+        if len(start_dates) > 0:
+            lookback = sum(
+                (stage.incremental_lookback for stage in incremental_stages),
+                Timedelta(0),
+            )
+            self.__run_new_rows(
+                root_stages=root_stages,
+                incremental_stages=incremental_stages,
+                ordered_stages_names=ordered_stages_names,
+                previous_dataframes=previous_dataframes,
+                refresh_start_dates=start_dates,
+                lookback=lookback,
+            )
+        else:
+            for stage in incremental_stages:
+                stage.dataframe = previous_dataframes[stage.name]
+                stage.errors = ErrorDataFrame(
+                    stage.dataframe, config=self.config, stage_name=stage.name
+                )
+                self.completed_stages[stage.name] = stage
+        use_caching = self.use_caching
+        try:
+            # the outputs after the incremental stages are not computed from the whole
+            # history either
+            self.use_caching = False
+            self.run_pipeline(stage_name=stage_name)
+        finally:
+            self.use_caching = use_caching
+        incremental_keys = {
+            stage.name: get_incremental_key(hash(stage), new_watermark)
+            for stage in incremental_stages
+        }
+        for stage in incremental_stages:
+            self.cache.add(
+                key=incremental_keys[stage.name],
+                value=stage.dataframe,
+                sub_directory=f"{stage.name}/dataframe",
+                cache_format=stage.cache_format,
+                compression=stage.cache_compression,
+            )
+        # the next runs compute the stages again instead of using the merged outputs
+        for name in ordered_stages_names:
+            self.completed_stages.pop(name, None)
+        self.save_incremental_state(stage_name, new_watermark, incremental_keys)
+        return self
+
+    def __needs_whole_history(
+        self, incremental_stages: List[IngestionPipelineStage]
+    ) -> bool:
+        """
+        Whether one of the stages computed on the new rows has a transform which needs the
+        whole history of the employees.
+        """
+        for name in self.get_ordered_stages_names(
+            [stage.name for stage in incremental_stages]
+        ):
+            for transform in self.stages[name].planned_transforms:
+                if transform.needs_whole_history:
+                    print(
+                        f"{name} runs {transform.__class__.__name__} which needs the"
+                        + " whole history, the whole history is run."
+                    )
+                    return True
+        return False
+
+    def __run_new_rows(
+        self,
+        *,
+        root_stages: List[IngestionPipelineStage],
+        incremental_stages: List[IngestionPipelineStage],
+        ordered_stages_names: List[str],
+        previous_dataframes: Dict[str, DataFrame],
+        refresh_start_dates: Series,
+        lookback: Timedelta,
+    ) -> None:
+        """
+        Run the incremental stages on the rows of the recomputed keys without caching
+        and merge them into the previous outputs.
+        """
+        for stage in root_stages:
+            stage.incremental_filter = KeepRowsFrom(
+                key_column=EmployeeHistorySchema.EMPLOYEE_ID.name,
+                date_column=stage.watermark_column.name,
+                start_dates=refresh_start_dates - lookback,
+            )
+        for stage_name in ordered_stages_names:
+            self.completed_stages.pop(stage_name, None)
+        use_caching = self.use_caching
+        eliminate_dead_columns = self.eliminate_dead_columns
+        try:
+            # the columns are already planned from the requested stage
+            self.use_caching = False
+            self.eliminate_dead_columns = False
+            self.run_pipeline(stage_name=[stage.name for stage in incremental_stages])
+        finally:
+            self.use_caching = use_caching
+            self.eliminate_dead_columns = eliminate_dead_columns
+            for stage in root_stages:
+                stage.incremental_filter = None
+
+        for stage in incremental_stages:
+            stage.dataframe = merge_refreshed_rows(
+                previous_dataframes[stage.name],
+                stage.dataframe,
+                refresh_start_dates,
+            )
+        # the other stages only hold the rows of the recomputed keys
+        incremental_stages_names = [stage.name for stage in incremental_stages]
+        for stage_name in ordered_stages_names:
+            if stage_name not in incremental_stages_names:
+                self.completed_stages.pop(stage_name, None)
+                self.stages[stage_name].dataframe = None
+
+    def __load_previous_dataframes(
+        self, incremental_stages: List[IngestionPipelineStage], state: Optional[dict]
+    ) -> Optional[Dict[str, DataFrame]]:
+        """
+        Load the outputs of the incremental stages of the previous run from the cache.
+        None when there is no previous run or one of its outputs is not cached anymore.
+        """
+        if state is None or len(incremental_stages) == 0:
+            return None
+        previous_dataframes = {}
+        for stage in incremental_stages:
+            key = state["keys"].get(stage.name, state["hashes"].get(stage.name))
+            if key is None or not self.cache.has(
+                key=key, sub_directory=f"{stage.name}/dataframe"
+            ):
+                return None
+            # the previous run may have kept columns that are not planned anymore
+            previous_dataframes[stage.name] = self.cache.get(
+                key=key,
+                sub_directory=f"{stage.name}/dataframe",
+                columns=stage.output_columns,
+            )
+        return previous_dataframes
+
+    def get_incremental_state_path(self, stage_name: str) -> str:
+        """
+        Get the path of the state of the last run of the stage.
+
+        Args:
+            stage_name (str): The stage name.
+
+        Returns:
+            str: The path of the JSON state.
+        """
+        return path.join(self.cache.cache_dir, "incremental", f"{stage_name}.json")
+
+    def load_incremental_state(self, stage_name: str) -> Optional[dict]:
+        """
+        Load the watermark and the hashes of the stages of the last run of the stage.
+
+        Args:
+            stage_name (str): The stage name.
+
+        Returns:
+            Optional[dict]: The state or None if the stage was never run.
+        """
+        state_path = self.get_incremental_state_path(stage_name)
+        if not path.exists(state_path):
+            return None
+        with open(state_path, "r", encoding="utf-8") as file:
+            return load(file)
+
+    def save_incremental_state(
+        self,
+        stage_name: str,
+        watermark: Optional[Timestamp],
+        keys: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Save the watermark, the hashes of the stages of the run of the stage and the keys
+        of the outputs of the incremental stages.
+
+        Args:
+            stage_name (str): The stage name.
+            watermark (Optional[Timestamp]): The date of the newest row.
+            keys (Optional[Dict[str, int]]): The incremental keys of the merged outputs
+                by stage name. Defaults to None when the outputs are cached under the
+                hashes of the stages.
+        """
+        if watermark is None:
+            return
+        state_path = self.get_incremental_state_path(stage_name)
+        if not path.exists(path.dirname(state_path)):
+            makedirs(path.dirname(state_path))
+        with open(state_path, "w", encoding="utf-8") as file:
+            dump(
+                {
+                    "watermark": watermark.isoformat(),
+                    "hashes": {
+                        name: hash(self.stages[name])
+                        for name in self.get_ordered_stages_names([stage_name])
+                    },
+                    "keys": keys or {},
+                },
+                file,
+                indent=4,
+            )
+
+
+def get_incremental_key(stage_hash: int, watermark: Timestamp) -> int:
+    """
+    Get the key of the merged output of an incremental stage, which differs from the hash
+    of the stage so that the runs over the whole history never read it.
+
+    Args:
+        stage_hash (int): The hash of the stage.
+        watermark (Timestamp): The date of the newest row of the output.
+
+    Returns:
+        int: The key.
+    """
+    hasher = new("sha256")
+    hasher.update(f"incremental:{stage_hash}:{watermark.isoformat()}".encode())
+    return int(hasher.hexdigest()[:15], 16)
+
+
+def read_watermark_column(stage: IngestionPipelineStage) -> DataFrame:
+    """
+    Read the employee id and the watermark column of the csv of a root stage.
+
+    Args:
+        stage (IngestionPipelineStage): The root stage.
+
+    Returns:
+        DataFrame: The "employee_id" and the "date" of every row.
+    """
+    dataframe = read_schema_csv(
+        stage.load_dataframe_csv_path,
+        schema=stage.from_schema,
+        columns=[EmployeeHistorySchema.EMPLOYEE_ID.name, stage.watermark_column.name],
+    )
+    return DataFrame(
+        {
+            "employee_id": dataframe[EmployeeHistorySchema.EMPLOYEE_ID.name],
+            "date": to_datetime(
+                dataframe[stage.watermark_column.name], errors="coerce"
+            ),
+        }
+    )
+
+
+def get_new_rows_start_dates(
+    watermark_dataframes: List[DataFrame], watermark: Timestamp
+) -> Series:
+    """
+    Get the day of the first row after the watermark of every employee with new rows.
+
+    Args:
+        watermark_dataframes (List[DataFrame]): The watermark columns of the root stages.
+        watermark (Timestamp): The watermark.
+
+    Returns:
+        Series: The start date by employee id.
+    """
+    new_rows = concat(
+        [dataframe[dataframe["date"] > watermark] for dataframe in watermark_dataframes]
+        + [DataFrame({"employee_id": [], "date": to_datetime([])})]
+    )
+    return new_rows.groupby("employee_id")["date"].min().dt.floor("D")
+
+
+def merge_refreshed_rows(
+    previous: DataFrame, refreshed: DataFrame, refresh_start_dates: Series
+) -> DataFrame:
+    """
+    Replace the rows of the previous output whose keys were recomputed by the rows of the
+    refreshed output. The keys of an employee are recomputed from its start date.
+
+    Args:
+        previous (DataFrame): The previous output.
+        refreshed (DataFrame): The output of the recomputed rows.
+        refresh_start_dates (Series): The start date by employee id.
+
+    Returns:
+        DataFrame: The merged output sorted by EMPLOYEE_ID and PERIOD_START.
+    """
+
+    def get_recomputed(dataframe: DataFrame) -> Series:
+        start_dates = dataframe[KEY_COLUMNS[0]].map(refresh_start_dates)
+        return (to_datetime(dataframe[KEY_COLUMNS[1]]) >= start_dates).to_numpy()
+
+    merged = concat(
+        [
+            previous[~get_recomputed(previous)],
+            refreshed[get_recomputed(refreshed)],
+        ]
+    )
+    return merged.sort_values(by=KEY_COLUMNS, kind="mergesort").reset_index(drop=True)
@@ -1,14 +1,41 @@
 """
 The ingestion pipeline module.
 """
-from typing import Dict, List, Optional
-from pandas import DataFrame, pivot_table
+from collections import deque
+from collections.abc import Mapping
+from copy import copy
+from datetime import datetime
+from os import path
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from time import perf_counter
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple, Union
+from colored import Fore, Style
+from pandas import DataFrame, concat
 from tqdm.autonotebook import tqdm
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
 from src.utility.dataframe_cache import DataFrameCache
-from src.data.ingestion_pipeline.ingestion_pipeline_stage import IngestionPipelineStage
+from src.utility.profiler import (
+    Profiler,
+    get_flame_summary,
+    write_profile_report,
+)
+from src.data.ingestion_pipeline.ingestion_pipeline_plan import (
+    IngestionPipelinePlan,
+    StagePlan,
+    get_estimated_input_size,
+    get_invalidation_reason,
+    get_parent_hashes,
+    get_stage_hash,
+    load_stage_record,
+    save_stage_record,
+)
+from src.data.ingestion_pipeline.ingestion_pipeline_stage import (
+    IngestionPipelineStage,
+    merge_columns,
+)
 from src.data.error.error_dataframe import ErrorDataFrame
+from src.data.process_dataframe import process_dataframe
 
 
 class IngestionPipeline:
@@ -22,6 +49,30 @@ class IngestionPipeline:
         stages (List[IngestionPipelineStage], optional): The stages. Defaults to None.
         force_stage_calculation_and_not_use_cache_stage_name (Optional[str], optional):
             The stage name to force calculation and not use cache. Defaults to None.
+        limit_dataframe_size (Optional[int], optional): The limit of the dataframes size.
+            Defaults to None.
+        max_workers (int, optional): The number of processes used to run the stages that
+            are ready at the same time. 1 runs every stage in the current process.
+            Defaults to 1.
+        cache_max_size (Optional[int], optional): The budget of the cache in bytes, the
+            least recently used entries that this pipeline does not produce are evicted.
+            Defaults to None.
+        eliminate_dead_columns (bool, optional): Whether to plan the columns of the
+            stages from the requested stages before running them. The columns that no
+            later stage reads are dropped at the end of each stage and the transforms
+            that only write such columns are skipped. Defaults to False.
+        profile (bool, optional): Whether to profile the loading and the transforms of
+            the stages. A JSON report, a CSV report and a flame style summary of every
+            run are written to the profiles directory of the cache. Defaults to False.
+        trace_allocations (bool, optional): Whether the profiler also records the lines
+            that allocate the most with tracemalloc. Defaults to False.
+        release_dataframes (bool, optional): Whether to drop the dataframe of a stage
+            once all of its children stages of the run are completed, unless the stage
+            is requested. A released dataframe is reloaded when it is read through
+            dataframes, from the cache or by running the stage again. Defaults to False.
+        spill_released_dataframes (bool, optional): Whether to add the released
+            dataframes to the cache, even when the pipeline does not use caching, so
+            that they are reloaded instead of run again. Defaults to False.
     """
 
     def __init__(
@@ -33,24 +84,72 @@ class IngestionPipeline:
         stages: List[IngestionPipelineStage] = None,
         force_stage_calculation_and_not_use_cache_stage_name: Optional[str] = None,
         limit_dataframe_size: Optional[int] = None,
+        max_workers: int = 1,
+        cache_max_size: Optional[int] = None,
+        eliminate_dead_columns: bool = False,
+        profile: bool = False,
+        trace_allocations: bool = False,
+        release_dataframes: bool = False,
+        spill_released_dataframes: bool = False,
     ) -> None:
+        assert max_workers >= 1
         self.environment = environment
         self.config = config
         self.use_caching = use_caching
         self.stages = {stage.name: stage for stage in stages}
         self.completed_stages = {}
-        self.cache = DataFrameCache(environment=environment)
+        self.cache = DataFrameCache(environment=environment, max_size=cache_max_size)
         self.force_stage_calculation_and_not_use_cache_stage_name = (
             force_stage_calculation_and_not_use_cache_stage_name
         )
         self.limit_dataframe_size = limit_dataframe_size
+        self.max_workers = max_workers
+        self.eliminate_dead_columns = eliminate_dead_columns
+        self.profile = profile
+        self.trace_allocations = trace_allocations
+        self.profile_records: List[dict] = []
+        self.stage_durations: Dict[str, float] = {}
+        self.release_dataframes = release_dataframes
+        self.spill_released_dataframes = spill_released_dataframes
+        self.released_stages_names: Set[str] = set()
+        # the hashes of the stages during a run, computed once by the plan
+        self.__stage_hashes: Dict[str, int] = {}
+        # the completed stages that the column plan being planned would run again
+        self.__stale_stages_names: Set[str] = set()
 
     @property
-    def dataframes(self) -> Dict[str, DataFrame]:
+    def dataframes(self) -> "StageDataFrames":
         """
-        Get the dataframes.
+        Get the dataframes. The released dataframes are reloaded when they are read.
         """
-        return {stage.name: stage.dataframe for stage in self.stages.values()}
+        return StageDataFrames(self)
+
+    def get_dataframe(self, stage_name: str) -> Optional[DataFrame]:
+        """
+        Get the dataframe of a stage. A released dataframe is read from the cache when it
+        was spilled or cached, otherwise the stage is run again.
+
+        Args:
+            stage_name (str): The stage name.
+
+        Returns:
+            Optional[DataFrame]: The dataframe, None if the stage was never run.
+        """
+        stage = self.stages[stage_name]
+        if stage_name not in self.released_stages_names:
+            return stage.dataframe
+        self.released_stages_names.remove(stage_name)
+        key = hash(stage)
+        if self.cache.has(key=key, sub_directory=f"{stage_name}/dataframe"):
+            stage.dataframe = self.cache.get(
+                key=key,
+                sub_directory=f"{stage_name}/dataframe",
+                columns=stage.output_columns,
+            )
+            self.completed_stages[stage_name] = stage
+        else:
+            self.run_pipeline(stage_name=stage_name)
+        return stage.dataframe
 
     def build_pipeline(self) -> "IngestionPipeline":
         """
@@ -61,114 +160,775 @@ class IngestionPipeline:
                 [self.stages[stage_name] for stage_name in stage.required_stages_names]
             )
             for parent_stage in stage.required_stages:
-                parent_stage.children_stages.append(stage)
+                parent_stage.add_child_node(stage)
         return self
 
-    def run_pipeline(self, stage_name: Optional[str] = None) -> "IngestionPipeline":
+    def run_pipeline(
+        self, stage_name: Optional[Union[str, List[str]]] = None
+    ) -> "IngestionPipeline":
         """
         Run the pipeline. or read from cache if stage is cached.
+        Only the stages required to produce the requested stages are run.
 
         Args:
-            stage_name (str): stage name to run only.
+            stage_name (Optional[Union[str, List[str]]]): stage name or stage names to run.
+                Defaults to None which runs every stage.
         """
+        stages_names = self.__get_stages_names(stage_name)
+        self.profile_records = []
+        if self.eliminate_dead_columns:
+            self.plan_columns(stages_names)
+        plan = self.plan(stages_names, verbose=False)
+        stages_to_run_names = set(plan.stages_to_run_names)
+        required_stages = {
+            stage_name: stage
+            for stage_name, stage in self.stages.items()
+            if stage_name in stages_to_run_names
+        }
+        self.__stage_hashes = plan.hashes
+        # the entries of the run are only pinned during the run, the entries of the
+        # previous hashes of the stages can be evicted again
+        pinned_keys = (
+            {
+                key
+                for key in self.__get_stages_keys()[1]
+                if str(key) not in self.cache.pinned_keys
+            }
+            if self.use_caching
+            else set()
+        )
+        try:
+            self.cache.pin(pinned_keys)
+            with tqdm(
+                total=len(required_stages),
+                desc="Running pipeline",
+                position=0,
+                leave=True,
+            ) as progress_bar:
+                self.__schedule_stages(
+                    stages=required_stages,
+                    output_stages_names=set(stages_names),
+                    progress_bar=progress_bar,
+                )
+        finally:
+            self.cache.unpin(pinned_keys)
+            self.__stage_hashes = {}
 
-        with tqdm(
-            total=len(self.stages),
-            desc="Running pipeline",
-            position=0,
-            leave=True,
-        ) as progress_bar:
-            if (
-                self.use_caching
-                and stage_name is not None
-                and self.cache.has(
-                    key=hash(self.stages[stage_name]),
-                    sub_directory=f"{self.stages[stage_name].name}/dataframe",
+        self.__print_critical_path()
+        if self.profile:
+            self.__write_profile_report()
+        return self
+
+    def plan(
+        self,
+        stage_name: Optional[Union[str, List[str]]] = None,
+        verbose: bool = True,
+    ) -> IngestionPipelinePlan:
+        """
+        Plan a run of the pipeline without running it. Every stage is hashed once, the
+        stages required to produce the requested stages are resolved and each of them is
+        planned as completed, read from the cache or computed, with the estimated size
+        of its inputs and the reason why it is computed. The pipeline is not modified,
+        the column plan of the run is only applied to copies of the stages.
+
+        Args:
+            stage_name (Optional[Union[str, List[str]]]): stage name or stage names to plan.
+                Defaults to None which plans every stage.
+            verbose (bool): Whether to print the plan. Defaults to True.
+
+        Returns:
+            IngestionPipelinePlan: The plan.
+        """
+        stages_names = self.__get_stages_names(stage_name)
+        planned_stages = (
+            self.__get_planned_stages(self.get_column_plan(stages_names))
+            if self.eliminate_dead_columns
+            else self.stages
+        )
+        self.__stage_hashes = self.get_stage_hashes(planned_stages)
+        hashes = self.get_stage_hashes() if self.eliminate_dead_columns else {}
+        self.__stale_stages_names = {
+            completed_stage_name
+            for completed_stage_name in self.completed_stages
+            if completed_stage_name in hashes
+            and hashes[completed_stage_name]
+            != self.__stage_hashes[completed_stage_name]
+        }
+        try:
+            required_stages = self.get_required_stages(stages_names)
+            planned_stages_names = set(required_stages) | {
+                requested_stage_name
+                for requested_stage_name in stages_names
+                if self.__is_completed(requested_stage_name)
+            }
+            for stage in required_stages.values():
+                planned_stages_names.update(
+                    parent_stage.name
+                    for parent_stage in stage.required_stages
+                    if self.__is_completed(parent_stage.name)
                 )
-            ):
-                self.__run_stage(
-                    stage=self.stages[stage_name], progress_bar=progress_bar
+            output_sizes: Dict[str, Optional[int]] = {}
+            stages_plans = []
+            for ordered_stage_name in self.get_ordered_stages_names(stages_names):
+                if ordered_stage_name not in planned_stages_names:
+                    continue
+                stage_plan = self.__plan_stage(
+                    planned_stages[ordered_stage_name], output_sizes
                 )
-                progress_bar.update(len(self.stages) - 1)
-                return self
-            roots = [
-                stage
-                for stage in self.stages.values()
-                if len(stage.required_stages) == 0
-            ]
+                output_sizes[ordered_stage_name] = stage_plan.estimated_input_size
+                stages_plans.append(stage_plan)
+            plan = IngestionPipelinePlan(
+                stages=stages_plans, hashes=self.__stage_hashes
+            )
+        finally:
+            self.__stage_hashes = {}
+            self.__stale_stages_names = set()
+        if verbose:
+            print(plan, end="")
+        return plan
 
-            for root in roots:
-                self.__run_stage(stage=root, progress_bar=progress_bar)
-            next_stage = self.__find_next_stage_to_execute()
-            while next_stage is not None:
-                self.__run_stage(stage=next_stage, progress_bar=progress_bar)
-                next_stage = self.__find_next_stage_to_execute()
+    def get_stage_hashes(
+        self, stages: Optional[Dict[str, IngestionPipelineStage]] = None
+    ) -> Dict[str, int]:
+        """
+        Hash every stage once, from the hashes of its required stages.
 
-        return self
+        Args:
+            stages (Optional[Dict[str, IngestionPipelineStage]]): The stages to hash by
+                name, for example the stages with a column plan that is not applied.
+                Defaults to None which hashes the stages of the pipeline.
 
-    def __run_stage(self, *, stage: IngestionPipelineStage, progress_bar) -> None:
+        Returns:
+            Dict[str, int]: The hash of every stage by name.
         """
-        Run the stage. or read from cache if stage is cached.
+        stages = self.stages if stages is None else stages
+        hashes: Dict[str, int] = {}
+        for stage_name in self.get_ordered_stages_names(list(self.stages)):
+            stage = stages[stage_name]
+            hashes[stage_name] = stage.get_hash(get_parent_hashes(stage, hashes))
+        return hashes
+
+    def __get_stages_names(
+        self, stage_name: Optional[Union[str, List[str]]]
+    ) -> List[str]:
         """
-        progress_bar.set_description(f"Running {stage.name}")
+        Get the requested stage names, every stage when None.
+        """
+        if stage_name is None:
+            return list(self.stages)
+        if isinstance(stage_name, str):
+            return [stage_name]
+        return stage_name
+
+    def __get_hash(self, stage: IngestionPipelineStage) -> int:
+        """
+        Get the hash of the stage computed by the plan of the run, or hash it outside of
+        a run.
+        """
+        return get_stage_hash(stage, self.__stage_hashes)
+
+    def __get_parent_hashes(self, stage: IngestionPipelineStage) -> List[int]:
+        """
+        Get the hashes of the required stages of the stage.
+        """
+        return get_parent_hashes(stage, self.__stage_hashes)
+
+    def __plan_stage(
+        self, stage: IngestionPipelineStage, output_sizes: Dict[str, Optional[int]]
+    ) -> StagePlan:
+        """
+        Plan the stage. The estimated size of the inputs of a computed stage is the size
+        of its csv or the sum of the estimated sizes of its required stages, the size of
+        the inputs of the other stages is the size of their dataframe.
+        """
+        if self.__is_completed(stage.name) or self.__is_cached(stage):
+            return StagePlan(
+                name=stage.name,
+                key=self.__get_hash(stage),
+                status="completed" if self.__is_completed(stage.name) else "cached",
+                estimated_input_size=self.__get_output_size(stage),
+            )
+        if not self.use_caching:
+            reason = "caching is disabled"
+        elif stage.name == self.force_stage_calculation_and_not_use_cache_stage_name:
+            reason = "forced"
+        else:
+            reason = get_invalidation_reason(
+                stage,
+                load_stage_record(self.cache.cache_dir, stage.name),
+                self.__stage_hashes,
+            )
+        return StagePlan(
+            name=stage.name,
+            key=self.__get_hash(stage),
+            status="compute",
+            estimated_input_size=get_estimated_input_size(stage, output_sizes),
+            reason=reason,
+        )
+
+    def __get_output_size(self, stage: IngestionPipelineStage) -> Optional[int]:
+        """
+        Get the size of the dataframe of a completed or cached stage.
+        """
+        if self.__is_completed(stage.name) and stage.dataframe is not None:
+            return int(stage.dataframe.memory_usage(deep=False).sum())
+        return self.cache.get_size(
+            key=self.__get_hash(stage), sub_directory=f"{stage.name}/dataframe"
+        )
+
+    def plan_columns(self, stages_names: List[str]) -> None:
+        """
+        Plan the columns of the stages required by the requested stages and apply the
+        plan to the stages. The completed stages whose plan changed are run again.
+
+        Args:
+            stages_names (List[str]): The requested stage names.
+        """
+        previous_hashes = self.get_stage_hashes()
+        column_plan = self.get_column_plan(stages_names)
+        for stage_name, (output_columns, dead_transforms) in column_plan.items():
+            stage = self.stages[stage_name]
+            stage.output_columns, stage.dead_transforms = (
+                output_columns,
+                dead_transforms,
+            )
+
+        hashes = self.get_stage_hashes()
+        for stage_name in column_plan:
+            if hashes[stage_name] != previous_hashes[stage_name]:
+                self.completed_stages.pop(stage_name, None)
+
+    def get_column_plan(
+        self, stages_names: List[str]
+    ) -> Dict[str, Tuple[Optional[List[str]], Set[int]]]:
+        """
+        Compute the plan of the columns of the stages required by the requested stages,
+        without applying it. The stages are walked from the requested stages, which keep
+        every column, up to the root stages and each stage is planned with the columns
+        that its children stages read.
+
+        Args:
+            stages_names (List[str]): The requested stage names.
+
+        Returns:
+            Dict[str, Tuple[Optional[List[str]], Set[int]]]: The output columns and the
+                indices of the dead transforms of each planned stage by name.
+        """
+        output_columns: Dict[str, Optional[Set[str]]] = {
+            stage_name: None for stage_name in stages_names
+        }
+        column_plan: Dict[str, Tuple[Optional[List[str]], Set[int]]] = {}
+        # the children stages are planned before their required stages
+        for stage_name in reversed(self.get_ordered_stages_names(stages_names)):
+            (
+                stage_output_columns,
+                dead_transforms,
+                required_columns,
+            ) = self.stages[
+                stage_name
+            ].get_column_plan(output_columns.get(stage_name, set()))
+            column_plan[stage_name] = (stage_output_columns, dead_transforms)
+            for required_stage_name, columns in required_columns.items():
+                output_columns[required_stage_name] = merge_columns(
+                    output_columns.get(required_stage_name, set()), columns
+                )
+        return column_plan
+
+    def __get_planned_stages(
+        self, column_plan: Dict[str, Tuple[Optional[List[str]], Set[int]]]
+    ) -> Dict[str, IngestionPipelineStage]:
+        """
+        Get the stages with the column plan applied to copies of the planned stages.
+        """
+        planned_stages = dict(self.stages)
+        for stage_name, (output_columns, dead_transforms) in column_plan.items():
+            planned_stage = copy(self.stages[stage_name])
+            planned_stage.output_columns = output_columns
+            planned_stage.dead_transforms = dead_transforms
+            planned_stages[stage_name] = planned_stage
+        return planned_stages
+
+    def __is_completed(self, stage_name: str) -> bool:
+        """
+        Whether the stage is completed and not run again by the column plan being
+        planned.
+        """
+        return (
+            stage_name in self.completed_stages
+            and stage_name not in self.__stale_stages_names
+        )
+
+    def get_ordered_stages_names(self, stages_names: List[str]) -> List[str]:
+        """
+        Get the requested stages and all of their ancestors, every stage after its
+        required stages.
+
+        Args:
+            stages_names (List[str]): The requested stage names.
+
+        Returns:
+            List[str]: The stage names in topological order.
+        """
+        ordered_stages_names: List[str] = []
+        visited_stages_names: Set[str] = set()
+
+        def visit(stage_name: str) -> None:
+            if stage_name in visited_stages_names:
+                return
+            visited_stages_names.add(stage_name)
+            for required_stage_name in self.stages[stage_name].required_stages_names:
+                visit(required_stage_name)
+            ordered_stages_names.append(stage_name)
+
+        for stage_name in stages_names:
+            assert stage_name in self.stages, f"{stage_name} is not in the pipeline"
+            visit(stage_name)
+        return ordered_stages_names
+
+    def gc_cache(self) -> List[str]:
+        """
+        Remove the cached entries that no stage of the pipeline can produce anymore.
+
+        Returns:
+            List[str]: The removed entries.
+        """
+        return self.cache.gc(self.__get_stages_keys()[0])
+
+    def __get_stages_keys(self) -> Tuple[Dict[str, Set[int]], Set[int]]:
+        """
+        Get the cache keys that the stages produce, their hash and their checkpoint keys.
+
+        Returns:
+            Tuple[Dict[str, Set[int]], Set[int]]: The keys by stage name and all the keys.
+        """
+        hashes = self.__stage_hashes or self.get_stage_hashes()
+        stages_keys = {
+            stage.name: {
+                hashes[stage.name],
+                *stage.get_checkpoint_keys(get_parent_hashes(stage, hashes)).values(),
+            }
+            for stage in self.stages.values()
+        }
+        return stages_keys, set().union(*stages_keys.values())
+
+    def get_required_stages(
+        self, stages_names: List[str]
+    ) -> Dict[str, IngestionPipelineStage]:
+        """
+        Get the minimal set of stages to run to produce the requested stages.
+        The required stages names are walked up from the requested stages, the walk
+        stops at the stages that are already completed or that can be read from the cache.
+
+        Args:
+            stages_names (List[str]): The requested stage names.
+
+        Returns:
+            Dict[str, IngestionPipelineStage]: The stages to run in the pipeline order.
+        """
+        required_stages_names: Set[str] = set()
+        stages_names_to_visit = list(stages_names)
+        while len(stages_names_to_visit) > 0:
+            stage_name = stages_names_to_visit.pop()
+            assert stage_name in self.stages, f"{stage_name} is not in the pipeline"
+            if stage_name in required_stages_names or self.__is_completed(stage_name):
+                continue
+            required_stages_names.add(stage_name)
+            if self.__is_cached(self.stages[stage_name]):
+                continue
+            stages_names_to_visit.extend(self.stages[stage_name].required_stages_names)
+
+        return {
+            stage_name: stage
+            for stage_name, stage in self.stages.items()
+            if stage_name in required_stages_names
+        }
 
+    def __schedule_stages(
+        self,
+        *,
+        stages: Dict[str, IngestionPipelineStage],
+        output_stages_names: Set[str],
+        progress_bar,
+    ) -> None:
+        """
+        Run the stages in topological order. A stage is ready as soon as all of its
+        parents that have to be run are completed. When max_workers is greater than 1,
+        the ready stages that are not cached nor partitioned are run at the same time in
+        a process pool.
+        The number of children stages left to complete is counted for each parent stage
+        to release its dataframe.
+        """
+        remaining_children: Dict[str, int] = {}
+        for stage in stages.values():
+            for parent_stage in stage.required_stages:
+                remaining_children[parent_stage.name] = (
+                    remaining_children.get(parent_stage.name, 0) + 1
+                )
+        scheduled_stages_names: Set[str] = set()
+        ready_stages: Deque[IngestionPipelineStage] = deque()
+        for stage in stages.values():
+            self.__enqueue_if_ready(
+                stage=stage,
+                stages=stages,
+                ready_stages=ready_stages,
+                scheduled_stages_names=scheduled_stages_names,
+            )
+
+        executor = (
+            ProcessPoolExecutor(max_workers=self.max_workers)
+            if self.max_workers > 1
+            else None
+        )
+        running_stages = {}
+        try:
+            while len(ready_stages) > 0 or len(running_stages) > 0:
+                while len(ready_stages) > 0:
+                    stage = ready_stages.popleft()
+                    start_time = perf_counter()
+                    # the partitioned stages run their own process pool
+                    if (
+                        executor is None
+                        or self.__is_cached(stage)
+                        or stage.is_partitioned
+                    ):
+                        self.__run_stage(stage=stage, progress_bar=progress_bar)
+                        self.__schedule_children(
+                            stage=stage,
+                            start_time=start_time,
+                            stages=stages,
+                            ready_stages=ready_stages,
+                            scheduled_stages_names=scheduled_stages_names,
+                            remaining_children=remaining_children,
+                            output_stages_names=output_stages_names,
+                        )
+                        continue
+                    progress_bar.set_description(f"Running {stage.name}")
+                    future = executor.submit(
+                        process_dataframe_with_profiler,
+                        **stage.get_process_dataframe_arguments(
+                            config=self.config,
+                            environment=self.environment,
+                            limit=self.limit_dataframe_size,
+                            cache=self.cache if self.use_caching else None,
+                            profiler=self.__get_profiler(stage),
+                            parent_hashes=self.__get_parent_hashes(stage),
+                        ),
+                    )
+                    running_stages[future] = (stage, start_time)
+
+                if len(running_stages) == 0:
+                    continue
+
+                done_futures, _ = wait(running_stages, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    stage, start_time = running_stages.pop(future)
+                    stage.dataframe, stage.errors, profiler = future.result()
+                    if profiler is not None:
+                        self.profile_records.extend(profiler.records)
+                    self.__complete_stage(stage=stage, progress_bar=progress_bar)
+                    self.__schedule_children(
+                        stage=stage,
+                        start_time=start_time,
+                        stages=stages,
+                        ready_stages=ready_stages,
+                        scheduled_stages_names=scheduled_stages_names,
+                        remaining_children=remaining_children,
+                        output_stages_names=output_stages_names,
+                    )
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        uncompleted_stages_names = [
+            stage_name
+            for stage_name in stages
+            if stage_name not in self.completed_stages
+            and stage_name not in self.released_stages_names
+        ]
+        if len(uncompleted_stages_names) > 0:
+            raise ValueError(
+                f"The stages {uncompleted_stages_names} can not be run,"
+                + " their required stages contain a cycle."
+            )
+
+    def __schedule_children(
+        self,
+        *,
+        stage: IngestionPipelineStage,
+        start_time: float,
+        stages: Dict[str, IngestionPipelineStage],
+        ready_stages: Deque[IngestionPipelineStage],
+        scheduled_stages_names: Set[str],
+        remaining_children: Dict[str, int],
+        output_stages_names: Set[str],
+    ) -> None:
+        """
+        Record the duration of the completed stage, release its parents and add its
+        children stages that are now ready to the ready stages.
+        """
+        self.stage_durations[stage.name] = perf_counter() - start_time
+        self.__release_parents(
+            stage=stage,
+            remaining_children=remaining_children,
+            output_stages_names=output_stages_names,
+        )
+        for child_stage in stage.children_stages:
+            self.__enqueue_if_ready(
+                stage=child_stage,
+                stages=stages,
+                ready_stages=ready_stages,
+                scheduled_stages_names=scheduled_stages_names,
+            )
+
+    def __enqueue_if_ready(
+        self,
+        *,
+        stage: IngestionPipelineStage,
+        stages: Dict[str, IngestionPipelineStage],
+        ready_stages: Deque[IngestionPipelineStage],
+        scheduled_stages_names: Set[str],
+    ) -> None:
+        """
+        Add the stage to the ready stages if it has to be run, is not completed nor
+        scheduled and all of its parents that have to be run are completed.
+        """
         if (
+            stage.name not in stages
+            or stage.name in scheduled_stages_names
+            or stage.name in self.completed_stages
+        ):
+            return
+        for parent_stage in stage.required_stages:
+            if (
+                parent_stage.name in stages
+                and parent_stage.name not in self.completed_stages
+            ):
+                return
+        scheduled_stages_names.add(stage.name)
+        ready_stages.append(stage)
+
+    def __release_parents(
+        self,
+        *,
+        stage: IngestionPipelineStage,
+        remaining_children: Dict[str, int],
+        output_stages_names: Set[str],
+    ) -> None:
+        """
+        Release the dataframes of the parents of the completed stage that have no
+        children left to complete and are not requested. The released stages are not
+        completed anymore, the next runs read them from the cache or run them again.
+        """
+        if not self.release_dataframes:
+            return
+        stage.release_inputs()
+        for parent_stage in stage.required_stages:
+            remaining_children[parent_stage.name] -= 1
+            if (
+                remaining_children[parent_stage.name] > 0
+                or parent_stage.name in output_stages_names
+                or parent_stage.dataframe is None
+            ):
+                continue
+            self.__release_dataframe(parent_stage)
+
+    def __release_dataframe(self, stage: IngestionPipelineStage) -> None:
+        """
+        Release the dataframe of a stage, it is spilled to the cache first when
+        spill_released_dataframes is set.
+        """
+        if self.spill_released_dataframes and not self.cache.has(
+            key=self.__get_hash(stage),
+            sub_directory=f"{stage.name}/dataframe",
+        ):
+            self.cache.add(
+                key=self.__get_hash(stage),
+                value=stage.dataframe,
+                sub_directory=f"{stage.name}/dataframe",
+                cache_format=stage.cache_format,
+                compression=stage.cache_compression,
+            )
+        stage.dataframe = None
+        self.completed_stages.pop(stage.name, None)
+        self.released_stages_names.add(stage.name)
+
+    def __is_cached(self, stage: IngestionPipelineStage) -> bool:
+        """
+        Whether the stage can be read from the cache.
+        """
+        return (
             self.use_caching
-            and self.cache.has(key=hash(stage), sub_directory=f"{stage.name}/dataframe")
             and stage.name != self.force_stage_calculation_and_not_use_cache_stage_name
-        ):
+            and self.cache.has(
+                key=self.__get_hash(stage), sub_directory=f"{stage.name}/dataframe"
+            )
+        )
+
+    def __run_stage(self, *, stage: IngestionPipelineStage, progress_bar) -> None:
+        """
+        Run the stage. or read from cache if stage is cached.
+        """
+        progress_bar.set_description(f"Running {stage.name}")
+
+        profiler = self.__get_profiler(stage)
+        if self.__is_cached(stage):
+            started = profiler.start(None) if profiler is not None else None
+            key = self.__get_hash(stage)
+            # only the columns planned for the children stages are read
             stage.dataframe = self.cache.get(
-                key=hash(stage), sub_directory=f"{stage.name}/dataframe"
+                key=key,
+                sub_directory=f"{stage.name}/dataframe",
+                columns=stage.output_columns,
             )
-            if self.limit_dataframe_size is not None:
-                stage.dataframe = stage.dataframe.head(self.limit_dataframe_size)
-            if self.cache.has(key=hash(stage), sub_directory=f"{stage.name}/errors"):
+            if self.cache.has(key=key, sub_directory=f"{stage.name}/errors"):
                 stage.errors = self.cache.get(
-                    key=hash(stage), sub_directory=f"{stage.name}/errors"
+                    key=key, sub_directory=f"{stage.name}/errors"
                 )
             else:
-                stage.errors = ErrorDataFrame(stage.dataframe, config=self.config)
+                stage.errors = ErrorDataFrame(
+                    stage.dataframe, config=self.config, stage_name=stage.name
+                )
+            if profiler is not None:
+                profiler.stop(
+                    started, step_name="load_cache", dataframe=stage.dataframe
+                )
         else:
             stage.run(
                 config=self.config,
                 environment=self.environment,
                 limit=self.limit_dataframe_size,
+                cache=self.cache if self.use_caching else None,
+                profiler=profiler,
+                parent_hashes=self.__get_parent_hashes(stage),
             )
-            if self.limit_dataframe_size is not None:
-                stage.dataframe = stage.dataframe.head(self.limit_dataframe_size)
+        if profiler is not None:
+            self.profile_records.extend(profiler.records)
+        self.__complete_stage(stage=stage, progress_bar=progress_bar)
+
+    def __get_profiler(self, stage: IngestionPipelineStage) -> Optional[Profiler]:
+        """
+        Get a profiler for the stage, None when the pipeline is not profiled.
+        """
+        if not self.profile:
+            return None
+        return Profiler(stage_name=stage.name, trace_allocations=self.trace_allocations)
+
+    def __write_profile_report(self) -> None:
+        """
+        Write the report of the profiled stages next to the cache and print its summary.
+        """
+        if len(self.profile_records) == 0:
+            return
+        report_paths = write_profile_report(
+            self.profile_records,
+            directory=path.join(self.environment.cache_dir or ".", "profiles"),
+            name=datetime.now().strftime("%Y%m%d_%H%M%S"),
+        )
+        print(get_flame_summary(self.profile_records), end="")
+        print(f"{Fore.cyan}PROFILE: {Style.reset}{report_paths['json']}")
+
+    def __complete_stage(self, *, stage: IngestionPipelineStage, progress_bar) -> None:
+        """
+        Mark the stage as completed and cache its dataframe and errors.
+        """
+        if self.limit_dataframe_size is not None:
+            stage.dataframe = stage.dataframe.head(self.limit_dataframe_size)
         self.completed_stages[stage.name] = stage
+        self.released_stages_names.discard(stage.name)
         if (
             self.use_caching
             and stage.name != self.force_stage_calculation_and_not_use_cache_stage_name
         ):
-            if not self.cache.has(
-                key=hash(stage), sub_directory=f"{stage.name}/dataframe"
-            ):
+            key = self.__get_hash(stage)
+            if not self.cache.has(key=key, sub_directory=f"{stage.name}/dataframe"):
                 self.cache.add(
-                    key=hash(stage),
+                    key=key,
                     value=stage.dataframe,
                     sub_directory=f"{stage.name}/dataframe",
+                    cache_format=stage.cache_format,
+                    compression=stage.cache_compression,
                 )
-            if not self.cache.has(
-                key=hash(stage), sub_directory=f"{stage.name}/errors"
-            ):
+                save_stage_record(self.cache.cache_dir, stage, self.__stage_hashes)
+            if not self.cache.has(key=key, sub_directory=f"{stage.name}/errors"):
                 self.cache.add(
-                    key=hash(stage),
+                    key=key,
                     value=stage.errors,
                     sub_directory=f"{stage.name}/errors",
+                    cache_format="pickle",
                 )
         progress_bar.update(1)
 
+    def get_critical_path(self) -> Tuple[List[str], float]:
+        """
+        Get the critical path of the last run. It is the chain of dependent stages
+        with the longest total duration, the run can not be faster than this chain.
+
+        Returns:
+            Tuple[List[str], float]: The stage names of the path and its duration in seconds.
+        """
+        path_durations: Dict[str, float] = {}
+        previous_stages_names: Dict[str, Optional[str]] = {}
+        # completed stages are stored in completion order which is a topological order
+        for stage_name, stage in self.completed_stages.items():
+            if stage_name not in self.stage_durations:
+                continue
+            slowest_parent_name = max(
+                (
+                    parent_stage.name
+                    for parent_stage in stage.required_stages
+                    if parent_stage.name in path_durations
+                ),
+                key=lambda parent_stage_name: path_durations[parent_stage_name],
+                default=None,
+            )
+            path_durations[stage_name] = self.stage_durations[stage_name] + (
+                path_durations[slowest_parent_name] if slowest_parent_name else 0.0
+            )
+            previous_stages_names[stage_name] = slowest_parent_name
+
+        if len(path_durations) == 0:
+            return [], 0.0
+
+        last_stage_name = max(path_durations, key=path_durations.get)
+        duration = path_durations[last_stage_name]
+        critical_path = []
+        while last_stage_name is not None:
+            critical_path.insert(0, last_stage_name)
+            last_stage_name = previous_stages_names[last_stage_name]
+        return critical_path, duration
+
+    def __print_critical_path(self) -> None:
+        """
+        Print the critical path of the last run.
+        """
+        critical_path, duration = self.get_critical_path()
+        if len(critical_path) == 0:
+            return
+        print(
+            f"{Fore.cyan}CRITICAL PATH: {Style.reset}"
+            + " -> ".join(
+                f"{stage_name} ({self.stage_durations[stage_name]:.1f}s)"
+                for stage_name in critical_path
+            )
+            + f" = {duration:.1f}s"
+        )
+
     def data_integrity_test(self, threshold: float = 0.3) -> DataFrame:
         """
-        Run the data integrity test.
+        Run the data integrity test. The released dataframes are reloaded one at a
+        time for the test and released again.
 
         Args:
             threshold (float, optional): The threshold. Defaults to 0.3.
         """
         for stage in self.stages.values():
-            if stage.errors is not None:
-                stage.data_integrity_test(threshold=threshold)
+            if stage.errors is None:
+                continue
+            is_released = stage.name in self.released_stages_names
+            self.get_dataframe(stage.name)
+            stage.data_integrity_test(threshold=threshold)
+            if is_released:
+                self.__release_dataframe(stage)
         return self.get_errors()
 
     def get_errors(self) -> DataFrame:
@@ -178,32 +938,15 @@ class IngestionPipeline:
         Returns:
             DataFrame: The errors.
         """
-        dataframe = DataFrame([], columns=["error_id", "error", "count"])
-        for error in [
-            stage.errors for stage in self.stages.values() if stage.errors is not None
-        ]:
-            table = pivot_table(error, index=["error_id", "error"], aggfunc="size")
-            table = table.reset_index()
-            table.columns = ["error_id", "error", "count"]
-            dataframe = dataframe.append(table)
-        return dataframe
-
-    def __find_next_stage_to_execute(self) -> Optional[IngestionPipelineStage]:
-        """ "
-        Find the next stage to execute. This will find the next stage to execute
-        """
-        uncompleted_stages = [
-            stage
-            for stage in self.stages.values()
-            if stage.name not in self.completed_stages
-        ]
-
-        for stage in uncompleted_stages:
-            for parent_stage in stage.required_stages:
-                if parent_stage.name not in self.completed_stages:
-                    break
-            return stage
-        return None
+        return concat(
+            [DataFrame([], columns=["error_id", "error", "count"])]
+            + [
+                stage.errors.get_counts()
+                for stage in self.stages.values()
+                if stage.errors is not None
+            ],
+            ignore_index=True,
+        )
 
     def to_dict(self) -> dict:
         """
@@ -216,3 +959,40 @@ class IngestionPipeline:
             "use_caching": self.use_caching,
             "stages": [stage.to_dict() for stage in self.stages.values()],
         }
+
+
+def process_dataframe_with_profiler(
+    **arguments,
+) -> Tuple[DataFrame, ErrorDataFrame, Optional[Profiler]]:
+    """
+    Run process_dataframe in a worker process and send back the profiler with the
+    dataframe, its records are filled in the worker process.
+
+    Returns:
+        Tuple[DataFrame, ErrorDataFrame, Optional[Profiler]]: The processed dataframe, the
+            errors and the profiler.
+    """
+    dataframe, errors = process_dataframe(**arguments)
+    return dataframe, errors, arguments.get("profiler")
+
+
+class StageDataFrames(Mapping):
+    """
+    A read only mapping of the dataframes of the stages of a pipeline by stage name.
+    The released dataframes are reloaded when they are read.
+
+    Args:
+        pipeline (IngestionPipeline): The pipeline.
+    """
+
+    def __init__(self, pipeline: IngestionPipeline) -> None:
+        self.pipeline = pipeline
+
+    def __getitem__(self, stage_name: str) -> Optional[DataFrame]:
+        return self.pipeline.get_dataframe(stage_name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.pipeline.stages)
+
+    def __len__(self) -> int:
+        return len(self.pipeline.stages)
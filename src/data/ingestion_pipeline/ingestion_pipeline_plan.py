@@ -0,0 +1,306 @@
+"""
+The ingestion pipeline plan module.
+"""
+from json import dump, dumps, load, loads
+from os import makedirs, path
+from typing import Dict, List, Optional
+from colored import Fore, Style
+from src.data.ingestion_pipeline.ingestion_pipeline_stage import (
+    IngestionPipelineStage,
+)
+
+STAGE_STATUSES = ["completed", "cached", "compute"]
+
+
+class StagePlan:
+    """
+    The plan of a stage of the ingestion pipeline.
+
+    Args:
+        name (str): The name of the stage.
+        key (int): The hash of the stage, its cache key.
+        status (str): "completed" when the dataframe is already in memory, "cached" when
+            it is read from the cache and "compute" when the stage is run.
+        estimated_input_size (Optional[int]): The estimated size in bytes of the inputs
+            of the stage, the csv to load or the dataframes of the required stages.
+            None when it can not be estimated.
+        reason (Optional[str]): Why the stage is computed. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        key: int,
+        status: str,
+        estimated_input_size: Optional[int],
+        reason: Optional[str] = None,
+    ) -> None:
+        assert status in STAGE_STATUSES
+        self.name = name
+        self.key = key
+        self.status = status
+        self.estimated_input_size = estimated_input_size
+        self.reason = reason
+
+    def to_dict(self) -> dict:
+        """
+        This method returns the dictionary representation of the class.
+
+        Returns:
+            dict: The dictionary representation of the class.
+        """
+        return {
+            "name": self.name,
+            "key": str(self.key),
+            "status": self.status,
+            "estimated_input_size": self.estimated_input_size,
+            "reason": self.reason,
+        }
+
+
+class IngestionPipelinePlan:
+    """
+    The plan of a run of the ingestion pipeline, the stages required to produce the
+    requested stages and whether each of them is read from memory, read from the cache
+    or computed.
+
+    Args:
+        stages (List[StagePlan]): The plans of the required stages, every stage after
+            its required stages.
+        hashes (Dict[str, int]): The hash of every stage of the pipeline by name.
+    """
+
+    def __init__(self, *, stages: List[StagePlan], hashes: Dict[str, int]) -> None:
+        self.stages = {stage.name: stage for stage in stages}
+        self.hashes = hashes
+
+    @property
+    def stages_to_run_names(self) -> List[str]:
+        """
+        The names of the stages which are read from the cache or computed.
+        """
+        return [
+            stage.name for stage in self.stages.values() if stage.status != "completed"
+        ]
+
+    def to_dict(self) -> dict:
+        """
+        This method returns the dictionary representation of the class.
+
+        Returns:
+            dict: The dictionary representation of the class.
+        """
+        return {"stages": [stage.to_dict() for stage in self.stages.values()]}
+
+    def __str__(self) -> str:
+        lines = [f"{Fore.cyan}PLAN: {Style.reset}"]
+        for stage in self.stages.values():
+            size = (
+                f"{stage.estimated_input_size / 2**20:.1f}MiB"
+                if stage.estimated_input_size is not None
+                else "?"
+            )
+            lines.append(
+                f"  {stage.name:<60} {stage.status:<9} {size:>12}"
+                + (f"  {stage.reason}" if stage.reason is not None else "")
+            )
+        return "\n".join(lines) + "\n"
+
+
+def get_hash_dict_changes(previous: dict, current: dict) -> List[str]:
+    """
+    Describe the changes between two hashed dictionaries of a stage.
+
+    Args:
+        previous (dict): The hashed dictionary the stage was cached with.
+        current (dict): The hashed dictionary of the stage.
+
+    Returns:
+        List[str]: The changes, such as "csv changed" or "FillGaps code changed".
+    """
+    changes = []
+    for key in sorted(set(previous) | set(current)):
+        if key == "transforms" or previous.get(key) == current.get(key):
+            continue
+        if key == "load_dataframe_csv_fingerprint":
+            changes.append("csv changed")
+        else:
+            changes.append(f"{key} changed")
+    previous_transforms = previous.get("transforms", [])
+    current_transforms = current.get("transforms", [])
+    for index in range(max(len(previous_transforms), len(current_transforms))):
+        if index >= len(previous_transforms):
+            changes.append(f"{current_transforms[index].get('name')} added")
+        elif index >= len(current_transforms):
+            changes.append(f"{previous_transforms[index].get('name')} removed")
+        elif previous_transforms[index] != current_transforms[index]:
+            previous_transform = dict(previous_transforms[index])
+            current_transform = dict(current_transforms[index])
+            name = current_transform.get("name")
+            if previous_transform.get("name") != name:
+                changes.append(f"{previous_transform.get('name')} replaced by {name}")
+            elif (
+                previous_transform.pop("code_version", None)
+                != current_transform.pop("code_version", None)
+                and previous_transform == current_transform
+            ):
+                changes.append(f"{name} code changed")
+            else:
+                changes.append(f"{name} changed")
+    return changes
+
+
+def get_stage_hash(stage: IngestionPipelineStage, hashes: Dict[str, int]) -> int:
+    """
+    Get the hash of a stage computed by the plan of a run, or hash it outside of a run.
+
+    Args:
+        stage (IngestionPipelineStage): The stage.
+        hashes (Dict[str, int]): The hashes of the stages computed by the plan by name.
+
+    Returns:
+        int: The hash of the stage.
+    """
+    if stage.name in hashes:
+        return hashes[stage.name]
+    return hash(stage)
+
+
+def get_parent_hashes(
+    stage: IngestionPipelineStage, hashes: Dict[str, int]
+) -> List[int]:
+    """
+    Get the hashes of the required stages of a stage.
+
+    Args:
+        stage (IngestionPipelineStage): The stage.
+        hashes (Dict[str, int]): The hashes of the stages computed by the plan by name.
+
+    Returns:
+        List[int]: The hashes of the required stages, in their order.
+    """
+    return [
+        get_stage_hash(parent_stage, hashes) for parent_stage in stage.required_stages
+    ]
+
+
+def get_estimated_input_size(
+    stage: IngestionPipelineStage, output_sizes: Dict[str, Optional[int]]
+) -> Optional[int]:
+    """
+    Estimate the size of the inputs of a computed stage, the size of its csv or the sum
+    of the estimated sizes of its required stages.
+
+    Args:
+        stage (IngestionPipelineStage): The stage.
+        output_sizes (Dict[str, Optional[int]]): The estimated sizes of the planned
+            stages by name.
+
+    Returns:
+        Optional[int]: The size in bytes, None when it can not be estimated.
+    """
+    if stage.load_dataframe_csv_path is not None:
+        return (
+            path.getsize(stage.load_dataframe_csv_path)
+            if path.exists(stage.load_dataframe_csv_path)
+            else None
+        )
+    parent_sizes = [
+        output_sizes.get(parent_stage.name) for parent_stage in stage.required_stages
+    ]
+    return sum(parent_sizes) if None not in parent_sizes else None
+
+
+def get_stage_record_path(cache_dir: str, stage_name: str) -> str:
+    """
+    Get the path of the record of the last time a stage was cached.
+
+    Args:
+        cache_dir (str): The cache directory.
+        stage_name (str): The stage name.
+
+    Returns:
+        str: The path of the record.
+    """
+    return path.join(cache_dir, "plans", f"{stage_name}.json")
+
+
+def load_stage_record(cache_dir: str, stage_name: str) -> Optional[dict]:
+    """
+    Load the record of the last time a stage was cached.
+
+    Args:
+        cache_dir (str): The cache directory.
+        stage_name (str): The stage name.
+
+    Returns:
+        Optional[dict]: The record, None if there is none.
+    """
+    record_path = get_stage_record_path(cache_dir, stage_name)
+    if not path.exists(record_path):
+        return None
+    with open(record_path, "r", encoding="utf-8") as file:
+        return load(file)
+
+
+def save_stage_record(
+    cache_dir: str, stage: IngestionPipelineStage, hashes: Dict[str, int]
+) -> None:
+    """
+    Record what a cached stage was hashed from, to explain its next invalidation.
+
+    Args:
+        cache_dir (str): The cache directory.
+        stage (IngestionPipelineStage): The cached stage.
+        hashes (Dict[str, int]): The hashes of the stages computed by the plan by name.
+    """
+    record_path = get_stage_record_path(cache_dir, stage.name)
+    if not path.exists(path.dirname(record_path)):
+        makedirs(path.dirname(record_path))
+    with open(record_path, "w", encoding="utf-8") as file:
+        dump(
+            {
+                "key": str(get_stage_hash(stage, hashes)),
+                "stage": stage.get_hash_dict(),
+                "required_stages": {
+                    parent_stage.name: str(get_stage_hash(parent_stage, hashes))
+                    for parent_stage in stage.required_stages
+                },
+            },
+            file,
+            indent=4,
+        )
+
+
+def get_invalidation_reason(
+    stage: IngestionPipelineStage, record: Optional[dict], hashes: Dict[str, int]
+) -> str:
+    """
+    Get the reason why a stage is not in the cache, from the record of the last time it
+    was cached.
+
+    Args:
+        stage (IngestionPipelineStage): The stage.
+        record (Optional[dict]): The record of the stage, None if it was never cached.
+        hashes (Dict[str, int]): The hashes of the stages computed by the plan by name.
+
+    Returns:
+        str: The reason, such as "never cached" or "FillGaps code changed".
+    """
+    if record is None:
+        return "never cached"
+    if record["key"] == str(get_stage_hash(stage, hashes)):
+        return "evicted from the cache"
+    changes = get_hash_dict_changes(
+        record["stage"], loads(dumps(stage.get_hash_dict()))
+    )
+    changed_parents_names = [
+        parent_stage.name
+        for parent_stage in stage.required_stages
+        if record["required_stages"].get(parent_stage.name)
+        != str(get_stage_hash(parent_stage, hashes))
+    ]
+    if len(changed_parents_names) > 0:
+        changes.append("required stages changed: " + ", ".join(changed_parents_names))
+    return ", ".join(changes) if len(changes) > 0 else "changed"
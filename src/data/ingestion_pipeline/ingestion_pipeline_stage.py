@@ -1,17 +1,30 @@
 """
 Ingestion pipeline stage.
 """
-from typing import List
+from typing import Dict, List, Optional, Set, Tuple
 from hashlib import new
 from json import dumps
 from colored import Fore, Style
+from pandas import Timedelta
 from src.data.transforms.transform import DataframeTransform
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
+from src.utility.dataframe_cache import CacheFormat, DataFrameCache
+from src.utility.file_fingerprint import get_file_fingerprint
+from src.utility.profiler import Profiler
 from src.data.schema.schema import Schema
+from src.data.schema.schema_column import SchemaColumn
 from src.data.schema.employee_schema import EmployeeSchema
-from src.data.process_dataframe import process_dataframe
+from src.data.polars_backend import BACKENDS
+from src.data.process_dataframe import (
+    process_dataframe,
+    process_partitioned_dataframe,
+)
+from src.data.transforms.aggregate.aggregate_by import AggregateBy
 from src.data.transforms.clean.join import Join
+from src.data.transforms.clean.keep_columns import KeepColumns
+from src.data.transforms.clean.rename_columns import RenameColumns
+from src.data.transforms.checkpoint.checkpoint import Checkpoint, TransformCheckpoints
 from src.data.transforms.analysis.data_slice import DataSlice
 from src.data.transforms.analysis.generate_statistics import GenerateStatistics
 from src.data.transforms.analysis.plot_distribution import PlotDistribution
@@ -29,6 +42,31 @@ class IngestionPipelineStage:
         from_schema (Schema): The schema of the dataframe before the transforms.
         to_schema (Schema): The schema of the dataframe after the transforms.
         transforms (List[DataframeTransform]): The transforms to apply.
+        cache_format (Optional[CacheFormat]): The format used to cache the dataframe.
+            Defaults to None which uses the format of the cache.
+        cache_compression (Optional[str]): The compression used to cache the dataframe.
+            Defaults to None which uses the compression of the cache.
+        chunk_size (Optional[int]): The number of rows of the chunks used to stream the csv
+            to load through the leading row local transforms. Defaults to None which loads
+            the whole csv at once.
+        watermark_column (Optional[SchemaColumn]): The date column of the csv to load
+            whose rows after the watermark are the new rows of an incremental run.
+            Defaults to None.
+        incremental_lookback (Optional[Timedelta]): Set on the stages whose rows are keyed
+            by EMPLOYEE_ID and PERIOD_START, which an incremental run recomputes for the
+            keys of the new rows and merges with their previous output. The lookback is
+            how far before a new row the keys are recomputed and the rows are read.
+            Defaults to None which recomputes the stage from the merged stages.
+        partition_by (Optional[SchemaColumn]): The column by which the dataframe of the
+            required stage is split in partitions that are processed at the same time,
+            every transform must be able to be applied to the partitions by this
+            column. The partitions are not checkpointed. Defaults to None.
+        n_partitions (int): The number of partitions and of processes used when the
+            stage is partitioned. Defaults to 1.
+        backend (str): The backend applying the transforms, "pandas" or "polars" which
+            fuses the consecutive transforms with a Polars implementation into one lazy
+            query. No stage builder uses the polars backend yet, it is opt-in for the
+            stages whose transforms have a Polars implementation. Defaults to "pandas".
     """
 
     def __init__(
@@ -41,12 +79,24 @@ class IngestionPipelineStage:
         from_schema: Schema = None,
         to_schema: Schema = None,
         transforms: List[DataframeTransform] = None,
+        cache_format: Optional[CacheFormat] = None,
+        cache_compression: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        watermark_column: Optional[SchemaColumn] = None,
+        incremental_lookback: Optional[Timedelta] = None,
+        partition_by: Optional[SchemaColumn] = None,
+        n_partitions: int = 1,
+        backend: str = "pandas",
     ):
         assert name is not None
         assert from_schema is not None
         assert to_schema is not None
         assert transforms is not None
         assert load_dataframe_csv_path is not None or len(required_stages_names) > 0
+        assert watermark_column is None or load_dataframe_csv_path is not None
+        assert n_partitions >= 1
+        assert backend in BACKENDS
+        assert partition_by is None or len(required_stages_names) > 0
         self.name = name
         self.config = config
         self.transforms = transforms
@@ -54,8 +104,20 @@ class IngestionPipelineStage:
         self.to_schema = to_schema
         self.load_dataframe_csv_path = load_dataframe_csv_path
         self.required_stages_names = required_stages_names or []
+        self.cache_format = cache_format
+        self.cache_compression = cache_compression
+        self.chunk_size = chunk_size
+        self.watermark_column = watermark_column
+        self.incremental_lookback = incremental_lookback
+        self.partition_by = partition_by
+        self.n_partitions = n_partitions
+        self.backend = backend
+        # the transform keeping the rows of an incremental run, it is not hashed
+        self.incremental_filter: Optional[DataframeTransform] = None
         self.required_stages = []
         self.children_stages = []
+        self.dead_transforms: Set[int] = set()
+        self.output_columns: Optional[List[str]] = None
         self.dataframe = None
         self.errors = None
 
@@ -99,6 +161,21 @@ class IngestionPipelineStage:
                     date_by="year",
                 ),
             ]
+        if self.partition_by is not None:
+            for transform in self.transforms:
+                if not transform.can_partition_by(self.partition_by.name):
+                    raise ValueError(
+                        f"The stage {self.name} can not be partitioned by"
+                        + f" {self.partition_by.name},"
+                        + f" {transform.__class__.__name__} can not be partitioned."
+                    )
+
+    @property
+    def is_partitioned(self) -> bool:
+        """
+        Whether the dataframe is processed by partitions.
+        """
+        return self.partition_by is not None and self.n_partitions > 1
 
     def set_parent_nodes(self, parent_nodes: List["IngestionPipelineStage"]):
         """
@@ -116,12 +193,130 @@ class IngestionPipelineStage:
         else:
             self.children_stages.append(child_node)
 
+    @property
+    def planned_transforms(self) -> List[DataframeTransform]:
+        """
+        The transforms to apply, without the dead transforms found by plan_columns.
+        """
+        return [
+            transform
+            for index, transform in enumerate(self.transforms)
+            if index not in self.dead_transforms
+        ]
+
+    def plan_columns(
+        self, output_columns: Optional[Set[str]]
+    ) -> Dict[str, Optional[Set[str]]]:
+        """
+        Plan the columns of the stage by walking its transforms backward from the columns
+        that the children stages read. The transforms whose written columns are never
+        read afterwards are dead and skipped, and the dataframe of the stage is reduced
+        to the output columns.
+
+        Args:
+            output_columns (Optional[Set[str]]): The columns read from the dataframe of
+                the stage. None keeps every column and skips no transform.
+
+        Returns:
+            Dict[str, Optional[Set[str]]]: The columns read from each required stage, None
+                when every column may be read.
+        """
+        (
+            self.output_columns,
+            self.dead_transforms,
+            required_columns,
+        ) = self.get_column_plan(output_columns)
+        return required_columns
+
+    def get_column_plan(
+        self, output_columns: Optional[Set[str]]
+    ) -> Tuple[Optional[List[str]], Set[int], Dict[str, Optional[Set[str]]]]:
+        """
+        Compute the plan of the columns of the stage like plan_columns, without applying
+        it to the stage.
+
+        Args:
+            output_columns (Optional[Set[str]]): The columns read from the dataframe of
+                the stage. None keeps every column and skips no transform.
+
+        Returns:
+            Tuple[Optional[List[str]], Set[int], Dict[str, Optional[Set[str]]]]: The
+                output columns of the stage, the indices of its dead transforms and the
+                columns read from each required stage.
+        """
+        dead_transforms: Set[int] = set()
+        required_columns: Dict[str, Optional[Set[str]]] = {
+            stage_name: set() for stage_name in self.required_stages_names
+        }
+        live_columns = set(output_columns) if output_columns is not None else None
+        for index in reversed(range(len(self.transforms))):
+            transform = self.transforms[index]
+            read_columns = transform.get_read_columns()
+            write_columns = transform.get_write_columns()
+
+            if isinstance(transform, Join):
+                if live_columns is not None:
+                    # the columns of both sides may end up with a suffix
+                    live_columns = live_columns | {
+                        column[: -len(suffix)]
+                        for column in live_columns
+                        for suffix in transform.suffixes
+                        if suffix and column.endswith(suffix)
+                    }
+                right_on = transform.right_on or transform.on or []
+                left_on = transform.left_on or transform.on or []
+                if transform.right_name in required_columns:
+                    required_columns[transform.right_name] = merge_columns(
+                        required_columns[transform.right_name],
+                        live_columns | {str(column) for column in right_on}
+                        if live_columns is not None
+                        else None,
+                    )
+                if live_columns is not None:
+                    live_columns |= {str(column) for column in left_on}
+            elif (
+                isinstance(transform, KeepColumns) and not transform.drop
+            ) or isinstance(transform, AggregateBy):
+                live_columns = set(read_columns)
+            elif isinstance(transform, RenameColumns):
+                if live_columns is not None:
+                    live_columns = live_columns | {
+                        column.parents[0].name
+                        for column in transform.to_schema.columns
+                        if len(column.parents) == 1 and column.name in live_columns
+                    }
+            elif (
+                live_columns is not None
+                and write_columns
+                and live_columns.isdisjoint(write_columns)
+            ):
+                dead_transforms.add(index)
+            elif read_columns is None:
+                live_columns = None
+            elif live_columns is not None:
+                live_columns = (live_columns - set(write_columns or [])) | set(
+                    read_columns
+                )
+
+        if len(self.required_stages_names) > 0:
+            required_columns[self.required_stages_names[0]] = merge_columns(
+                required_columns[self.required_stages_names[0]], live_columns
+            )
+        return (
+            sorted(output_columns) if output_columns is not None else None,
+            dead_transforms,
+            required_columns,
+        )
+
     def run(
         self,
         *,
         config: Config,
         environment: Environment,
         limit: int = None,
+        cache: Optional[DataFrameCache] = None,
+        profiler: Optional[Profiler] = None,
+        parent_hashes: Optional[List[int]] = None,
     ) -> "IngestionPipelineStage":
         """
         Run the stage.
@@ -130,24 +325,114 @@ class IngestionPipelineStage:
             config (Config): The config.
             environment (Environment): The environment.
             limit (int): The limit of the dataframe.
+            cache (Optional[DataFrameCache]): The cache of the checkpoints, not used
+                when the stage is partitioned.
+            profiler (Optional[Profiler]): The profiler of the stage.
+            parent_hashes (Optional[List[int]]): The hashes of the required stages,
+                used for the keys of the checkpoints. Defaults to None which hashes
+                the required stages.
+        """
+        if self.is_partitioned:
+            self.dataframe, self.errors = process_partitioned_dataframe(
+                **self.get_process_dataframe_arguments(
+                    config=config,
+                    environment=environment,
+                    limit=limit,
+                    profiler=profiler,
+                ),
+                partition_by=self.partition_by.name,
+                n_partitions=self.n_partitions,
+            )
+            return self
+        self.dataframe, self.errors = process_dataframe(
+            **self.get_process_dataframe_arguments(
+                config=config,
+                environment=environment,
+                limit=limit,
+                cache=cache,
+                profiler=profiler,
+                parent_hashes=parent_hashes,
+            )
+        )
+        return self
+
+    def release_inputs(self) -> None:
+        """
+        Drop the references of the joins to the parent dataframes, so that the parent
+        dataframes can be released once the stage is completed.
+        """
+        for transform in self.transforms:
+            if isinstance(transform, Join) and transform.right_name is not None:
+                transform.right = transform.right_name
+
+    def get_process_dataframe_arguments(
+        self,
+        *,
+        config: Config,
+        environment: Environment,
+        limit: int = None,
+        cache: Optional[DataFrameCache] = None,
+        profiler: Optional[Profiler] = None,
+        parent_hashes: Optional[List[int]] = None,
+    ) -> dict:
+        """
+        Resolve the inputs of the stage and build the arguments of process_dataframe.
+        The parent dataframes must already be computed. The returned arguments only hold
+        what the stage needs so they can be sent to another process.
+
+        Args:
+            config (Config): The config.
+            environment (Environment): The environment.
+            limit (int): The limit of the dataframe.
+            cache (Optional[DataFrameCache]): The cache of the checkpoints.
+                Defaults to None which disables the checkpoints.
+            profiler (Optional[Profiler]): The profiler of the stage.
+                Defaults to None which does not profile.
+            parent_hashes (Optional[List[int]]): The hashes of the required stages,
+                used for the keys of the checkpoints. Defaults to None which hashes
+                the required stages.
+
+        Returns:
+            dict: The keyword arguments of process_dataframe.
         """
         for transform in self.transforms:
             if isinstance(transform, Join):
                 for stage in self.required_stages:
-                    if stage.name == transform.right:
+                    if stage.name == transform.right_name:
                         transform.right = stage.dataframe
                         break
-        self.dataframe, self.errors = process_dataframe(
-            dataframe=self.required_stages[0].dataframe
+        assert self.incremental_filter is None or cache is None
+        checkpoint_keys = (
+            self.get_checkpoint_keys(parent_hashes) if cache is not None else {}
+        )
+        return {
+            "dataframe": self.required_stages[0].dataframe
             if len(self.required_stages) > 0
             else None,
-            load_dataframe_csv_path=self.load_dataframe_csv_path,
-            transforms=self.transforms,
-            conf=config,
-            env=environment,
-            limit=limit,
-        )
-        return self
+            "load_dataframe_csv_path": self.load_dataframe_csv_path,
+            "transforms": [self.incremental_filter, *self.planned_transforms]
+            if self.incremental_filter is not None
+            else self.planned_transforms,
+            "conf": config,
+            "env": environment,
+            "limit": limit,
+            "chunk_size": self.chunk_size,
+            "from_schema": self.from_schema
+            if self.load_dataframe_csv_path is not None
+            else None,
+            "output_columns": self.output_columns,
+            "profiler": profiler,
+            "backend": self.backend,
+            "stage_name": self.name,
+            "checkpoints": TransformCheckpoints(
+                cache=cache,
+                stage_name=self.name,
+                keys=checkpoint_keys,
+                cache_format=self.cache_format,
+            )
+            if cache is not None and len(checkpoint_keys) > 0
+            else None,
+        }
 
     def __get_slice_by_for_schema(self, schema: Schema) -> str:
         """
@@ -174,14 +459,26 @@ class IngestionPipelineStage:
         Returns:
             dict: The dictionary representation of the class.
         """
-        return {
+        stage_dict = {
             "name": self.name,
             "required_stages_names": tuple(self.required_stages_names),
             "load_dataframe_csv_path": self.load_dataframe_csv_path,
             "from_schema": self.from_schema.__class__.__name__,
             "to_schema": self.to_schema.__class__.__name__,
-            "transforms": [transform.to_dict() for transform in self.transforms],
+            "transforms": [
+                transform.to_dict() for transform in self.planned_transforms
+            ],
         }
+        if self.output_columns is not None:
+            stage_dict["output_columns"] = self.output_columns
+        if self.is_partitioned:
+            # the rows are ordered by partition
+            stage_dict["partition_by"] = self.partition_by.name
+            stage_dict["n_partitions"] = self.n_partitions
+        if self.backend != "pandas":
+            # the dtypes of the Polars results may differ
+            stage_dict["backend"] = self.backend
+        return stage_dict
 
     def __hash__(self) -> int:
         """
@@ -190,14 +487,97 @@ class IngestionPipelineStage:
         Returns:
             int: The hash of the class.
         """
-        parent_hashes = [hash(parent_stage) for parent_stage in self.required_stages]
+        return self.get_hash()
+
+    def get_hash(self, parent_hashes: Optional[List[int]] = None) -> int:
+        """
+        Get the hash of the stage from the hashes of its required stages, so that the
+        pipeline hashes every stage once instead of hashing the ancestors again.
+
+        Args:
+            parent_hashes (Optional[List[int]]): The hashes of the required stages in
+                order. Defaults to None which hashes the required stages.
+
+        Returns:
+            int: The hash of the stage.
+        """
+        # reduced like the value returned by __hash__, which is the cache key
+        return hash(self.__hash_with_parents(self.get_hash_dict(), parent_hashes))
+
+    def get_checkpoint_keys(
+        self, parent_hashes: Optional[List[int]] = None
+    ) -> Dict[int, int]:
+        """
+        Get the cache key of each Checkpoint transform. The key is a hash of the
+        transforms up to the checkpoint and of the parent stages, so changing a transform
+        after the checkpoint keeps the key.
+
+        Args:
+            parent_hashes (Optional[List[int]]): The hashes of the required stages in
+                order. Defaults to None which hashes the required stages.
+
+        Returns:
+            Dict[int, int]: The key of each checkpoint by index in the transforms list.
+        """
+        checkpoint_indexes = [
+            index
+            for index, transform in enumerate(self.planned_transforms)
+            if isinstance(transform, Checkpoint)
+        ]
+        if len(checkpoint_indexes) == 0:
+            return {}
+        stage_dict = self.get_hash_dict()
+        return {
+            index: self.__hash_with_parents(
+                {
+                    **stage_dict,
+                    "transforms": stage_dict["transforms"][: index + 1],
+                    "checkpoint": index,
+                },
+                parent_hashes,
+            )
+            for index in checkpoint_indexes
+        }
+
+    def get_hash_dict(self) -> dict:
+        """
+        Get the dictionary representation of the stage with the code version of the
+        transforms and the fingerprint of the csv to load, so that the stage is
+        recomputed when the code or the source file changes.
+
+        Returns:
+            dict: The hashed dictionary, without the hashes of the required stages.
+        """
+        stage_dict = self.to_dict()
+        stage_dict["transforms"] = [
+            {**transform_dict, "code_version": transform.get_code_version()}
+            for transform, transform_dict in zip(
+                self.planned_transforms, stage_dict["transforms"]
+            )
+        ]
+        if self.load_dataframe_csv_path is not None:
+            stage_dict["load_dataframe_csv_fingerprint"] = get_file_fingerprint(
+                self.load_dataframe_csv_path
+            )
+        return stage_dict
+
+    def __hash_with_parents(
+        self, stage_dict: dict, parent_hashes: Optional[List[int]] = None
+    ) -> int:
+        """
+        Hash the dictionary representation of the stage and add the hashes of the parents.
+        """
+        if parent_hashes is None:
+            parent_hashes = [
+                hash(parent_stage) for parent_stage in self.required_stages
+            ]
         hasher = new("sha256")
         dump = ""
 
         try:
-            dump = dumps(self.to_dict(), sort_keys=True).encode()
+            dump = dumps(stage_dict, sort_keys=True).encode()
         except TypeError as err:
-            print(f"{Fore.red}ERROR: {Style.reset} not serializable{self.to_dict()}")
+            print(f"{Fore.red}ERROR: {Style.reset} not serializable{stage_dict}")
             raise err
 
         hasher.update(dump)
@@ -222,3 +602,21 @@ class IngestionPipelineStage:
         print(
             f"{Fore.green}SUCCESS: {Style.reset} {self.name}'s Data integrity test has passed."
         )
+
+
+def merge_columns(
+    columns: Optional[Set[str]], other_columns: Optional[Set[str]]
+) -> Optional[Set[str]]:
+    """
+    Merge the columns read from a dataframe, None means that every column may be read.
+
+    Args:
+        columns (Optional[Set[str]]): The columns.
+        other_columns (Optional[Set[str]]): The other columns.
+
+    Returns:
+        Optional[Set[str]]: The union of the columns.
+    """
+    if columns is None or other_columns is None:
+        return None
+    return columns | other_columns
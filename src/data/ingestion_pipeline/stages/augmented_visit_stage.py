@@ -31,6 +31,7 @@ from src.data.transforms.calculated_fields.compute_first_visit_date import (
     ComputeFirstVisitDate,
 )
 from src.data.transforms.clean.rename_columns import RenameColumns
+from src.data.transforms.checkpoint.checkpoint import Checkpoint
 
 
 # pylint: disable=unused-argument
@@ -78,6 +79,7 @@ def build_augmented_visit_stage(
                 }
             ),
             ComputeCommuteDistance(),
+            Checkpoint(),
             ComputePeriodStart(period=conf.period_duration),
             ComputeStaticEmployeeTenure(),
             WasLateToVisitCalculatedField(),
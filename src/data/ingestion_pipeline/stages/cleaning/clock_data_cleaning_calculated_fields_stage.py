@@ -36,6 +36,7 @@ def build_clock_data_cleaning_calculated_fields_stage(
         from_schema=ClockSchemaRaw,
         to_schema=ClockSchema,
         config=conf,
+        chunk_size=500_000,
         load_dataframe_csv_path=path.join(env.data_dir, "clock_data.csv"),
         transforms=[
             RenameColumns(
@@ -14,14 +14,8 @@ from src.data.transforms.types.set_types_visit import SetTypesVisit
 from src.data.transforms.clean.keep_columns import KeepColumns
 from src.data.transforms.clean.value_must_equal import ValueMustEqual
 from src.data.transforms.clean.set_value_range import SetValueRange
-from src.data.transforms.calculated_fields.visit_data.sum_salary_per_visit import (
-    SumSalaryPerVisit,
-)
-from src.data.transforms.calculated_fields.visit_data.hourly_pay import (
-    HourlyPay,
-)
-from src.data.transforms.clean.visit_data.replace_invalid_computed_rate import (
-    ReplaceInvalidComputedRate,
+from src.data.transforms.calculated_fields.visit_data.compute_visit_pay import (
+    ComputeVisitPay,
 )
 from src.data.transforms.clean.rename_columns import RenameColumns
 from src.data.transforms.clean.visit_data.clean_service_description import (
@@ -31,6 +25,7 @@ from src.data.transforms.calculated_fields.work_hours_deviation_calculated_field
     WorkHoursDeviationCalculatedField,
 )
 from src.data.transforms.clean.remove_nan import RemoveNan
+from src.data.transforms.checkpoint.checkpoint import Checkpoint
 from src.data.ingestion_pipeline.ingestion_pipeline_stages import (
     IngestionPipelineStages,
 )
@@ -52,7 +47,9 @@ def build_visit_data_cleaning_calculated_fields_stage(
         from_schema=VisitSchemaRaw,
         to_schema=VisitSchema,
         config=conf,
+        chunk_size=500_000,
         load_dataframe_csv_path=path.join(env.data_dir, "visit_data.csv"),
+        watermark_column=VisitSchemaRaw.START_AT,
         transforms=[
             RenameColumns(
                 to_schema=VisitSchema,
@@ -126,9 +123,8 @@ def build_visit_data_cleaning_calculated_fields_stage(
                 max_value=50,
             ),
             CleanServiceDescription(column=VisitSchema.VISIT_SERVICE_DESCRIPTION),
-            ReplaceInvalidComputedRate(),
-            SumSalaryPerVisit(),
-            HourlyPay(),
+            Checkpoint(),
+            ComputeVisitPay(),
             WorkHoursDeviationCalculatedField(),
         ],
     )
@@ -2,6 +2,7 @@
 This module contains the EmployeeHistoryStage class which is responsible for
 """
 
+from pandas import Timedelta
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
 from src.data.ingestion_pipeline.ingestion_pipeline_stage import IngestionPipelineStage
@@ -29,6 +30,8 @@ def build_employee_history_aggregation_stage(
         from_schema=AugmentedVisitSchema,
         to_schema=EmployeeHistorySchema,
         config=conf,
+        cache_format="feather",
+        incremental_lookback=Timedelta(0),
         required_stages_names=[
             IngestionPipelineStages.AUGMENT_VISIT_STAGE,
         ],
@@ -1,6 +1,7 @@
 """
 This module contains the EmployeeHistoryStage class which is responsible for
 """
+from pandas import Timedelta
 from src.data.transforms.calculated_fields.compute_adl_completion_rate import (
     ComputeADLCompletionRate,
 )
@@ -40,6 +41,8 @@ def build_employee_history_calculated_fields_stage(
         from_schema=AugmentedVisitSchema,
         to_schema=EmployeeHistorySchema,
         config=conf,
+        cache_format="feather",
+        incremental_lookback=Timedelta(0),
         required_stages_names=[
             IngestionPipelineStages.EMPLOYEE_HISTORY_FILL_GAPS_STAGE,
         ],
@@ -2,6 +2,7 @@
 This module contains the EmployeeHistoryStage class which is responsible for
 """
 
+from pandas import Timedelta
 from src.data.transforms.clean.fill_gaps import FillGaps
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -29,6 +30,8 @@ def build_employee_history_fill_gaps_stage(
         from_schema=AugmentedVisitSchema,
         to_schema=EmployeeHistorySchema,
         config=conf,
+        cache_format="feather",
+        incremental_lookback=Timedelta(0),
         required_stages_names=[
             IngestionPipelineStages.EMPLOYEE_HISTORY_AGGREGATION_STAGE,
         ],
@@ -27,6 +27,7 @@ def build_employee_history_fill_na_stage(
         from_schema=AugmentedVisitSchema,
         to_schema=EmployeeHistorySchema,
         config=conf,
+        cache_format="feather",
         required_stages_names=[
             IngestionPipelineStages.EMPLOYEE_HISTORY_ROLLING_FEATURES_STAGE,
         ],
@@ -2,6 +2,7 @@
 This function builds the employee history stage of the ingestion pipeline.
 """
 
+from pandas import Timedelta
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
 from src.data.ingestion_pipeline.ingestion_pipeline_stage import IngestionPipelineStage
@@ -24,12 +25,16 @@ def build_employee_history_rolling_features_stage(
     """
     This function builds the employee history stage of the ingestion pipeline.
     """
+    window_size = 3
 
     return IngestionPipelineStage(
         name=IngestionPipelineStages.EMPLOYEE_HISTORY_ROLLING_FEATURES_STAGE,
         from_schema=AugmentedVisitSchema,
         to_schema=EmployeeHistorySchema,
         config=conf,
+        cache_format="feather",
+        # the rolling features of a period read the periods of the window before it
+        incremental_lookback=(window_size - 1) * Timedelta(conf.period_duration),
         required_stages_names=[
             IngestionPipelineStages.EMPLOYEE_HISTORY_CALCULATED_FIELDS_STAGE,
         ],
@@ -44,7 +49,7 @@ def build_employee_history_rolling_features_stage(
                             EmployeeHistorySchema.PERIOD_START,
                             EmployeeHistorySchema.VISIT_HOURS_PER_PERIOD,
                         ],
-                        "window_size": 3,
+                        "window_size": window_size,
                         "sub_name": "mean",
                     },
                     {
@@ -54,7 +59,7 @@ def build_employee_history_rolling_features_stage(
                             EmployeeHistorySchema.PERIOD_START,
                             EmployeeHistorySchema.VISIT_HOURS_PER_PERIOD,
                         ],
-                        "window_size": 3,
+                        "window_size": window_size,
                         "sub_name": "quantile_25",
                     },
                     {
@@ -64,7 +69,7 @@ def build_employee_history_rolling_features_stage(
                             EmployeeHistorySchema.PERIOD_START,
                             EmployeeHistorySchema.VISIT_HOURS_PER_PERIOD,
                         ],
-                        "window_size": 3,
+                        "window_size": window_size,
                         "sub_name": "quantile_50",
                     },
                     {
@@ -74,7 +79,7 @@ def build_employee_history_rolling_features_stage(
                             EmployeeHistorySchema.PERIOD_START,
                             EmployeeHistorySchema.VISIT_HOURS_PER_PERIOD,
                         ],
-                        "window_size": 3,
+                        "window_size": window_size,
                         "sub_name": "quantile_75",
                     },
                 ]
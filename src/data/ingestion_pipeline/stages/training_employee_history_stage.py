@@ -10,6 +10,9 @@ from src.data.transforms.clean.fill_na_transform import FillNaTransform, FillNaC
 from src.data.transforms.target_variable.generate_training_window_id import (
     GenerateTrainingWindowId,
 )
+from src.data.transforms.target_variable.generate_y_label_transform import (
+    LABEL_POLICY_COLUMNS,
+)
 from src.data.transforms.types.set_numerical_to_float64 import SetNumericalToFloat
 from src.data.ingestion_pipeline.ingestion_pipeline_stages import (
     IngestionPipelineStages,
@@ -35,6 +38,7 @@ def build_training_employee_history_stage(
         from_schema=EmployeeHistorySchema,
         to_schema=EmployeeHistorySchema,
         config=conf,
+        cache_format="feather",
         required_stages_names=[
             IngestionPipelineStages.EMPLOYEE_HISTORY_FILL_NA_STAGE,
             IngestionPipelineStages.Y_LABELS_GENERATION_STAGE,
@@ -54,10 +58,11 @@ def build_training_employee_history_stage(
             FillNaTransform(
                 columns=[
                     FillNaColumn(
-                        column=EmployeeHistorySchema.Y_LABEL,
+                        column=column,
                         fill_policy="fill_with_default",
                         fill_default_value=0,
-                    ),
+                    )
+                    for column in LABEL_POLICY_COLUMNS.values()
                 ],
             ),
             SetNumericalToFloat(),
@@ -82,7 +87,7 @@ def build_training_employee_history_stage(
                     EmployeeHistorySchema.EMPLOYEE_TENURE,
                     EmployeeHistorySchema.DAYS_TO_FIRST_VISIT,
                     EmployeeHistorySchema.TIMESNET_INFERENCE,
-                    EmployeeHistorySchema.Y_LABEL,
+                    *LABEL_POLICY_COLUMNS.values(),
                 ]
             ),
         ],
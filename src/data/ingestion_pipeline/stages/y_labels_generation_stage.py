@@ -12,6 +12,7 @@ from src.data.schema.status_schema import StatusSchemaRaw, StatusSchema
 from src.data.schema.y_label_schema import YLabelSchema
 from src.data.transforms.types.set_types_status import SetTypesStatus
 from src.data.transforms.target_variable.generate_y_label_transform import (
+    LABEL_POLICY_HORIZONS,
     GenerateYLabelTransform,
 )
 from src.data.ingestion_pipeline.ingestion_pipeline_stages import (
@@ -36,6 +37,9 @@ def build_y_labels_generation_stage(
         to_schema=YLabelSchema,
         config=conf,
         load_dataframe_csv_path=path.join(env.data_dir, "status_data.csv"),
+        watermark_column=StatusSchemaRaw.STATUS_START_DATE,
+        # the label of a period reads the statuses of the horizon after it
+        incremental_lookback=max(LABEL_POLICY_HORIZONS.values()),
         transforms=[
             RenameColumns(
                 to_schema=StatusSchema,
@@ -55,8 +59,9 @@ def build_y_labels_generation_stage(
                 min_value=conf.period_start,
                 max_value=conf.period_end,
             ),
+            # the label policy is selected by the data modules
             GenerateYLabelTransform(
-                label_policy=conf.label_policy,
+                label_policies=list(LABEL_POLICY_HORIZONS),
             ),
         ],
     )
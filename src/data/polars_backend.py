@@ -0,0 +1,174 @@
+"""
+This module is used to apply transforms on a Polars LazyFrame instead of a pandas
+dataframe.
+"""
+
+from typing import List, Optional, Tuple
+from pandas import DataFrame, Timedelta
+from pandas.tseries.frequencies import to_offset
+from src.data.error.error_dataframe import ErrorDataFrame
+from src.data.error.error_id import ErrorId
+from src.utility.configs.config import Config
+from src.utility.profiler import Profiler
+from src.data.transforms.transform import DataframeTransform
+
+try:
+    import polars
+except ImportError:  # polars is only needed by the polars backend
+    polars = None
+
+BACKENDS = ["pandas", "polars"]
+
+
+class PolarsQuery:
+    """
+    A lazy query built by the transforms which have a Polars implementation. The
+    consecutive transforms are fused into one query that is collected once, so that
+    Polars can run it on every core without the intermediate dataframes.
+
+    The rows that a transform filters out as errors are kept as queries sharing the
+    plan of the main query and are collected with it.
+
+    Args:
+        dataframe (DataFrame): The pandas dataframe the query starts from.
+    """
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        if polars is None:
+            raise ImportError("The polars backend needs the polars package.")
+        self.lazyframe = polars.from_pandas(dataframe).lazy()
+        self.error_queries: List[Tuple["polars.LazyFrame", ErrorId, str]] = []
+
+    def filter_with_errors(
+        self,
+        *,
+        keep: "polars.Expr",
+        error_condition: "polars.Expr",
+        error_id: ErrorId,
+        error: str,
+    ) -> "PolarsQuery":
+        """
+        Keep the rows matching a condition and record the rows matching the error
+        condition as errors. The null conditions are false, like the comparisons of the
+        missing values with pandas.
+
+        Args:
+            keep (polars.Expr): The condition of the rows to keep.
+            error_condition (polars.Expr): The condition of the rows in error.
+            error_id (ErrorId): The error id.
+            error (str): The error.
+
+        Returns:
+            PolarsQuery: The query.
+        """
+        self.error_queries.append(
+            (self.lazyframe.filter(error_condition.fill_null(False)), error_id, error)
+        )
+        self.lazyframe = self.lazyframe.filter(keep.fill_null(False))
+        return self
+
+    def collect(
+        self, errors: ErrorDataFrame, conf: Config
+    ) -> Tuple[DataFrame, ErrorDataFrame]:
+        """
+        Run the query and its error queries at once and convert the result to pandas.
+
+        Args:
+            errors (ErrorDataFrame): The errors to add the error rows to.
+            conf (Config): The config.
+
+        Returns:
+            Tuple[DataFrame, ErrorDataFrame]: The pandas dataframe and the errors.
+        """
+        dataframe, *error_dataframes = polars.collect_all(
+            [self.lazyframe, *[query for query, _, _ in self.error_queries]]
+        )
+        for error_dataframe, (_, error_id, error) in zip(
+            error_dataframes, self.error_queries
+        ):
+            error_dataframe = error_dataframe.to_pandas()
+            errors = errors.add_errors(
+                dataframe=error_dataframe,
+                idx=[True] * len(error_dataframe),
+                config=conf,
+                error_id=error_id,
+                error=error,
+            )
+        return dataframe.to_pandas(), errors
+
+
+class PolarsFusion:
+    """
+    The consecutive transforms with a Polars implementation fused into one query. The
+    query starts from the dataframe before the first of them and is collected before the
+    next pandas transform.
+
+    Args:
+        conf (Config): The config.
+        profiler (Optional[Profiler]): The profiler, the query is recorded as one step.
+    """
+
+    def __init__(self, *, conf: Config, profiler: Optional[Profiler]) -> None:
+        self.conf = conf
+        self.profiler = profiler
+        self.query: Optional[PolarsQuery] = None
+        self.started: Optional[dict] = None
+        self.transforms_names: List[str] = []
+
+    def add(self, transform: DataframeTransform, dataframe: DataFrame) -> None:
+        """
+        Add a transform to the query, which starts from the dataframe at the first
+        transform.
+
+        Args:
+            transform (DataframeTransform): The transform, which supports polars.
+            dataframe (DataFrame): The dataframe before the transform.
+        """
+        if self.query is None:
+            self.started = (
+                self.profiler.start(dataframe) if self.profiler is not None else None
+            )
+            self.query = PolarsQuery(dataframe)
+            self.transforms_names = []
+        self.query = transform.apply_polars(self.query, self.conf)
+        self.transforms_names.append(transform.__class__.__name__)
+
+    def collect(
+        self, dataframe: DataFrame, errors: ErrorDataFrame
+    ) -> Tuple[DataFrame, ErrorDataFrame]:
+        """
+        Collect the query of the fused transforms.
+
+        Args:
+            dataframe (DataFrame): The dataframe, returned as is when no transform is
+                fused.
+            errors (ErrorDataFrame): The errors before the query.
+
+        Returns:
+            Tuple[DataFrame, ErrorDataFrame]: The collected dataframe and the errors.
+        """
+        if self.query is None:
+            return dataframe, errors
+        dataframe, errors = self.query.collect(errors, self.conf)
+        if self.profiler is not None:
+            self.profiler.stop(
+                self.started,
+                step_name=f"polars({', '.join(self.transforms_names)})",
+                dataframe=dataframe,
+            )
+        self.query = None
+        return dataframe, errors
+
+
+def get_polars_duration(period: str) -> str:
+    """
+    Convert a fixed pandas frequency to a Polars duration, such as "7D" to "604800000000000ns".
+
+    Args:
+        period (str): The pandas frequency.
+
+    Returns:
+        str: The Polars duration in nanoseconds, which aligns the periods on the epoch
+            like the pandas floor.
+    """
+    return f"{Timedelta(to_offset(period)).value}ns"
@@ -2,14 +2,28 @@
 This module is used to process a dataframe
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from os import path
 from typing import List, Optional, Tuple
 from tqdm.autonotebook import tqdm
 from pandas import DataFrame, read_csv, concat
+from pandas.util import hash_pandas_object
 from src.utility.configs.config import Config
 from src.utility.environment import Environment
 from src.data.transforms.transform import DataframeTransform
 from src.data.error.error_dataframe import ErrorDataFrame
+from src.data.transforms.checkpoint.checkpoint import Checkpoint, TransformCheckpoints
+from src.data.read_schema_csv import (
+    get_read_csv_arguments,
+    get_used_columns,
+    read_schema_csv,
+    set_schema_datetimes,
+    set_schema_numerics,
+)
+from src.data.schema.schema import Schema
+from src.data.polars_backend import BACKENDS, PolarsFusion
+from src.utility.profiler import Profiler
 
 
 def process_dataframe(
@@ -20,6 +34,14 @@ def process_dataframe(
     conf: Config = None,
     env: Environment = None,
     limit: int = None,
+    checkpoints: Optional[TransformCheckpoints] = None,
+    chunk_size: Optional[int] = None,
+    from_schema: Optional[Schema] = None,
+    output_columns: Optional[List[str]] = None,
+    profiler: Optional[Profiler] = None,
+    backend: str = "pandas",
+    stage_name: Optional[str] = None,
+    errors_stream: int = 0,
 ) -> Tuple[DataFrame, ErrorDataFrame]:
     """
     This function is used to process a dataframe
@@ -31,6 +53,27 @@ def process_dataframe(
         conf (Config): The config.
         env (Environment): The environment
         limit (int): The number of rows to process
+        checkpoints (Optional[TransformCheckpoints]): The checkpoints of the transforms.
+            The processing resumes after the latest cached checkpoint and the dataframe
+            is cached at every Checkpoint transform.
+        chunk_size (Optional[int]): The number of rows of the chunks used to stream the
+            csv file through the leading row local transforms. Defaults to None which
+            loads the whole csv file at once.
+        from_schema (Optional[Schema]): The schema of the csv file. When it is given, the
+            csv file is read with the dtypes of the schema and only the columns used by
+            the transforms are read. Defaults to None which reads every column as is.
+        output_columns (Optional[List[str]]): The columns to keep in the processed
+            dataframe. Defaults to None which keeps every column.
+        profiler (Optional[Profiler]): The profiler recording the loading of the
+            dataframe and every transform. Defaults to None which does not profile.
+        backend (str): The backend applying the transforms, "pandas" or "polars". With
+            "polars", the consecutive transforms which have a Polars implementation are
+            fused into one lazy query, collected before the next pandas transform.
+            Defaults to "pandas".
+        stage_name (Optional[str]): The name of the stage, which seeds the sample of the
+            error examples. Defaults to None.
+        errors_stream (int): The stream of the error examples, the number of the
+            partition of a partitioned stage. Defaults to 0.
 
     Returns:
         Tuple[DataFrame, ErrorDataFrame]: The processed dataframe and the errors
@@ -38,30 +81,439 @@ def process_dataframe(
     assert dataframe is not None or load_dataframe_csv_path is not None
     assert conf is not None
     assert env is not None
+    assert backend in BACKENDS
 
-    if dataframe is None:
+    start_index, dataframe, errors = load_dataframe(
+        dataframe=dataframe,
+        load_dataframe_csv_path=load_dataframe_csv_path,
+        transforms=transforms or [],
+        conf=conf,
+        env=env,
+        limit=limit,
+        checkpoints=checkpoints,
+        chunk_size=chunk_size,
+        from_schema=from_schema,
+        profiler=profiler,
+        stage_name=stage_name,
+        errors_stream=errors_stream,
+    )
+
+    if transforms is not None:
+        fusion = PolarsFusion(conf=conf, profiler=profiler)
+        with tqdm(
+            total=len(transforms), initial=start_index, position=1, leave=False
+        ) as progress_bar:
+            for index in range(start_index, len(transforms)):
+                transform = transforms[index]
+                progress_bar.set_description(f"Applying {transform.__class__.__name__}")
+                if backend == "polars" and transform.supports_polars():
+                    fusion.add(transform, dataframe)
+                else:
+                    dataframe, errors = fusion.collect(dataframe, errors)
+                    dataframe, errors = apply_transform(
+                        transform,
+                        dataframe,
+                        errors,
+                        index=index,
+                        conf=conf,
+                        env=env,
+                        checkpoints=checkpoints,
+                        profiler=profiler,
+                    )
+                progress_bar.update(1)
+        dataframe, errors = fusion.collect(dataframe, errors)
+
+    if output_columns is not None:
+        dataframe = dataframe[
+            [column for column in dataframe.columns if column in output_columns]
+        ]
+    return dataframe, errors.compact()
+
+
+def load_dataframe(
+    *,
+    dataframe: Optional[DataFrame],
+    load_dataframe_csv_path: path,
+    transforms: List[DataframeTransform],
+    conf: Config,
+    env: Environment,
+    limit: Optional[int],
+    checkpoints: Optional[TransformCheckpoints],
+    chunk_size: Optional[int],
+    from_schema: Optional[Schema],
+    profiler: Optional[Profiler],
+    stage_name: Optional[str],
+    errors_stream: int,
+) -> Tuple[int, DataFrame, ErrorDataFrame]:
+    """
+    This function is used to get the dataframe to apply the transforms to. It is resumed
+    from the latest checkpoint, streamed from the csv file through the leading row local
+    transforms, read from the csv file or given
+
+    Args:
+        dataframe (Optional[DataFrame]): The given dataframe
+        load_dataframe_csv_path (os.path): The path to the csv file to load
+        transforms (List[DataframeTransform]): The transforms to apply to the dataframe
+        conf (Config): The config.
+        env (Environment): The environment
+        limit (Optional[int]): The number of rows to process
+        checkpoints (Optional[TransformCheckpoints]): The checkpoints of the transforms
+        chunk_size (Optional[int]): The number of rows of the streamed chunks
+        from_schema (Optional[Schema]): The schema of the csv file
+        profiler (Optional[Profiler]): The profiler recording the loading step
+        stage_name (Optional[str]): The name of the stage
+        errors_stream (int): The stream of the error examples
+
+    Returns:
+        Tuple[int, DataFrame, ErrorDataFrame]: The index of the first transform left to
+            apply, the dataframe and the errors
+    """
+    started = profiler.start(dataframe) if profiler is not None else None
+    start_index = 0
+    step_name = "load_csv" if dataframe is None else None
+    latest_checkpoint = checkpoints.load_latest() if checkpoints is not None else None
+    if latest_checkpoint is not None:
+        checkpoint_index, dataframe, errors = latest_checkpoint
+        start_index = checkpoint_index + 1
+        step_name = "load_checkpoint"
+    elif dataframe is None and chunk_size is not None and not conf.is_test_run:
+        start_index = get_row_local_prefix_length(transforms)
+        streamed_transforms_names = ", ".join(
+            transform.__class__.__name__ for transform in transforms[:start_index]
+        )
+        step_name = f"stream_csv({streamed_transforms_names})"
+        dataframe, errors = stream_csv(
+            load_dataframe_csv_path=load_dataframe_csv_path,
+            transforms=transforms[:start_index],
+            conf=conf,
+            env=env,
+            stage_name=stage_name,
+            limit=limit,
+            chunk_size=chunk_size,
+            from_schema=from_schema,
+        )
+    else:
+        if dataframe is None:
+            dataframe = read_dataframe_csv(
+                load_dataframe_csv_path,
+                transforms=transforms,
+                conf=conf,
+                limit=limit,
+                from_schema=from_schema,
+            )
+        errors = ErrorDataFrame(
+            dataframe, config=conf, stage_name=stage_name, stream=errors_stream
+        )
+    if profiler is not None and step_name is not None:
+        profiler.stop(started, step_name=step_name, dataframe=dataframe)
+    return start_index, dataframe, errors
+
+
+def read_dataframe_csv(
+    load_dataframe_csv_path: path,
+    *,
+    transforms: List[DataframeTransform],
+    conf: Config,
+    limit: Optional[int],
+    from_schema: Optional[Schema],
+) -> DataFrame:
+    """
+    This function is used to read the whole csv file. A test run reads its rows twice,
+    the second time with other ids
+
+    Args:
+        load_dataframe_csv_path (os.path): The path to the csv file to load
+        transforms (List[DataframeTransform]): The transforms, only the columns they use
+            are read with a schema
+        conf (Config): The config.
+        limit (Optional[int]): The number of rows to keep
+        from_schema (Optional[Schema]): The schema of the csv file
+
+    Returns:
+        DataFrame: The dataframe
+    """
+    if from_schema is not None:
+        dataframe = read_schema_csv(
+            load_dataframe_csv_path,
+            schema=from_schema,
+            columns=get_used_columns(from_schema, transforms),
+        )
+    else:
         dataframe = read_csv(
             load_dataframe_csv_path, encoding="utf-8", low_memory=False
         )
 
-        if conf.is_test_run:
-            dataframe_copy = dataframe.copy()
-            for column in dataframe_copy.columns:
-                if "_ID" in column:
-                    offset = max(dataframe_copy[column].unique()) + 1
-                    dataframe_copy[column].add(offset)
+    if conf.is_test_run:
+        dataframe_copy = dataframe.copy()
+        for column in dataframe_copy.columns:
+            if "_ID" in column:
+                offset = max(dataframe_copy[column].unique()) + 1
+                dataframe_copy[column].add(offset)
 
-            dataframe = concat([dataframe, dataframe_copy], ignore_index=True)
+        dataframe = concat([dataframe, dataframe_copy], ignore_index=True)
 
-        if limit is not None:
-            dataframe = dataframe.head(limit)
-    errors = ErrorDataFrame(dataframe, config=conf)
+    if limit is not None:
+        dataframe = dataframe.head(limit)
+    return dataframe
 
-    if transforms is not None:
-        with tqdm(total=len(transforms), position=1, leave=False) as progress_bar:
-            for transform in transforms:
-                progress_bar.set_description(f"Applying {transform.__class__.__name__}")
-                dataframe, errors = transform(dataframe, errors, conf, env)
-                progress_bar.update(1)
 
+def apply_transform(
+    transform: DataframeTransform,
+    dataframe: DataFrame,
+    errors: ErrorDataFrame,
+    *,
+    index: int,
+    conf: Config,
+    env: Environment,
+    checkpoints: Optional[TransformCheckpoints],
+    profiler: Optional[Profiler],
+) -> Tuple[DataFrame, ErrorDataFrame]:
+    """
+    This function is used to apply a transform with pandas, profile it and save the
+    dataframe when the transform is a checkpoint
+
+    Args:
+        transform (DataframeTransform): The transform
+        dataframe (DataFrame): The dataframe
+        errors (ErrorDataFrame): The errors
+        index (int): The index of the transform
+        conf (Config): The config.
+        env (Environment): The environment
+        checkpoints (Optional[TransformCheckpoints]): The checkpoints of the transforms
+        profiler (Optional[Profiler]): The profiler recording the transform
+
+    Returns:
+        Tuple[DataFrame, ErrorDataFrame]: The transformed dataframe and the errors
+    """
+    started = profiler.start(dataframe) if profiler is not None else None
+    dataframe, errors = transform(dataframe, errors, conf, env)
+    if profiler is not None:
+        profiler.stop(
+            started,
+            step_name=transform.__class__.__name__,
+            dataframe=dataframe,
+        )
+    if checkpoints is not None and isinstance(transform, Checkpoint):
+        checkpoints.save(index, dataframe, errors)
     return dataframe, errors
+
+
+def process_partitioned_dataframe(
+    *,
+    dataframe: DataFrame = None,
+    partition_by: str = None,
+    n_partitions: int = None,
+    transforms: Optional[List[DataframeTransform]] = None,
+    conf: Config = None,
+    env: Environment = None,
+    output_columns: Optional[List[str]] = None,
+    profiler: Optional[Profiler] = None,
+    **arguments,
+) -> Tuple[DataFrame, ErrorDataFrame]:
+    """
+    This function is used to process a dataframe by partitions. The rows are split in
+    partitions by the hash of the partition column, so that all the rows with the same
+    value are in the same partition. The partitions are processed at the same time in a
+    process pool and concatenated in the partition order.
+
+    Args:
+        dataframe (DataFrame): The dataframe to process
+        partition_by (str): The partition column, every transform must be able to be
+            applied to the partitions by this column.
+        n_partitions (int): The number of partitions and of processes.
+        transforms (Optional[List[DataframeTransform]]): The transforms to apply to each
+            partition
+        conf (Config): The config.
+        env (Environment): The environment
+        output_columns (Optional[List[str]]): The columns to keep in the processed
+            dataframe. Defaults to None which keeps every column.
+        profiler (Optional[Profiler]): The profiler recording the transforms of every
+            partition. Defaults to None which does not profile.
+        arguments: The other arguments of process_dataframe, without checkpoints.
+
+    Returns:
+        Tuple[DataFrame, ErrorDataFrame]: The processed dataframe and the errors
+    """
+    assert dataframe is not None
+    assert partition_by is not None
+    assert n_partitions > 0
+    assert arguments.get("checkpoints") is None
+    for transform in transforms or []:
+        if not transform.can_partition_by(partition_by):
+            raise ValueError(
+                f"{transform.__class__.__name__} can not be applied to the partitions"
+                + f" by {partition_by}"
+            )
+
+    partitions = [
+        partition
+        for partition in get_partitions(
+            dataframe, partition_by=partition_by, n_partitions=n_partitions
+        )
+        if len(partition) > 0
+    ] or [dataframe]
+    with ProcessPoolExecutor(max_workers=n_partitions) as executor:
+        futures = [
+            executor.submit(
+                process_partition,
+                dataframe=partition,
+                transforms=transforms,
+                conf=conf,
+                env=env,
+                output_columns=output_columns,
+                profiler=deepcopy(profiler),
+                errors_stream=partition_number,
+                **arguments,
+            )
+            for partition_number, partition in enumerate(partitions)
+        ]
+        results = [future.result() for future in futures]
+
+    if profiler is not None:
+        for _, _, partition_profiler in results:
+            profiler.records.extend(partition_profiler.records)
+    return (
+        concat([partition for partition, _, _ in results], ignore_index=True),
+        ErrorDataFrame.concat([errors for _, errors, _ in results]),
+    )
+
+
+def get_partitions(
+    dataframe: DataFrame, *, partition_by: str, n_partitions: int
+) -> List[DataFrame]:
+    """
+    This function is used to split a dataframe in partitions by the hash of a column
+
+    Args:
+        dataframe (DataFrame): The dataframe to split
+        partition_by (str): The partition column
+        n_partitions (int): The number of partitions
+
+    Returns:
+        List[DataFrame]: The partitions, in the order of the dataframe and with a new index
+    """
+    partition_ids = (
+        hash_pandas_object(dataframe[partition_by], index=False).to_numpy()
+        % n_partitions
+    )
+    return [
+        dataframe[partition_ids == partition_id].reset_index(drop=True)
+        for partition_id in range(n_partitions)
+    ]
+
+
+def process_partition(
+    **arguments,
+) -> Tuple[DataFrame, ErrorDataFrame, Optional[Profiler]]:
+    """
+    Run process_dataframe on a partition in a worker process and send back the profiler
+    with the dataframe, its records are filled in the worker process.
+
+    Returns:
+        Tuple[DataFrame, ErrorDataFrame, Optional[Profiler]]: The processed partition, the
+            errors and the profiler.
+    """
+    dataframe, errors = process_dataframe(**arguments)
+    return dataframe, errors, arguments.get("profiler")
+
+
+def get_row_local_prefix_length(transforms: List[DataframeTransform]) -> int:
+    """
+    This function is used to get the number of leading row local transforms
+
+    Args:
+        transforms (List[DataframeTransform]): The transforms
+
+    Returns:
+        int: The number of transforms before the first one that needs the whole dataframe
+    """
+    for index, transform in enumerate(transforms):
+        if not transform.row_local:
+            return index
+    return len(transforms)
+
+
+def stream_csv(
+    *,
+    load_dataframe_csv_path: path,
+    transforms: List[DataframeTransform],
+    conf: Config,
+    env: Environment,
+    limit: int = None,
+    chunk_size: int,
+    from_schema: Optional[Schema] = None,
+    stage_name: Optional[str] = None,
+) -> Tuple[DataFrame, ErrorDataFrame]:
+    """
+    This function is used to read a csv file by chunks and apply row local transforms to
+    each chunk, so that only the transformed chunks are held in memory
+
+    Args:
+        load_dataframe_csv_path (os.path): The path to the csv file to load
+        transforms (List[DataframeTransform]): The row local transforms to apply
+        conf (Config): The config.
+        env (Environment): The environment
+        limit (int): The number of rows to process
+        chunk_size (int): The number of rows of the chunks
+        from_schema (Optional[Schema]): The schema of the csv file
+        stage_name (Optional[str]): The name of the stage, which seeds the sample of the
+            error examples with the number of each chunk
+
+    Returns:
+        Tuple[DataFrame, ErrorDataFrame]: The concatenated chunks and errors
+    """
+    assert chunk_size > 0
+    assert all(transform.row_local for transform in transforms)
+
+    dataframes = []
+    errors = []
+    n_rows = 0
+    read_csv_arguments = (
+        get_read_csv_arguments(
+            load_dataframe_csv_path,
+            schema=from_schema,
+            columns=get_used_columns(from_schema, transforms),
+            # a chunk with invalid numeric values would fail the whole read
+            numeric_dtypes=False,
+        )
+        if from_schema is not None
+        else {}
+    )
+    with read_csv(
+        load_dataframe_csv_path,
+        encoding="utf-8",
+        low_memory=False,
+        chunksize=chunk_size,
+        **read_csv_arguments,
+    ) as reader:
+        for chunk_number, chunk in enumerate(reader):
+            if from_schema is not None:
+                chunk = set_schema_numerics(chunk, schema=from_schema)
+                chunk = set_schema_datetimes(chunk, schema=from_schema)
+            if limit is not None:
+                chunk = chunk.head(limit - n_rows)
+            n_rows += len(chunk)
+
+            chunk_errors = ErrorDataFrame(
+                chunk, config=conf, stage_name=stage_name, stream=chunk_number
+            )
+            for transform in transforms:
+                chunk, chunk_errors = transform(chunk, chunk_errors, conf, env)
+            dataframes.append(chunk)
+            errors.append(chunk_errors.compact())
+
+            if limit is not None and n_rows >= limit:
+                break
+
+    if len(dataframes) == 0:
+        return process_dataframe(
+            load_dataframe_csv_path=load_dataframe_csv_path,
+            transforms=transforms,
+            conf=conf,
+            env=env,
+            limit=limit,
+            from_schema=from_schema,
+            stage_name=stage_name,
+        )
+
+    return concat(dataframes), ErrorDataFrame.concat(errors)
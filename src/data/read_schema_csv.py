@@ -0,0 +1,292 @@
+"""
+This module is used to read a csv file with the types and the columns of its schema
+"""
+
+from os import path
+from typing import Dict, List, Optional
+from numpy import dtype as numpy_dtype, nan
+from pandas import DataFrame, read_csv, to_datetime, to_numeric
+from pandas.api.types import is_datetime64_any_dtype, is_object_dtype
+from pyarrow import ArrowInvalid, DataType, Table, from_numpy_dtype, string
+from pyarrow import csv
+from src.data.schema.schema import Schema
+from src.data.transforms.transform import DataframeTransform
+from src.data.transforms.clean.keep_columns import KeepColumns
+from src.data.transforms.clean.rename_columns import RenameColumns
+
+
+def get_used_columns(
+    schema: Schema, transforms: List[DataframeTransform]
+) -> Optional[List[str]]:
+    """
+    This function is used to get the columns of the schema that the transforms use. The
+    columns are the ones kept by the first KeepColumns and the ones read by the transforms
+    before it, renamed back to the names of the schema.
+
+    Args:
+        schema (Schema): The schema of the csv file
+        transforms (List[DataframeTransform]): The transforms applied to the csv file
+
+    Returns:
+        Optional[List[str]]: The names of the used columns or None if every column may
+            be used
+    """
+    renamed_columns: Dict[str, str] = {}
+    used_columns = set()
+    for transform in transforms:
+        if isinstance(transform, KeepColumns) and not transform.drop:
+            used_columns.update(transform.get_read_columns())
+            break
+
+        read_columns = transform.get_read_columns()
+        if read_columns is None:
+            return None
+        used_columns.update(read_columns)
+
+        if isinstance(transform, RenameColumns):
+            for column in transform.to_schema.columns:
+                if len(column.parents) == 1:
+                    renamed_columns[column.name] = column.parents[0].name
+    else:
+        return None
+
+    used_columns = {renamed_columns.get(column, column) for column in used_columns}
+    return [column.name for column in schema.columns if column.name in used_columns]
+
+
+def get_read_csv_arguments(
+    load_dataframe_csv_path: path,
+    *,
+    schema: Schema,
+    columns: Optional[List[str]] = None,
+    numeric_dtypes: bool = True,
+) -> dict:
+    """
+    This function is used to get the arguments of pandas.read_csv from the schema
+
+    Args:
+        load_dataframe_csv_path (os.path): The path to the csv file to load
+        schema (Schema): The schema of the csv file
+        columns (Optional[List[str]]): The columns to read. Defaults to None which reads
+            every column
+        numeric_dtypes (bool): Whether the numeric columns are parsed with the dtypes of
+            the schema, which fails on the invalid values. When False their dtypes are
+            inferred and set_schema_numerics converts them. Defaults to True
+
+    Returns:
+        dict: The usecols and the dtype arguments
+    """
+    header = read_csv(load_dataframe_csv_path, encoding="utf-8", nrows=0).columns
+    return {
+        "usecols": [column for column in columns if column in header]
+        if columns is not None
+        else None,
+        "dtype": {
+            column.name: column.dtype
+            for column in schema.columns
+            if column.dtype is not None
+            and column.name in header
+            and (columns is None or column.name in columns)
+            and (numeric_dtypes or not is_numeric_schema_dtype(column.dtype))
+        },
+    }
+
+
+def read_schema_csv(
+    load_dataframe_csv_path: path,
+    *,
+    schema: Schema,
+    columns: Optional[List[str]] = None,
+) -> DataFrame:
+    """
+    This function is used to read a csv file with the multithreaded Arrow reader. Only the
+    columns are parsed, with the dtypes of the schema, and the datetime columns of the
+    schema are converted to datetimes. The missing values are NaN as with pandas.read_csv.
+    When a numeric column has invalid values, the numeric columns are read again as
+    strings and the invalid values become NaN.
+
+    Args:
+        load_dataframe_csv_path (os.path): The path to the csv file to load
+        schema (Schema): The schema of the csv file
+        columns (Optional[List[str]]): The columns to read. Defaults to None which reads
+            every column
+
+    Returns:
+        DataFrame: The dataframe
+    """
+    read_csv_arguments = get_read_csv_arguments(
+        load_dataframe_csv_path, schema=schema, columns=columns
+    )
+    column_types = {
+        column: get_arrow_type(column_dtype)
+        for column, column_dtype in read_csv_arguments["dtype"].items()
+    }
+    try:
+        table = read_arrow_csv(
+            load_dataframe_csv_path,
+            columns=read_csv_arguments["usecols"],
+            column_types=column_types,
+        )
+    except ArrowInvalid:
+        # numeric columns with invalid values
+        table = read_arrow_csv(
+            load_dataframe_csv_path,
+            columns=read_csv_arguments["usecols"],
+            column_types={column: string() for column in column_types},
+        )
+    try:
+        dataframe = table.to_pandas()
+    except ArrowInvalid:
+        # timestamps out of the pandas bounds
+        dataframe = table.to_pandas(timestamp_as_object=True)
+
+    for column in dataframe.columns:
+        if is_object_dtype(dataframe[column]):
+            dataframe[column] = dataframe[column].fillna(nan)
+
+    dataframe = set_schema_numerics(dataframe, schema=schema)
+    return set_schema_datetimes(dataframe, schema=schema)
+
+
+def read_arrow_csv(
+    load_dataframe_csv_path: path,
+    *,
+    columns: Optional[List[str]],
+    column_types: Dict[str, DataType],
+) -> Table:
+    """
+    This function is used to read a csv file with the multithreaded Arrow reader
+
+    Args:
+        load_dataframe_csv_path (os.path): The path to the csv file to load
+        columns (Optional[List[str]]): The columns to read, None reads every column
+        column_types (Dict[str, DataType]): The Arrow types of the columns
+
+    Returns:
+        Table: The Arrow table
+    """
+    return csv.read_csv(
+        load_dataframe_csv_path,
+        convert_options=csv.ConvertOptions(
+            include_columns=columns,
+            column_types=column_types,
+            strings_can_be_null=True,
+        ),
+    )
+
+
+def set_schema_numerics(dataframe: DataFrame, *, schema: Schema) -> DataFrame:
+    """
+    This function is used to convert the numeric columns of the schema that were not
+    parsed with their dtypes, the invalid values become NaN
+
+    Args:
+        dataframe (DataFrame): The dataframe
+        schema (Schema): The schema of the dataframe
+
+    Returns:
+        DataFrame: The dataframe
+    """
+    for column in schema.columns:
+        if (
+            column.dtype is not None
+            and is_numeric_schema_dtype(column.dtype)
+            and column.name in dataframe.columns
+            and dataframe[column.name].dtype != column.dtype
+        ):
+            values = to_numeric(dataframe[column.name], errors="coerce")
+            if numpy_dtype(column.dtype).kind == "f":
+                values = values.astype(column.dtype)
+            dataframe[column.name] = values
+    return dataframe
+
+
+def set_schema_datetimes(dataframe: DataFrame, *, schema: Schema) -> DataFrame:
+    """
+    This function is used to convert the datetime columns of the schema that were not
+    parsed as datetimes, the invalid values become NaT
+
+    Args:
+        dataframe (DataFrame): The dataframe
+        schema (Schema): The schema of the dataframe
+
+    Returns:
+        DataFrame: The dataframe
+    """
+    for column in schema.columns:
+        if (
+            column.is_datetime
+            and column.name in dataframe.columns
+            and not is_datetime64_any_dtype(dataframe[column.name])
+        ):
+            dataframe[column.name] = to_datetime(
+                dataframe[column.name], errors="coerce"
+            )
+    return dataframe
+
+
+def set_schema_dtypes(
+    dataframe: DataFrame,
+    *,
+    schema: Schema,
+    datetime_arguments: Optional[Dict[str, dict]] = None,
+) -> DataFrame:
+    """
+    This function is used to cast the columns of the schema to their dtypes. The columns
+    that cannot be cast, such as integer columns with NaN, keep their dtypes. The datetime
+    columns are converted to datetimes and their invalid values become NaT
+
+    Args:
+        dataframe (DataFrame): The dataframe
+        schema (Schema): The schema of the dataframe
+        datetime_arguments (Optional[Dict[str, dict]]): The arguments of
+            pandas.to_datetime by datetime column, such as utc or format. Defaults to None
+
+    Returns:
+        DataFrame: The dataframe
+    """
+    datetime_arguments = datetime_arguments if datetime_arguments else {}
+    for column in schema.columns:
+        if column.name not in dataframe.columns:
+            continue
+        if column.is_datetime:
+            dataframe[column.name] = to_datetime(
+                dataframe[column.name],
+                errors="coerce",
+                **datetime_arguments.get(column.name, {}),
+            )
+        elif column.dtype is not None:
+            dataframe[column.name] = dataframe[column.name].astype(
+                column.dtype, errors="ignore"
+            )
+    return dataframe
+
+
+def is_numeric_schema_dtype(column_dtype: str) -> bool:
+    """
+    This function is used to know if a dtype of a schema is numeric
+
+    Args:
+        column_dtype (str): The pandas dtype
+
+    Returns:
+        bool: Whether the dtype is numeric
+    """
+    return column_dtype not in ["str", "string", "object"] and numpy_dtype(
+        column_dtype
+    ).kind in ["b", "i", "u", "f"]
+
+
+def get_arrow_type(column_dtype: str) -> DataType:
+    """
+    This function is used to get the Arrow type of a pandas dtype
+
+    Args:
+        column_dtype (str): The pandas dtype
+
+    Returns:
+        DataType: The Arrow type
+    """
+    if column_dtype in ["str", "string", "object"]:
+        return string()
+    return from_numpy_dtype(numpy_dtype(column_dtype))
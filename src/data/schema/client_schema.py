@@ -13,16 +13,16 @@ class _ClientSchemaRaw(Schema):
 
     CLIENT_ID = SchemaColumn(name="CLIENT_ID")
     AGE = SchemaColumn(name="AGE")
-    ADMISSION_DATE = SchemaColumn(name="ADMISSION_DATE")
-    DISCHARGE_DATE = SchemaColumn(name="DISCHARGE_DATE")
-    PREFERRED_LANGUAGE = SchemaColumn(name="PREFERRED_LANGUAGE")
+    ADMISSION_DATE = SchemaColumn(name="ADMISSION_DATE", is_datetime=True)
+    DISCHARGE_DATE = SchemaColumn(name="DISCHARGE_DATE", is_datetime=True)
+    PREFERRED_LANGUAGE = SchemaColumn(name="PREFERRED_LANGUAGE", dtype="str")
     LENGTH_OF_STAY = SchemaColumn(name="LENGTH_OF_STAY")
     HAS_ADLS = SchemaColumn(name="HAS_ADLS")
-    COUNTRY = SchemaColumn(name="COUNTRY")
-    GENDER = SchemaColumn(name="GENDER")
-    LATITUDE = SchemaColumn(name="latitute")
-    LONGITUDE = SchemaColumn(name="longitude")
-    DIAGNOSIS = SchemaColumn(name="DIAGNOSIS")
+    COUNTRY = SchemaColumn(name="COUNTRY", dtype="str")
+    GENDER = SchemaColumn(name="GENDER", dtype="str")
+    LATITUDE = SchemaColumn(name="latitute", dtype="float64")
+    LONGITUDE = SchemaColumn(name="longitude", dtype="float64")
+    DIAGNOSIS = SchemaColumn(name="DIAGNOSIS", dtype="str")
 
 
 ClientSchemaRaw = _ClientSchemaRaw()
@@ -13,8 +13,8 @@ class _ClockSchemaRaw(Schema):
 
     VISIT_ID = SchemaColumn(name="VISIT_ID")
     PUNCH_ID = SchemaColumn(name="PUNCH_ID")
-    START_TIME = SchemaColumn(name="START_TIME")
-    END_TIME = SchemaColumn(name="END_TIME")
+    START_TIME = SchemaColumn(name="START_TIME", is_datetime=True)
+    END_TIME = SchemaColumn(name="END_TIME", is_datetime=True)
 
 
 ClockSchemaRaw = _ClockSchemaRaw()
@@ -175,6 +175,26 @@ class _EmployeeHistorySchema(Schema):
         parents=[YLabelSchema.Y_LABEL],
         feature_type=FeatureType.TRAINING_RELATED,
     )
+    Y_LABEL_7_DAYS = SchemaColumn(
+        name="Y_LABEL_7_DAYS",
+        parents=[YLabelSchema.Y_LABEL_7_DAYS],
+        feature_type=FeatureType.TRAINING_RELATED,
+    )
+    Y_LABEL_30_DAYS = SchemaColumn(
+        name="Y_LABEL_30_DAYS",
+        parents=[YLabelSchema.Y_LABEL_30_DAYS],
+        feature_type=FeatureType.TRAINING_RELATED,
+    )
+    Y_LABEL_60_DAYS = SchemaColumn(
+        name="Y_LABEL_60_DAYS",
+        parents=[YLabelSchema.Y_LABEL_60_DAYS],
+        feature_type=FeatureType.TRAINING_RELATED,
+    )
+    Y_LABEL_90_DAYS = SchemaColumn(
+        name="Y_LABEL_90_DAYS",
+        parents=[YLabelSchema.Y_LABEL_90_DAYS],
+        feature_type=FeatureType.TRAINING_RELATED,
+    )
 
 
 EmployeeHistorySchema = _EmployeeHistorySchema(
@@ -14,11 +14,11 @@ class _EmployeeSchemaRaw(Schema):
     EMPLOYEE_ID = SchemaColumn(name="EMPLOYEE_ID")
     STATUS = SchemaColumn(name="STATUS")
     HAS_SKILLS = SchemaColumn(name="HAS_SKILLS")
-    COUNTRY = SchemaColumn(name="COUNTRY")
-    GENDER = SchemaColumn(name="GENDER")
-    JOB_TITLE = SchemaColumn(name="JOB_TITLE")
+    COUNTRY = SchemaColumn(name="COUNTRY", dtype="str")
+    GENDER = SchemaColumn(name="GENDER", dtype="str")
+    JOB_TITLE = SchemaColumn(name="JOB_TITLE", dtype="str")
     START_ON = SchemaColumn(name="START_ON")
-    STATE = SchemaColumn(name="STATE")
+    STATE = SchemaColumn(name="STATE", dtype="str")
     TERMINATION_DATE = SchemaColumn(name="TERMINATION_DATE")
     USER_SETTINGS_STAFFING_EMPLOYEE_POSITION_TYPE = SchemaColumn(
         name="USER_SETTINGS:STAFFING_EMPLOYEE_POSITION_TYPE",
@@ -36,10 +36,10 @@ class _EmployeeSchemaRaw(Schema):
     EMPLOYEE_MAXIMUM_WEEKLY_CAPACITY = SchemaColumn(
         name="EMPLOYEE_MAXIMUM_WEEKLY_CAPACITY"
     )
-    LANGUAGE = SchemaColumn(name="LANGUAGE")
+    LANGUAGE = SchemaColumn(name="LANGUAGE", dtype="str")
     AGE = SchemaColumn(name="age")
-    LATITUDE = SchemaColumn(name="latitute")
-    LONGITUDE = SchemaColumn(name="longitude")
+    LATITUDE = SchemaColumn(name="latitute", dtype="float64")
+    LONGITUDE = SchemaColumn(name="longitude", dtype="float64")
 
 
 EmployeeSchemaRaw = _EmployeeSchemaRaw()
@@ -49,31 +49,37 @@ class _EmployeeSchema(Schema):
     EMPLOYEE_ID = SchemaColumn(
         name="EMPLOYEE_ID",
         parents=[EmployeeSchemaRaw.EMPLOYEE_ID],
+        dtype="int64",
     )
 
     EMPLOYEE_STATUS = SchemaColumn(
         name="EMPLOYEE_STATUS",
         parents=[EmployeeSchemaRaw.STATUS],
+        dtype="int64",
     )
 
     EMPLOYEE_HAS_SKILLS = SchemaColumn(
         name="EMPLOYEE_HAS_SKILLS",
         parents=[EmployeeSchemaRaw.HAS_SKILLS],
+        dtype="int64",
     )
 
     EMPLOYEE_COUNTRY = SchemaColumn(
         name="EMPLOYEE_COUNTRY",
         parents=[EmployeeSchemaRaw.COUNTRY],
+        dtype="str",
     )
 
     EMPLOYEE_GENDER = SchemaColumn(
         name="EMPLOYEE_GENDER",
         parents=[EmployeeSchemaRaw.GENDER],
+        dtype="str",
     )
 
     EMPLOYEE_JOB_TITLE = SchemaColumn(
         name="EMPLOYEE_JOB_TITLE",
         parents=[EmployeeSchemaRaw.JOB_TITLE],
+        dtype="str",
     )
 
     EMPLOYEE_START_ON = SchemaColumn(
@@ -85,6 +91,7 @@ class _EmployeeSchema(Schema):
     EMPLOYEE_STATE = SchemaColumn(
         name="EMPLOYEE_STATE",
         parents=[EmployeeSchemaRaw.STATE],
+        dtype="str",
     )
 
     EMPLOYEE_TERMINATION_DATE = SchemaColumn(
@@ -96,46 +103,55 @@ class _EmployeeSchema(Schema):
     EMPLOYEE_AVAILABILITY = SchemaColumn(
         name="EMPLOYEE_AVAILABILITY",
         parents=[EmployeeSchemaRaw.EMPLOYEE_AVAILABILITY],
+        dtype="str",
     )
 
     EMPLOYEE_LANGUAGE = SchemaColumn(
         name="EMPLOYEE_LANGUAGE",
         parents=[EmployeeSchemaRaw.LANGUAGE],
+        dtype="str",
     )
 
     EMPLOYEE_AGE = SchemaColumn(
         name="EMPLOYEE_AGE",
         parents=[EmployeeSchemaRaw.AGE],
+        dtype="int64",
     )
 
     EMPLOYEE_LATITUDE = SchemaColumn(
         name="EMPLOYEE_LATITUDE",
         parents=[EmployeeSchemaRaw.LATITUDE],
+        dtype="float64",
     )
 
     EMPLOYEE_LONGITUDE = SchemaColumn(
         name="EMPLOYEE_LONGITUDE",
         parents=[EmployeeSchemaRaw.LONGITUDE],
+        dtype="float64",
     )
 
     EMPLOYEE_MINIMUM_DAILY_CAPACITY = SchemaColumn(
         name="EMPLOYEE_MINIMUM_DAILY_CAPACITY",
         parents=[EmployeeSchemaRaw.EMPLOYEE_MINIMUM_DAILY_CAPACITY],
+        dtype="int64",
     )
 
     EMPLOYEE_MAXIMUM_DAILY_CAPACITY = SchemaColumn(
         name="EMPLOYEE_MAXIMUM_DAILY_CAPACITY",
         parents=[EmployeeSchemaRaw.EMPLOYEE_MAXIMUM_DAILY_CAPACITY],
+        dtype="int64",
     )
 
     EMPLOYEE_MINIMUM_WEEKLY_CAPACITY = SchemaColumn(
         name="EMPLOYEE_MINIMUM_WEEKLY_CAPACITY",
         parents=[EmployeeSchemaRaw.EMPLOYEE_MINIMUM_WEEKLY_CAPACITY],
+        dtype="int64",
     )
 
     EMPLOYEE_MAXIMUM_WEEKLY_CAPACITY = SchemaColumn(
         name="EMPLOYEE_MAXIMUM_WEEKLY_CAPACITY",
         parents=[EmployeeSchemaRaw.EMPLOYEE_MAXIMUM_WEEKLY_CAPACITY],
+        dtype="int64",
     )
 
     EMPLOYEE_TENURE = SchemaColumn(
@@ -146,6 +162,7 @@ class _EmployeeSchema(Schema):
     USER_SETTINGS_STAFFING_EMPLOYEE_POSITION_TYPE = SchemaColumn(
         name="USER_SETTINGS:STAFFING_EMPLOYEE_POSITION_TYPE",
         parents=[EmployeeSchemaRaw.USER_SETTINGS_STAFFING_EMPLOYEE_POSITION_TYPE],
+        dtype="str",
     )
 
 
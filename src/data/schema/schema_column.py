@@ -16,6 +16,9 @@ class SchemaColumn:
         parents (List[SchemaColumn]): The parent columns.
         comments (Optional[str]): The comments for the column.
         is_datetime (bool): Whether the column is a datetime column.
+        dtype (Optional[str]): The dtype the column is parsed with when it is read from
+            a csv file, or cast to by the SetTypes transforms. Defaults to None which
+            infers the dtype.
     """
 
     def __init__(
@@ -25,6 +28,8 @@ class SchemaColumn:
         feature_type: Optional[FeatureType] = None,
         comments: Optional[str] = None,
         is_datetime: bool = False,
+        *,
+        dtype: Optional[str] = None,
     ) -> None:
         assert isinstance(name, str)
 
@@ -33,6 +38,7 @@ class SchemaColumn:
         self.feature_type = feature_type
         self.comments = comments
         self.is_datetime = is_datetime
+        self.dtype = dtype
 
     def to_dict(self) -> dict:
         """
@@ -46,6 +52,7 @@ class SchemaColumn:
             "parents": [parent.to_dict() for parent in self.parents],
             "comments": self.comments,
             "is_datetime": self.is_datetime,
+            "dtype": self.dtype,
         }
 
     def __str__(self) -> str:
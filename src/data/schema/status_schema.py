@@ -12,9 +12,9 @@ class _StatusSchemaRaw(Schema):
     """
 
     EMPLOYEE_ID = SchemaColumn(name="EMPLOYEE_ID")
-    STATUS_HISTORICAL = SchemaColumn(name="STATUS_HISTORICAL")
-    STATUS_START_DATE = SchemaColumn(name="STATUS_START_DATE")
-    STATUS_END_DATE = SchemaColumn(name="STATUS_END_DATE")
+    STATUS_HISTORICAL = SchemaColumn(name="STATUS_HISTORICAL", dtype="str")
+    STATUS_START_DATE = SchemaColumn(name="STATUS_START_DATE", is_datetime=True)
+    STATUS_END_DATE = SchemaColumn(name="STATUS_END_DATE", is_datetime=True)
     STATUS_DAYS = SchemaColumn(name="STATUS_DAYS")
 
 
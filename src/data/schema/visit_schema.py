@@ -12,18 +12,20 @@ class _VisitSchemaRaw(Schema):
     """
 
     VISIT_ID = SchemaColumn(name="VISIT_ID")
-    SERVICE_DESCRIPTION = SchemaColumn(name="SERVICE_DESCRIPTION")
+    SERVICE_DESCRIPTION = SchemaColumn(name="SERVICE_DESCRIPTION", dtype="str")
     CLIENT_ID = SchemaColumn(name="CLIENT_ID")
     EMPLOYEE_ID = SchemaColumn(name="EMPLOYEE_ID")
-    CREATED_AT = SchemaColumn(name="CREATED_AT")
-    UPDATED_AT = SchemaColumn(name="UPDATED_AT")
-    START_AT = SchemaColumn(name="START_AT")
-    END_AT = SchemaColumn(name="END_AT")
+    CREATED_AT = SchemaColumn(name="CREATED_AT", is_datetime=True)
+    UPDATED_AT = SchemaColumn(name="UPDATED_AT", is_datetime=True)
+    START_AT = SchemaColumn(name="START_AT", is_datetime=True)
+    END_AT = SchemaColumn(name="END_AT", is_datetime=True)
     START_AT_UTC = SchemaColumn(name="START_AT_UTC")
     END_AT_UTC = SchemaColumn(name="END_AT_UTC")
-    HOLIDAY_DATE = SchemaColumn(name="HOLIDAY_DATE")
+    HOLIDAY_DATE = SchemaColumn(name="HOLIDAY_DATE", is_datetime=True)
     VISIT_COMPLETED = SchemaColumn(name="VISIT_COMPLETED")
-    IN_OUT_OF_RECURRENCE_STATUS = SchemaColumn(name="IN_OUT_OF_RECURRENCE_STATUS")
+    IN_OUT_OF_RECURRENCE_STATUS = SchemaColumn(
+        name="IN_OUT_OF_RECURRENCE_STATUS", dtype="str"
+    )
     VISIT_RECURRENCE = SchemaColumn(name="VISIT_RECURRENCE")
     IS_PAID = SchemaColumn(name="IS_PAID")
     ADL_COMPLETE = SchemaColumn(name="ADL_COMPLETE")
@@ -31,13 +33,17 @@ class _VisitSchemaRaw(Schema):
     BREAK_MINUTES = SchemaColumn(name="BREAK_MINUTES")
     BREAK_HOURS = SchemaColumn(name="BREAK_HOURS")
     VISIT_APPROVAL_STATUS = SchemaColumn(name="VISIT_APPROVAL_STATUS")
-    VISIT_UNIT_QTY = SchemaColumn(name="VISIT_UNIT_QTY")
+    VISIT_UNIT_QTY = SchemaColumn(name="VISIT_UNIT_QTY", dtype="float64")
     VISIT_ON_HOLD_REASON = SchemaColumn(name="VISIT_ON_HOLD_REASON")
-    VISIT_COMPUTED_RATE_UNITS = SchemaColumn(name="VISIT_COMPUTED_RATE_UNITS")
-    VISIT_COMPUTED_RATE = SchemaColumn(name="VISIT_COMPUTED_RATE")
+    VISIT_COMPUTED_RATE_UNITS = SchemaColumn(
+        name="VISIT_COMPUTED_RATE_UNITS", dtype="str"
+    )
+    VISIT_COMPUTED_RATE = SchemaColumn(name="VISIT_COMPUTED_RATE", dtype="float64")
     CANCEL_CODE = SchemaColumn(name="CANCEL_CODE")
-    VISIT_HOURS_APPROVED = SchemaColumn(name="VISIT_HOURS_APPROVED")
-    VISIT_SCHEDULED_DURATION = SchemaColumn(name="VISIT_SCHEDULED_DURATION")
+    VISIT_HOURS_APPROVED = SchemaColumn(name="VISIT_HOURS_APPROVED", dtype="float64")
+    VISIT_SCHEDULED_DURATION = SchemaColumn(
+        name="VISIT_SCHEDULED_DURATION", dtype="float64"
+    )
 
 
 VisitSchemaRaw = _VisitSchemaRaw()
@@ -51,21 +57,25 @@ class _VisitSchema(Schema):
     VISIT_ID = SchemaColumn(
         name="VISIT_ID",
         parents=[VisitSchemaRaw.VISIT_ID],
+        dtype="int64",
     )
 
     VISIT_SERVICE_DESCRIPTION = SchemaColumn(
         name="VISIT_SERVICE_DESCRIPTION",
         parents=[VisitSchemaRaw.SERVICE_DESCRIPTION],
+        dtype="str",
     )
 
     CLIENT_ID = SchemaColumn(
         name="CLIENT_ID",
         parents=[VisitSchemaRaw.CLIENT_ID],
+        dtype="int64",
     )
 
     EMPLOYEE_ID = SchemaColumn(
         name="EMPLOYEE_ID",
         parents=[VisitSchemaRaw.EMPLOYEE_ID],
+        dtype="int64",
     )
 
     VISIT_CREATED_AT = SchemaColumn(
@@ -113,71 +123,85 @@ class _VisitSchema(Schema):
     VISIT_COMPLETED = SchemaColumn(
         name="VISIT_COMPLETED",
         parents=[VisitSchemaRaw.VISIT_COMPLETED],
+        dtype="int64",
     )
 
     VISIT_IN_OUT_OF_RECURRENCE_STATUS = SchemaColumn(
         name="VISIT_IN_OUT_OF_RECURRENCE_STATUS",
         parents=[VisitSchemaRaw.IN_OUT_OF_RECURRENCE_STATUS],
+        dtype="str",
     )
 
     VISIT_RECURRENCE = SchemaColumn(
         name="VISIT_RECURRENCE",
         parents=[VisitSchemaRaw.VISIT_RECURRENCE],
+        dtype="int64",
     )
 
     VISIT_IS_PAID = SchemaColumn(
         name="VISIT_IS_PAID",
         parents=[VisitSchemaRaw.IS_PAID],
+        dtype="int64",
     )
 
     VISIT_ADL_COMPLETE = SchemaColumn(
         name="VISIT_ADL_COMPLETE",
         parents=[VisitSchemaRaw.ADL_COMPLETE],
+        dtype="int64",
     )
 
     VISIT_HAS_ADL = SchemaColumn(
         name="VISIT_HAS_ADL",
         parents=[VisitSchemaRaw.HAS_ADL],
+        dtype="int64",
     )
 
     VISIT_BREAK_MINUTES = SchemaColumn(
         name="VISIT_BREAK_MINUTES",
         parents=[VisitSchemaRaw.BREAK_MINUTES],
+        dtype="int64",
     )
 
     VISIT_BREAK_HOURS = SchemaColumn(
         name="VISIT_BREAK_HOURS",
         parents=[VisitSchemaRaw.BREAK_HOURS],
+        dtype="int64",
     )
 
     VISIT_APPROVAL_STATUS = SchemaColumn(
         name="VISIT_APPROVAL_STATUS",
         parents=[VisitSchemaRaw.VISIT_APPROVAL_STATUS],
+        dtype="int64",
     )
 
     VISIT_UNIT_QTY = SchemaColumn(
         name="VISIT_UNIT_QTY",
         parents=[VisitSchemaRaw.VISIT_UNIT_QTY],
+        dtype="float64",
     )
 
     VISIT_ON_HOLD_REASON = SchemaColumn(
         name="VISIT_ON_HOLD_REASON",
         parents=[VisitSchemaRaw.VISIT_ON_HOLD_REASON],
+        dtype="str",
     )
 
     VISIT_COMPUTED_RATE_UNITS = SchemaColumn(
         name="VISIT_COMPUTED_RATE_UNITS",
         parents=[VisitSchemaRaw.VISIT_COMPUTED_RATE_UNITS],
+        dtype="str",
     )
 
     VISIT_COMPUTED_RATE = SchemaColumn(
         name="VISIT_COMPUTED_RATE",
         parents=[VisitSchemaRaw.VISIT_COMPUTED_RATE],
+        dtype="float64",
     )
 
     VISIT_CANCEL_CODE = SchemaColumn(
         name="VISIT_CANCEL_CODE",
         parents=[VisitSchemaRaw.CANCEL_CODE],
+        dtype="str",
     )
 
     VISIT_HOURS_APPROVED = SchemaColumn(
@@ -188,6 +212,7 @@ class _VisitSchema(Schema):
     VISIT_SCHEDULED_DURATION = SchemaColumn(
         name="VISIT_SCHEDULED_DURATION",
         parents=[VisitSchemaRaw.VISIT_SCHEDULED_DURATION],
+        dtype="float64",
     )
 
     VISIT_WORK_HOURS_DEVIATION = SchemaColumn(
@@ -213,7 +238,9 @@ class _VisitSchema(Schema):
         comments="VISIT_HAS_ADL * VISIT_ADL_COMPLETE",
     )
 
-    VISIT_HAS_ADL = SchemaColumn(name="VISIT_HAS_ADL", parents=[VisitSchemaRaw.HAS_ADL])
+    VISIT_HAS_ADL = SchemaColumn(
+        name="VISIT_HAS_ADL", parents=[VisitSchemaRaw.HAS_ADL], dtype="int64"
+    )
 
 
 VisitSchema = _VisitSchema(
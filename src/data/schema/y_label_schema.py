@@ -31,6 +31,23 @@ class _YLabelSchema(Schema):
         name="Y_LABEL",
     )
 
+    # the labels of each label policy, Y_LABEL is selected from them for training
+    Y_LABEL_7_DAYS = SchemaColumn(
+        name="Y_LABEL_7_DAYS",
+    )
+
+    Y_LABEL_30_DAYS = SchemaColumn(
+        name="Y_LABEL_30_DAYS",
+    )
+
+    Y_LABEL_60_DAYS = SchemaColumn(
+        name="Y_LABEL_60_DAYS",
+    )
+
+    Y_LABEL_90_DAYS = SchemaColumn(
+        name="Y_LABEL_90_DAYS",
+    )
+
 
 YLabelSchema = _YLabelSchema(
     parents=[StatusSchema],
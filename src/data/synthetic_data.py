@@ -0,0 +1,399 @@
+"""
+This module is used to generate synthetic raw csv files, matching the raw schemas, to test
+and benchmark the ingestion pipeline without real data
+"""
+
+from os import makedirs, path
+from typing import Dict, Optional
+import numpy as np
+from pandas import DataFrame, Series, Timedelta, Timestamp, concat, to_timedelta
+from src.data.schema.client_schema import ClientSchemaRaw
+from src.data.schema.clock_schema import ClockSchemaRaw
+from src.data.schema.employee_schema import EmployeeSchemaRaw
+from src.data.schema.schema import Schema
+from src.data.schema.status_schema import StatusSchemaRaw
+from src.data.schema.visit_schema import VisitSchemaRaw
+
+SERVICE_DESCRIPTIONS = [
+    "Personal Care",
+    "Homemaking",
+    "Respite Care",
+    "Companionship",
+    "Nursing Visit - RN",
+    "Medication Reminder",
+]
+JOB_TITLES = ["HHA", "CNA", "Personal Support Worker", "RN", "LPN", "Caregiver"]
+STATES = ["ON", "QC", "BC", "NY", "NJ", "FL"]
+LANGUAGES = ["en", "fr", "es"]
+DIAGNOSES = [
+    "Type 2 diabetes mellitus without complications E11.9",
+    "Essential (primary) hypertension I10",
+    "Alzheimer's disease, unspecified G30.9",
+    "Chronic obstructive pulmonary disease, unspecified J44.9",
+    "Heart failure, unspecified I50.9",
+    "Chronic kidney disease, stage 3 N18.3",
+]
+LATITUDE = 45.5
+LONGITUDE = -73.6
+
+
+def generate_synthetic_data(
+    directory: str,
+    *,
+    n_employees: int = 100,
+    n_clients: Optional[int] = None,
+    n_days: int = 365,
+    visits_per_day: float = 1.0,
+    termination_rate: float = 0.2,
+    start_date: Timestamp = Timestamp(year=2022, month=1, day=1),
+    seed: int = 0,
+) -> Dict[str, str]:
+    """
+    This function is used to write the visit, clock, employee, client and status csv files
+    of a synthetic home care agency. The employees visit clients every day until they are
+    terminated, the terminated employees have a terminated status at their termination
+    date.
+
+    Args:
+        directory (str): The directory of the csv files, the data directory of the
+            environment
+        n_employees (int): The number of employees. Defaults to 100.
+        n_clients (Optional[int]): The number of clients. Defaults to None which uses
+            twice the number of employees.
+        n_days (int): The number of days of visits. Defaults to 365.
+        visits_per_day (float): The mean number of visits of an employee per day.
+            Defaults to 1.0.
+        termination_rate (float): The share of employees terminated during the days.
+            Defaults to 0.2.
+        start_date (Timestamp): The first day of visits. Defaults to 2022-01-01.
+        seed (int): The seed of the random generator. Defaults to 0.
+
+    Returns:
+        Dict[str, str]: The path of each csv file by file name.
+    """
+    assert n_employees > 0
+    assert n_days > 0
+    assert visits_per_day > 0
+    assert 0 <= termination_rate <= 1
+    n_clients = n_clients if n_clients is not None else 2 * n_employees
+    assert n_clients > 0
+    random = np.random.default_rng(seed)
+
+    employees = generate_employees(
+        random,
+        n_employees=n_employees,
+        n_days=n_days,
+        termination_rate=termination_rate,
+        start_date=start_date,
+    )
+    visits = generate_visits(
+        random,
+        employees=employees,
+        n_clients=n_clients,
+        n_days=n_days,
+        visits_per_day=visits_per_day,
+        start_date=start_date,
+    )
+    dataframes = {
+        "employee_data.csv": employees,
+        "client_data.csv": generate_clients(
+            random, n_clients=n_clients, start_date=start_date
+        ),
+        "visit_data.csv": visits,
+        "clock_data.csv": generate_clock(random, visits=visits),
+        "status_data.csv": generate_status(employees=employees),
+    }
+
+    if not path.exists(directory):
+        makedirs(directory)
+    csv_paths = {}
+    for filename, dataframe in dataframes.items():
+        csv_paths[filename] = path.join(directory, filename)
+        dataframe.to_csv(
+            csv_paths[filename], index=False, date_format="%Y-%m-%d %H:%M:%S"
+        )
+    return csv_paths
+
+
+def generate_employees(
+    random: np.random.Generator,
+    *,
+    n_employees: int,
+    n_days: int,
+    termination_rate: float,
+    start_date: Timestamp,
+) -> DataFrame:
+    """
+    This function is used to generate the employees with the columns of EmployeeSchemaRaw
+    """
+    terminated = random.random(n_employees) < termination_rate
+    start_on = start_date - to_timedelta(random.integers(30, 3650, n_employees), "D")
+    termination_date = Series(
+        start_date + to_timedelta(random.integers(1, n_days + 1, n_employees), "D")
+    ).where(terminated)
+
+    return with_schema_columns(
+        {
+            EmployeeSchemaRaw.EMPLOYEE_ID.name: np.arange(1, n_employees + 1),
+            EmployeeSchemaRaw.STATUS.name: np.where(terminated, "terminated", "active"),
+            EmployeeSchemaRaw.HAS_SKILLS.name: random.integers(0, 2, n_employees),
+            EmployeeSchemaRaw.COUNTRY.name: "CA",
+            EmployeeSchemaRaw.GENDER.name: random.choice(
+                ["F", "M", '"F"', ""], n_employees, p=[0.6, 0.3, 0.05, 0.05]
+            ),
+            EmployeeSchemaRaw.JOB_TITLE.name: random.choice(JOB_TITLES, n_employees),
+            EmployeeSchemaRaw.START_ON.name: start_on.strftime("%Y-%m-%d"),
+            EmployeeSchemaRaw.STATE.name: random.choice(STATES, n_employees),
+            EmployeeSchemaRaw.TERMINATION_DATE.name: termination_date.dt.strftime(
+                "%Y-%m-%d"
+            ),
+            EmployeeSchemaRaw.USER_SETTINGS_STAFFING_EMPLOYEE_POSITION_TYPE.name: (
+                random.choice(["full_time", "part_time"], n_employees)
+            ),
+            EmployeeSchemaRaw.EMPLOYEE_AVAILABILITY.name: random.choice(
+                ["weekdays", "weekends", "all"], n_employees
+            ),
+            EmployeeSchemaRaw.EMPLOYEE_MINIMUM_DAILY_CAPACITY.name: 0,
+            EmployeeSchemaRaw.EMPLOYEE_MAXIMUM_DAILY_CAPACITY.name: 8,
+            EmployeeSchemaRaw.EMPLOYEE_MINIMUM_WEEKLY_CAPACITY.name: 0,
+            EmployeeSchemaRaw.EMPLOYEE_MAXIMUM_WEEKLY_CAPACITY.name: 40,
+            EmployeeSchemaRaw.LANGUAGE.name: random.choice(LANGUAGES, n_employees),
+            EmployeeSchemaRaw.AGE.name: random.integers(18, 70, n_employees),
+            EmployeeSchemaRaw.LATITUDE.name: LATITUDE
+            + random.normal(0, 0.2, n_employees),
+            EmployeeSchemaRaw.LONGITUDE.name: LONGITUDE
+            + random.normal(0, 0.2, n_employees),
+        },
+        schema=EmployeeSchemaRaw,
+    )
+
+
+def generate_clients(
+    random: np.random.Generator, *, n_clients: int, start_date: Timestamp
+) -> DataFrame:
+    """
+    This function is used to generate the clients with the columns of ClientSchemaRaw
+    """
+    admission_date = start_date - to_timedelta(random.integers(0, 1000, n_clients), "D")
+    n_diagnoses = random.integers(0, 4, n_clients)
+    diagnoses = [
+        str(
+            {
+                str(index): diagnosis
+                for index, diagnosis in enumerate(
+                    random.choice(DIAGNOSES, n_diagnosis, replace=False)
+                )
+            }
+        )
+        if n_diagnosis > 0
+        else ""
+        for n_diagnosis in n_diagnoses
+    ]
+
+    return with_schema_columns(
+        {
+            ClientSchemaRaw.CLIENT_ID.name: np.arange(1, n_clients + 1),
+            ClientSchemaRaw.AGE.name: random.integers(20, 105, n_clients),
+            ClientSchemaRaw.ADMISSION_DATE.name: admission_date,
+            ClientSchemaRaw.DISCHARGE_DATE.name: None,
+            ClientSchemaRaw.PREFERRED_LANGUAGE.name: random.choice(
+                LANGUAGES, n_clients
+            ),
+            ClientSchemaRaw.LENGTH_OF_STAY.name: (start_date - admission_date).days,
+            ClientSchemaRaw.HAS_ADLS.name: random.integers(0, 2, n_clients),
+            ClientSchemaRaw.COUNTRY.name: "CA",
+            ClientSchemaRaw.GENDER.name: random.choice(["F", "M", ""], n_clients),
+            ClientSchemaRaw.LATITUDE.name: LATITUDE + random.normal(0, 0.2, n_clients),
+            ClientSchemaRaw.LONGITUDE.name: LONGITUDE
+            + random.normal(0, 0.2, n_clients),
+            ClientSchemaRaw.DIAGNOSIS.name: diagnoses,
+        },
+        schema=ClientSchemaRaw,
+    )
+
+
+def generate_visits(
+    random: np.random.Generator,
+    *,
+    employees: DataFrame,
+    n_clients: int,
+    n_days: int,
+    visits_per_day: float,
+    start_date: Timestamp,
+) -> DataFrame:
+    """
+    This function is used to generate the visits with the columns of VisitSchemaRaw.
+    The employees have a Poisson number of visits on every day before their termination.
+    """
+    termination_day = (
+        (
+            employees[EmployeeSchemaRaw.TERMINATION_DATE.name]
+            .astype("datetime64[ns]")
+            .fillna(start_date + Timedelta(days=n_days))
+            - start_date
+        )
+        .dt.days.clip(upper=n_days)
+        .to_numpy()
+    )
+    # one slot per employee and active day
+    slot_employees = np.repeat(np.arange(len(employees)), termination_day)
+    slot_days = np.arange(len(slot_employees)) - np.repeat(
+        np.cumsum(termination_day) - termination_day, termination_day
+    )
+    n_visits_per_slot = random.poisson(visits_per_day, len(slot_employees))
+    visit_employees = np.repeat(slot_employees, n_visits_per_slot)
+    visit_days = np.repeat(slot_days, n_visits_per_slot)
+    n_visits = len(visit_employees)
+
+    start_at = (
+        start_date
+        + to_timedelta(visit_days, "D")
+        + to_timedelta(random.integers(6 * 60, 23 * 60, n_visits), "min")
+    )
+    scheduled_duration = random.choice([0.5, 1.0, 1.5, 2.0, 3.0, 4.0], n_visits)
+    end_at = start_at + to_timedelta(scheduled_duration, "h")
+    cancelled = random.random(n_visits) < 0.05
+    hourly = random.random(n_visits) < 0.8
+    computed_rate = np.where(
+        hourly, random.uniform(15, 35, n_visits), random.uniform(40, 120, n_visits)
+    )
+    computed_rate[random.random(n_visits) < 0.01] = 0
+    has_adl = random.integers(0, 2, n_visits)
+
+    return with_schema_columns(
+        {
+            VisitSchemaRaw.VISIT_ID.name: np.arange(1, n_visits + 1),
+            VisitSchemaRaw.SERVICE_DESCRIPTION.name: random.choice(
+                SERVICE_DESCRIPTIONS, n_visits
+            ),
+            VisitSchemaRaw.CLIENT_ID.name: random.integers(1, n_clients + 1, n_visits),
+            VisitSchemaRaw.EMPLOYEE_ID.name: employees[
+                EmployeeSchemaRaw.EMPLOYEE_ID.name
+            ].to_numpy()[visit_employees],
+            VisitSchemaRaw.CREATED_AT.name: start_at - Timedelta(days=7),
+            VisitSchemaRaw.UPDATED_AT.name: end_at,
+            VisitSchemaRaw.START_AT.name: start_at,
+            VisitSchemaRaw.END_AT.name: end_at,
+            VisitSchemaRaw.START_AT_UTC.name: start_at + Timedelta(hours=5),
+            VisitSchemaRaw.END_AT_UTC.name: end_at + Timedelta(hours=5),
+            VisitSchemaRaw.HOLIDAY_DATE.name: None,
+            VisitSchemaRaw.VISIT_COMPLETED.name: (~cancelled).astype(int),
+            VisitSchemaRaw.IN_OUT_OF_RECURRENCE_STATUS.name: random.choice(
+                ["in", "out"], n_visits
+            ),
+            VisitSchemaRaw.VISIT_RECURRENCE.name: random.integers(0, 2, n_visits),
+            VisitSchemaRaw.IS_PAID.name: (~cancelled).astype(int),
+            VisitSchemaRaw.ADL_COMPLETE.name: has_adl * (random.random(n_visits) < 0.9),
+            VisitSchemaRaw.HAS_ADL.name: has_adl,
+            VisitSchemaRaw.BREAK_MINUTES.name: 0,
+            VisitSchemaRaw.BREAK_HOURS.name: 0,
+            VisitSchemaRaw.VISIT_APPROVAL_STATUS.name: (~cancelled).astype(int),
+            VisitSchemaRaw.VISIT_UNIT_QTY.name: np.where(
+                hourly, scheduled_duration, 1.0
+            ),
+            VisitSchemaRaw.VISIT_ON_HOLD_REASON.name: None,
+            VisitSchemaRaw.VISIT_COMPUTED_RATE_UNITS.name: np.where(
+                hourly, "hours", "visits"
+            ),
+            VisitSchemaRaw.VISIT_COMPUTED_RATE.name: computed_rate.round(2),
+            VisitSchemaRaw.CANCEL_CODE.name: np.where(
+                cancelled, "CLIENT_CANCELLED", None
+            ),
+            VisitSchemaRaw.VISIT_HOURS_APPROVED.name: np.where(
+                cancelled, 0.0, scheduled_duration
+            ),
+            VisitSchemaRaw.VISIT_SCHEDULED_DURATION.name: scheduled_duration,
+        },
+        schema=VisitSchemaRaw,
+    )
+
+
+def generate_clock(random: np.random.Generator, *, visits: DataFrame) -> DataFrame:
+    """
+    This function is used to generate the punches of the visits that are not cancelled
+    with the columns of ClockSchemaRaw. The employees punch in a few minutes late or
+    early and some visits are split in two punches.
+    """
+    visits = visits[visits[VisitSchemaRaw.CANCEL_CODE.name].isna()]
+    n_visits = len(visits)
+    start_time = visits[VisitSchemaRaw.START_AT.name].to_numpy() + to_timedelta(
+        random.normal(0, 5, n_visits).round(), "min"
+    )
+    end_time = visits[VisitSchemaRaw.END_AT.name].to_numpy() + to_timedelta(
+        random.normal(0, 5, n_visits).round(), "min"
+    )
+    split = random.random(n_visits) < 0.1
+    middle_time = start_time + (end_time - start_time) / 2
+
+    visit_ids = visits[VisitSchemaRaw.VISIT_ID.name].to_numpy()
+    clock = DataFrame(
+        {
+            ClockSchemaRaw.VISIT_ID.name: np.concatenate([visit_ids, visit_ids[split]]),
+            ClockSchemaRaw.START_TIME.name: np.concatenate(
+                [start_time, middle_time[split]]
+            ),
+            ClockSchemaRaw.END_TIME.name: np.concatenate(
+                [np.where(split, middle_time, end_time), end_time[split]]
+            ),
+        }
+    ).sort_values(by=[ClockSchemaRaw.VISIT_ID.name, ClockSchemaRaw.START_TIME.name])
+    clock[ClockSchemaRaw.PUNCH_ID.name] = np.arange(1, len(clock) + 1)
+    return with_schema_columns(clock.to_dict("series"), schema=ClockSchemaRaw)
+
+
+def generate_status(*, employees: DataFrame) -> DataFrame:
+    """
+    This function is used to generate the status history of the employees with the
+    columns of StatusSchemaRaw, an active status from their start and a terminated
+    status at their termination.
+    """
+    start_on = employees[EmployeeSchemaRaw.START_ON.name].astype("datetime64[ns]")
+    termination_date = employees[EmployeeSchemaRaw.TERMINATION_DATE.name].astype(
+        "datetime64[ns]"
+    )
+    terminated = termination_date.notna()
+    active = DataFrame(
+        {
+            StatusSchemaRaw.EMPLOYEE_ID.name: employees[
+                EmployeeSchemaRaw.EMPLOYEE_ID.name
+            ],
+            StatusSchemaRaw.STATUS_HISTORICAL.name: "active",
+            StatusSchemaRaw.STATUS_START_DATE.name: start_on,
+            StatusSchemaRaw.STATUS_END_DATE.name: termination_date,
+        }
+    )
+    terminations = DataFrame(
+        {
+            StatusSchemaRaw.EMPLOYEE_ID.name: employees.loc[
+                terminated, EmployeeSchemaRaw.EMPLOYEE_ID.name
+            ],
+            StatusSchemaRaw.STATUS_HISTORICAL.name: "terminated",
+            StatusSchemaRaw.STATUS_START_DATE.name: termination_date[terminated],
+            StatusSchemaRaw.STATUS_END_DATE.name: None,
+        }
+    )
+    status = concat([active, terminations], ignore_index=True)
+    status[StatusSchemaRaw.STATUS_DAYS.name] = (
+        status[StatusSchemaRaw.STATUS_END_DATE.name].astype("datetime64[ns]")
+        - status[StatusSchemaRaw.STATUS_START_DATE.name]
+    ).dt.days
+    return with_schema_columns(status.to_dict("series"), schema=StatusSchemaRaw)
+
+
+def with_schema_columns(columns: dict, *, schema: Schema) -> DataFrame:
+    """
+    This function is used to build the dataframe with the columns in the order of the
+    schema. Every column of the schema must be generated.
+    """
+    schema_columns = [column.name for column in schema.columns]
+    assert set(columns) == set(
+        schema_columns
+    ), f"{set(columns) ^ set(schema_columns)} are not generated"
+    dataframe = DataFrame(
+        {
+            name: value.reset_index(drop=True) if isinstance(value, Series) else value
+            for name, value in columns.items()
+        },
+        index=None,
+    )
+    return dataframe[schema_columns]
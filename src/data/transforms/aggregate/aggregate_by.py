@@ -2,7 +2,7 @@
 This module contains a class that aggregates by the given column and by the specified methods
 """
 
-from typing import Tuple, Union
+from typing import List, Optional, Tuple, Union
 from typing import Dict
 from pandas import DataFrame
 from src.data.transforms.transform import DataframeTransform
@@ -10,6 +10,24 @@ from src.data.error.error_dataframe import ErrorDataFrame
 from src.utility.configs.config import Config
 from src.utility.environment import Environment
 from src.data.transforms.aggregate.custom_aggregate_function import custom_functions
+from src.data.polars_backend import PolarsQuery, polars
+
+# the Polars expressions of the aggregation functions by name, with the missing values
+# skipped like pandas
+POLARS_AGGREGATION_FUNCTIONS = {
+    "mean": lambda column: column.mean(),
+    "median": lambda column: column.median(),
+    "min": lambda column: column.min(),
+    "max": lambda column: column.max(),
+    "sum": lambda column: column.sum(),
+    "std": lambda column: column.std(),
+    "var": lambda column: column.var(),
+    "count": lambda column: column.count().cast(polars.Int64),
+    "nunique": lambda column: column.drop_nulls().n_unique().cast(polars.Int64),
+    "quantile_25": lambda column: column.quantile(0.25, interpolation="linear"),
+    "quantile_50": lambda column: column.quantile(0.50, interpolation="linear"),
+    "quantile_75": lambda column: column.quantile(0.75, interpolation="linear"),
+}
 
 
 class AggregateBy(DataframeTransform):
@@ -51,6 +69,76 @@ class AggregateBy(DataframeTransform):
                 callable_functions[key] = value
         return callable_functions
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            *[str(column) for column in self.columns],
+            *[str(column) for column in self.aggregation_functions],
+        ]
+
+    def supports_polars(self) -> bool:
+        """
+        This method returns whether the transform has a Polars implementation.
+
+        Returns:
+            bool: Whether every aggregation function has a Polars expression.
+        """
+        return all(
+            value in POLARS_AGGREGATION_FUNCTIONS
+            for value in self.aggregation_functions.values()
+        )
+
+    def apply_polars(
+        self,
+        query: PolarsQuery,
+        # pylint: disable=unused-argument
+        conf: Config,
+    ) -> PolarsQuery:
+        """
+        This method adds the transform to the lazy query of the polars backend. The
+        groups are sorted and the groups with missing keys are dropped, like pandas.
+
+        Args:
+            query (PolarsQuery): The query of the previous transforms.
+            conf (Config): The config.
+
+        Returns:
+            PolarsQuery: The query with the transform.
+        """
+        columns = [str(column) for column in self.columns]
+        query.lazyframe = (
+            query.lazyframe.drop_nulls(subset=columns)
+            .group_by(columns)
+            .agg(
+                [
+                    POLARS_AGGREGATION_FUNCTIONS[value](polars.col(str(key))).alias(
+                        str(key)
+                    )
+                    for key, value in self.aggregation_functions.items()
+                ]
+            )
+            .sort(columns)
+        )
+        return query
+
+    def can_partition_by(self, column: str) -> bool:
+        """
+        This method returns whether the transform can be applied to the partitions of the
+        dataframe by the values of a column.
+
+        Args:
+            column (str): The name of the partition column.
+
+        Returns:
+            bool: Whether the rows are grouped by the column.
+        """
+        return column in [str(group_column) for group_column in self.columns]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -148,6 +148,20 @@ class AnomalyDetector(DataframeTransform):
         anomaly_df = anomaly_df.drop(columns=COLUMNS_TO_IGNORE, errors="ignore")
         return anomaly_df
 
+    def can_partition_by(self, column: str) -> bool:
+        """
+        This method returns whether the transform can be applied to the partitions of the
+        dataframe by the values of a column.
+
+        Args:
+            column (str): The name of the partition column.
+
+        Returns:
+            bool: True for EMPLOYEE_ID, the rows of an employee are only combined
+                together.
+        """
+        return column == EmployeeHistorySchema.EMPLOYEE_ID.name
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -3,28 +3,39 @@ This module contains a class used to calculate a visit's hour distribution betwe
 """
 
 from typing import Tuple
-from pandas import DataFrame, date_range, Timedelta, to_datetime, concat
-from tqdm.autonotebook import tqdm
+from numpy import (
+    arange,
+    concatenate,
+    cumsum,
+    flatnonzero,
+    maximum,
+    minimum,
+    ndarray,
+    repeat,
+    where,
+)
+from pandas import DataFrame, Timedelta
 from src.data.transforms.transform import DataframeTransform
 from src.utility.configs.config import Config
 from src.utility.environment import Environment
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.data.schema.clock_schema import ClockSchema
 
+NANOSECONDS_PER_DAY = Timedelta(days=1).value
+NANOSECONDS_PER_HOUR = Timedelta(hours=1).value
+
 
 class ShiftHoursCalculatedFields(DataframeTransform):
     """
-    This class is used to calculate a visit's hour distribution between day, night, weekday and weekend
+    This class is used to calculate a visit's hour distribution between day, night, weekday and weekend.
+    The punches over several days are split by day, the last second of each day excluded.
+    The times are computed as nanoseconds since the epoch.
     """
 
-    DAY_SHIFT_START_STR = " 07:00:00"
-    DAY_SHIFT_END_STR = " 17:00:00"
-    DATE_RANGE = "DATE_RANGE"
-
-    DAY_SHIFT_START = "DAY_SHIFT_START"
-    DAY_SHIFT_END = "DAY_SHIFT_END"
-    IN_FIRST_THIRD = "IN_FIRST_THIRD"
-    IN_THIRD_THIRD = "IN_THIRD_THIRD"
+    DAY_SHIFT_START = Timedelta(hours=7).value
+    DAY_SHIFT_END = Timedelta(hours=17).value
+    # 1970-01-01 was a Thursday
+    EPOCH_DAY_OF_WEEK = 3
 
     def __call__(
         self,
@@ -33,163 +44,113 @@ class ShiftHoursCalculatedFields(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> Tuple[DataFrame, ErrorDataFrame]:
-        tqdm.pandas(
-            desc="Settings time ranges",
-            position=4,
-            leave=False,
+        dataframe = dataframe.dropna(
+            subset=[ClockSchema.START_TIME, ClockSchema.END_TIME]
         )
+        positions, start_time, end_time = self.split_by_day(
+            self.get_nanoseconds(dataframe[ClockSchema.START_TIME]),
+            self.get_nanoseconds(dataframe[ClockSchema.END_TIME]),
+        )
+        night_hours, day_hours, is_weekend = self.get_shift_hours(start_time, end_time)
+
+        dataframe = dataframe.iloc[positions].copy()
+        dataframe[ClockSchema.START_TIME] = start_time.view("datetime64[ns]")
+        dataframe[ClockSchema.END_TIME] = end_time.view("datetime64[ns]")
+        dataframe[ClockSchema.NIGHT_HOURS] = night_hours
+        dataframe[ClockSchema.DAY_HOURS] = day_hours
+        dataframe[ClockSchema.WEEKDAY_HOURS] = where(
+            is_weekend, 0.0, day_hours + night_hours
+        )
+        dataframe[ClockSchema.WEEKEND_HOURS] = where(
+            is_weekend, day_hours + night_hours, 0.0
+        )
+        return super().__call__(dataframe, errors, conf, env)
 
-        with tqdm(total=7, position=3, leave=False) as progress_bar:
-            progress_bar.set_description("Drop null values")
-            dataframe = dataframe.dropna(
-                subset=[ClockSchema.START_TIME, ClockSchema.END_TIME]
-            )
-            progress_bar.update(1)
-
-            progress_bar.set_description("Isolate punches longer than 24 hours")
-            too_long_punch_df = dataframe[
-                dataframe[ClockSchema.START_TIME].dt.day_of_year
-                != dataframe[ClockSchema.END_TIME].dt.day_of_year
-            ]
-
-            left_over_dataframe = dataframe[
-                dataframe[ClockSchema.START_TIME].dt.day_of_year
-                == dataframe[ClockSchema.END_TIME].dt.day_of_year
-            ]
-
-            progress_bar.update(1)
-
-            progress_bar.set_description("Calculate time ranges")
-            too_long_punch_df[self.DATE_RANGE] = too_long_punch_df.progress_apply(
-                lambda row: [
-                    date.strftime("%Y-%m-%d")
-                    for date in date_range(
-                        row[ClockSchema.START_TIME].floor("d"),
-                        row[ClockSchema.END_TIME].floor("d"),
-                        freq="d",
-                    )
-                ],
-                axis=1,
-            )
-            progress_bar.update(1)
-
-            progress_bar.set_description(
-                "Exploding time ranges for punches less than 24 hours"
-            )
-            too_long_punch_df = too_long_punch_df.explode(self.DATE_RANGE)
-            progress_bar.update(1)
-
-            too_long_punch_df[self.DATE_RANGE] = to_datetime(
-                too_long_punch_df[self.DATE_RANGE]
-            )
+    @staticmethod
+    def split_by_day(
+        start_time: ndarray, end_time: ndarray
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """
+        This method splits the punches over several days by day. The punches over several
+        days are repeated once per day, before the others, and their times are clipped to
+        their day.
 
-            progress_bar.set_description(
-                "Calculating new start and end times for punches less than 24 hours"
-            )
-            too_long_punch_df[ClockSchema.START_TIME] = too_long_punch_df[
-                [
-                    ClockSchema.START_TIME,
-                    self.DATE_RANGE,
-                ]
-            ].max(axis=1)
-
-            too_long_punch_df[self.DATE_RANGE] = (
-                too_long_punch_df[self.DATE_RANGE]
-                + Timedelta(days=1)
-                - Timedelta(seconds=1)
-            )
-            too_long_punch_df[ClockSchema.END_TIME] = too_long_punch_df[
-                [
-                    ClockSchema.END_TIME,
-                    self.DATE_RANGE,
-                ]
-            ].min(axis=1)
-            too_long_punch_df = too_long_punch_df.drop(columns=[self.DATE_RANGE])
-            progress_bar.update(1)
-
-            progress_bar.set_description("Recombining dataframes")
-            dataframe = concat([too_long_punch_df, left_over_dataframe])
-            progress_bar.update(1)
-
-            progress_bar.set_description("Calculating hours")
-            dataframe[self.DAY_SHIFT_START] = to_datetime(
-                dataframe[ClockSchema.START_TIME].dt.strftime("%Y-%m-%d")
-                + self.DAY_SHIFT_START_STR
-            )
+        Args:
+            start_time (ndarray): The start times in nanoseconds.
+            end_time (ndarray): The end times in nanoseconds.
 
-            dataframe[self.DAY_SHIFT_END] = to_datetime(
-                dataframe[ClockSchema.START_TIME].dt.strftime("%Y-%m-%d")
-                + self.DAY_SHIFT_END_STR
-            )
+        Returns:
+            Tuple[ndarray, ndarray, ndarray]: The positions of the punches of the split
+                rows and their start and end times.
+        """
+        start_day = start_time // NANOSECONDS_PER_DAY * NANOSECONDS_PER_DAY
+        end_day = end_time // NANOSECONDS_PER_DAY * NANOSECONDS_PER_DAY
+
+        is_split = end_day > start_day
+        split_positions = flatnonzero(is_split)
+        n_days = (end_day[is_split] - start_day[is_split]) // NANOSECONDS_PER_DAY + 1
+        day_offsets = arange(n_days.sum()) - repeat(cumsum(n_days) - n_days, n_days)
+        positions = concatenate(
+            [repeat(split_positions, n_days), flatnonzero(~is_split)]
+        )
+        split_days = (
+            repeat(start_day[split_positions], n_days)
+            + day_offsets * NANOSECONDS_PER_DAY
+        )
+        n_split_rows = len(split_days)
+        start_time = start_time[positions]
+        end_time = end_time[positions]
+        start_time[:n_split_rows] = maximum(start_time[:n_split_rows], split_days)
+        end_time[:n_split_rows] = minimum(
+            end_time[:n_split_rows],
+            split_days + NANOSECONDS_PER_DAY - Timedelta(seconds=1).value,
+        )
+        return positions, start_time, end_time
 
-            dataframe[self.IN_FIRST_THIRD] = (
-                dataframe[[self.DAY_SHIFT_START, ClockSchema.END_TIME]].min(axis=1)
-                - dataframe[ClockSchema.START_TIME]
-            )
-            dataframe.loc[
-                dataframe[self.IN_FIRST_THIRD] < Timedelta(seconds=0),
-                self.IN_FIRST_THIRD,
-            ] = Timedelta(seconds=0)
-
-            dataframe[self.IN_THIRD_THIRD] = dataframe[
-                ClockSchema.END_TIME
-            ] - dataframe[[self.DAY_SHIFT_END, ClockSchema.START_TIME]].max(axis=1)
-            dataframe.loc[
-                dataframe[self.IN_THIRD_THIRD] < Timedelta(seconds=0),
-                self.IN_THIRD_THIRD,
-            ] = Timedelta(seconds=0)
-
-            dataframe[ClockSchema.NIGHT_HOURS] = (
-                dataframe[self.IN_FIRST_THIRD] + dataframe[self.IN_THIRD_THIRD]
-            )
+    def get_shift_hours(
+        self, start_time: ndarray, end_time: ndarray
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """
+        This method computes the night and day hours of punches within a day. The hours
+        before and after the day shift are night hours.
 
-            dataframe[ClockSchema.DAY_HOURS] = dataframe[
-                [ClockSchema.END_TIME, self.DAY_SHIFT_END]
-            ].min(axis=1) - dataframe[
-                [ClockSchema.START_TIME, self.DAY_SHIFT_START]
-            ].max(
-                axis=1
-            )
-            dataframe.loc[
-                dataframe[ClockSchema.DAY_HOURS] < Timedelta(seconds=0),
-                ClockSchema.DAY_HOURS,
-            ] = Timedelta(seconds=0)
+        Args:
+            start_time (ndarray): The start times in nanoseconds.
+            end_time (ndarray): The end times in nanoseconds, on the day of the start.
 
-            dataframe[ClockSchema.NIGHT_HOURS] = (
-                dataframe[ClockSchema.NIGHT_HOURS].dt.total_seconds() / 3600
-            )
-            dataframe[ClockSchema.DAY_HOURS] = (
-                dataframe[ClockSchema.DAY_HOURS].dt.total_seconds() / 3600
-            )
+        Returns:
+            Tuple[ndarray, ndarray, ndarray]: The night hours, the day hours and whether
+                the day is in the weekend.
+        """
+        day = start_time // NANOSECONDS_PER_DAY * NANOSECONDS_PER_DAY
+        day_shift_start = day + self.DAY_SHIFT_START
+        day_shift_end = day + self.DAY_SHIFT_END
+        night_hours = (
+            maximum(minimum(day_shift_start, end_time) - start_time, 0)
+            + maximum(end_time - maximum(day_shift_end, start_time), 0)
+        ) / NANOSECONDS_PER_HOUR
+        day_hours = (
+            maximum(
+                minimum(end_time, day_shift_end) - maximum(start_time, day_shift_start),
+                0,
+            )
+            / NANOSECONDS_PER_HOUR
+        )
+        is_weekend = (day // NANOSECONDS_PER_DAY + self.EPOCH_DAY_OF_WEEK) % 7 >= 5
+        return night_hours, day_hours, is_weekend
 
-            dataframe[ClockSchema.WEEKDAY_HOURS] = (
-                dataframe[ClockSchema.DAY_HOURS] + dataframe[ClockSchema.NIGHT_HOURS]
-            )
-            dataframe[ClockSchema.WEEKEND_HOURS] = (
-                dataframe[ClockSchema.DAY_HOURS] + dataframe[ClockSchema.NIGHT_HOURS]
-            )
+    @staticmethod
+    def get_nanoseconds(column) -> ndarray:
+        """
+        This method returns the times of a datetime column as nanoseconds since the epoch.
 
-            dataframe.loc[
-                dataframe[ClockSchema.START_TIME].dt.dayofweek < 5,
-                ClockSchema.WEEKEND_HOURS,
-            ] = 0
-
-            dataframe.loc[
-                dataframe[ClockSchema.START_TIME].dt.dayofweek >= 5,
-                ClockSchema.WEEKDAY_HOURS,
-            ] = 0
-            progress_bar.update(1)
-
-            dataframe = dataframe.drop(
-                columns=[
-                    self.IN_FIRST_THIRD,
-                    self.IN_THIRD_THIRD,
-                    self.DAY_SHIFT_START,
-                    self.DAY_SHIFT_END,
-                ]
-            )
+        Args:
+            column (Series): The datetime column.
 
-        return super().__call__(dataframe, errors, conf, env)
+        Returns:
+            ndarray: The nanoseconds.
+        """
+        return column.to_numpy(dtype="datetime64[ns]").view("int64")
 
     def to_dict(self) -> dict:
         """
@@ -17,6 +17,8 @@ class ComputeADLCompletionRate(DataframeTransform):
     This class is used to calculate ADL completion rate
     """
 
+    row_local = True
+
     def __call__(
         self,
         dataframe: DataFrame,
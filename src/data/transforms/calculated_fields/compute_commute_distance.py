@@ -2,10 +2,9 @@
 Commute
 """
 
-from typing import Optional, Tuple
-import math
-from pandas import DataFrame
-from tqdm.autonotebook import tqdm
+from typing import List, Optional, Tuple
+from numpy import arcsin, cos, nan, ndarray, radians, sin, sqrt, unique, where
+from pandas import DataFrame, to_numeric
 from src.data.transforms.transform import DataframeTransform
 from src.utility.configs.config import Config
 from src.utility.environment import Environment
@@ -15,9 +14,13 @@ from src.data.schema.augmented_visit_schema import AugmentedVisitSchema
 
 class ComputeCommuteDistance(DataframeTransform):
     """
-    This class defines dataframe transformations related to employee commute
+    This class defines dataframe transformations related to employee commute.
+    The distance is computed once per unique pair of coordinates, which repeat for
+    every visit of an employee to a client.
     """
 
+    row_local = True
+
     def __init__(self, max_distance_km: Optional[int] = 150) -> None:
         self.max_distance_km = max_distance_km
         super().__init__()
@@ -29,13 +32,41 @@ class ComputeCommuteDistance(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> Tuple[DataFrame, ErrorDataFrame]:
-        tqdm.pandas(desc="Computing commute distance", position=3, leave=False)
-
-        dataframe[
-            AugmentedVisitSchema.EMPLOYEE_COMMUTE_DISTANCE.name
-        ] = dataframe.progress_apply(self.compute_commute_distance, axis=1)
+        coordinates = (
+            dataframe[self.get_read_columns()]
+            .apply(to_numeric, errors="coerce")
+            .to_numpy(dtype=float)
+        )
+        unique_coordinates, inverse = unique(coordinates, axis=0, return_inverse=True)
+        distances = self.haversine_distance(*unique_coordinates.T)
+        dataframe[AugmentedVisitSchema.EMPLOYEE_COMMUTE_DISTANCE.name] = distances[
+            inverse.reshape(-1)
+        ]
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            AugmentedVisitSchema.CLIENT_LATITUDE.name,
+            AugmentedVisitSchema.CLIENT_LONGITUDE.name,
+            AugmentedVisitSchema.EMPLOYEE_LATITUDE.name,
+            AugmentedVisitSchema.EMPLOYEE_LONGITUDE.name,
+        ]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [AugmentedVisitSchema.EMPLOYEE_COMMUTE_DISTANCE.name]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -47,67 +78,45 @@ class ComputeCommuteDistance(DataframeTransform):
             "name": self.__class__.__name__,
         }
 
-    def compute_commute_distance(self, row):
-        """Computes the estimated commute distance of an employee for a given visit using the Haversine formula.
-
-        Args:
-            row (_type_): _description_
-        """
-        return self.haversine_distance(
-            row[AugmentedVisitSchema.CLIENT_LATITUDE.name],
-            row[AugmentedVisitSchema.CLIENT_LONGITUDE.name],
-            row[AugmentedVisitSchema.EMPLOYEE_LATITUDE.name],
-            row[AugmentedVisitSchema.EMPLOYEE_LONGITUDE.name],
-        )
-
     def haversine_distance(
         self,
-        lat1: Optional[float],
-        lon1: Optional[float],
-        lat2: Optional[float],
-        lon2: Optional[float],
-    ):
+        lat1: ndarray,
+        lon1: ndarray,
+        lat2: ndarray,
+        lon2: ndarray,
+    ) -> ndarray:
         """
         Calculate the Haversine distance between two sets of coordinates in kilometers.
 
         Parameters:
-            lat1 (float or None): Latitude of the first point (in degrees).
-            lon1 (float or None): Longitude of the first point (in degrees).
-            lat2 (float or None): Latitude of the second point (in degrees).
-            lon2 (float or None): Longitude of the second point (in degrees).
+            lat1 (ndarray): Latitudes of the first points (in degrees).
+            lon1 (ndarray): Longitudes of the first points (in degrees).
+            lat2 (ndarray): Latitudes of the second points (in degrees).
+            lon2 (ndarray): Longitudes of the second points (in degrees).
 
         Returns:
-            float or None: The distance between the two points in kilometers, or None if any input is invalid.
+            ndarray: The distances between the points in kilometers, NaN when a
+                coordinate is missing or the distance is over max_distance_km.
         """
         # pylint: disable=invalid-name
-        # Check if any input is None
-        if None in {lat1, lon1, lat2, lon2}:
-            return None
-
-        try:
-            # Convert latitude and longitude from degrees to radians
-            lat1_rad = math.radians(lat1)
-            lon1_rad = math.radians(lon1)
-            lat2_rad = math.radians(lat2)
-            lon2_rad = math.radians(lon2)
-        except (TypeError, ValueError):
-            # Handle invalid input data types or values
-            return None
+        # Convert latitude and longitude from degrees to radians
+        lat1_rad = radians(lat1)
+        lon1_rad = radians(lon1)
+        lat2_rad = radians(lat2)
+        lon2_rad = radians(lon2)
 
         # Radius of the Earth in kilometers
         earth_radius = 6371.0
 
-        # Haversine formula
+        # Haversine formula, the missing coordinates propagate as NaN
         distance_lon = lon2_rad - lon1_rad
         distance_lat = lat2_rad - lat1_rad
         a = (
-            math.sin(distance_lat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(distance_lon / 2) ** 2
+            sin(distance_lat / 2) ** 2
+            + cos(lat1_rad) * cos(lat2_rad) * sin(distance_lon / 2) ** 2
         )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        distance = earth_radius * c
-
-        if distance > self.max_distance_km:
-            return None
+        distance = earth_radius * 2 * arcsin(sqrt(a.clip(0, 1)))
 
-        return distance
+        if self.max_distance_km is None:
+            return distance
+        return where(distance > self.max_distance_km, nan, distance)
@@ -16,6 +16,8 @@ from src.utility.environment import Environment
 class ComputeDaysToFirstVisit(DataframeTransform):
     """Computes the amount of days to the first visit for every employee"""
 
+    needs_whole_history = True
+
     def __call__(
         self,
         dataframe: DataFrame,
@@ -79,6 +81,20 @@ class ComputeDaysToFirstVisit(DataframeTransform):
             return int(match.group())
         return 1
 
+    def can_partition_by(self, column: str) -> bool:
+        """
+        This method returns whether the transform can be applied to the partitions of the
+        dataframe by the values of a column.
+
+        Args:
+            column (str): The name of the partition column.
+
+        Returns:
+            bool: True for EMPLOYEE_ID, the rows of an employee are only combined
+                together.
+        """
+        return column == EmployeeHistorySchema.EMPLOYEE_ID.name
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
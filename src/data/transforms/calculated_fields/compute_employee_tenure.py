@@ -13,6 +13,8 @@ from src.utility.environment import Environment
 class ComputeDynamicEmployeeTenure(DataframeTransform):
     """This transform computes employee tenures dynamically"""
 
+    needs_whole_history = True
+
     DAYS_IN_YEAR = 365
     CAREER_START = "CAREER_START"
 
@@ -69,6 +71,20 @@ class ComputeDynamicEmployeeTenure(DataframeTransform):
 
         return super().__call__(dataframe, errors, conf, env)
 
+    def can_partition_by(self, column: str) -> bool:
+        """
+        This method returns whether the transform can be applied to the partitions of the
+        dataframe by the values of a column.
+
+        Args:
+            column (str): The name of the partition column.
+
+        Returns:
+            bool: True for EMPLOYEE_ID, the rows of an employee are only combined
+                together.
+        """
+        return column == EmployeeHistorySchema.EMPLOYEE_ID.name
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -1,7 +1,7 @@
 """ Class ComputeFirstVisitDate
 """
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.data.schema.augmented_visit_schema import AugmentedVisitSchema
@@ -13,6 +13,8 @@ from src.utility.environment import Environment
 class ComputeFirstVisitDate(DataframeTransform):
     """Computes the field EMPLOYEE_FIRST_VISIT"""
 
+    needs_whole_history = True
+
     def __call__(
         self,
         dataframe: DataFrame,
@@ -46,6 +48,18 @@ class ComputeFirstVisitDate(DataframeTransform):
 
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            AugmentedVisitSchema.EMPLOYEE_ID.name,
+            AugmentedVisitSchema.VISIT_START_AT.name,
+        ]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
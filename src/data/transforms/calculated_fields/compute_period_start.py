@@ -2,13 +2,14 @@
 This class splits row into period using period parameter
 """
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from pandas import DataFrame
 from src.data.schema.augmented_visit_schema import AugmentedVisitSchema
 from src.data.transforms.transform import DataframeTransform
 
 from src.data.error.error_dataframe import ErrorDataFrame
+from src.data.polars_backend import PolarsQuery, get_polars_duration, polars
 from src.utility.configs.config import Config
 from src.utility.environment import Environment
 
@@ -43,6 +44,56 @@ class ComputePeriodStart(DataframeTransform):
         ].dt.floor(period)
         return dataframe
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [AugmentedVisitSchema.VISIT_START_AT.name]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [AugmentedVisitSchema.PERIOD_START.name]
+
+    def supports_polars(self) -> bool:
+        """
+        This method returns whether the transform has a Polars implementation.
+
+        Returns:
+            bool: True.
+        """
+        return True
+
+    def apply_polars(
+        self,
+        query: PolarsQuery,
+        # pylint: disable=unused-argument
+        conf: Config,
+    ) -> PolarsQuery:
+        """
+        This method adds the transform to the lazy query of the polars backend.
+
+        Args:
+            query (PolarsQuery): The query of the previous transforms.
+            conf (Config): The config.
+
+        Returns:
+            PolarsQuery: The query with the transform.
+        """
+        query.lazyframe = query.lazyframe.with_columns(
+            polars.col(AugmentedVisitSchema.VISIT_START_AT.name)
+            .dt.truncate(get_polars_duration(self.period))
+            .alias(AugmentedVisitSchema.PERIOD_START.name)
+        )
+        return query
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
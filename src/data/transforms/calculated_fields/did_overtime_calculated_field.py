@@ -19,6 +19,8 @@ class DidOvertimeInPeriodCalculatedField(DataframeTransform):
     This class is used to calculate if an employee did overtime
     """
 
+    row_local = True
+
     def __call__(
         self,
         dataframe: DataFrame,
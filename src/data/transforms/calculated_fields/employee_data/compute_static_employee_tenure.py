@@ -3,6 +3,7 @@ This class is use to calculate the employee tenure
 """
 
 from ast import Tuple
+from typing import List, Optional
 import pandas as pd
 from pandas import DataFrame
 from tqdm.autonotebook import tqdm
@@ -32,6 +33,28 @@ class ComputeStaticEmployeeTenure(DataframeTransform):
         )
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            AugmentedVisitSchema.EMPLOYEE_TERMINATION_DATE.name,
+            AugmentedVisitSchema.EMPLOYEE_START_ON.name,
+            AugmentedVisitSchema.PERIOD_START.name,
+        ]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [AugmentedVisitSchema.EMPLOYEE_TENURE.name]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -0,0 +1,89 @@
+"""
+This module contains the ComputeVisitPay class
+"""
+from typing import List, Optional, Tuple
+from pandas import DataFrame
+
+from src.data.schema.visit_schema import VisitSchema
+from src.data.error.error_dataframe import ErrorDataFrame
+from src.data.transforms.calculated_fields.visit_data.visit_pay import (
+    get_hourly_pay,
+    get_replaced_computed_rate,
+    get_total_pay,
+    VISIT_PAY_CODE_VERSION,
+)
+from src.data.transforms.transform import DataframeTransform
+from src.utility.environment import Environment
+from src.utility.configs.config import Config
+
+
+class ComputeVisitPay(DataframeTransform):
+    """
+    This class is used to compute the pay of the visits in one pass. It replaces the
+    invalid computed rates like ReplaceInvalidComputedRate, then computes the total pay
+    like SumSalaryPerVisit and the hourly pay like HourlyPay.
+    """
+
+    code_version = VISIT_PAY_CODE_VERSION
+
+    def __call__(
+        self,
+        dataframe: DataFrame,
+        errors: ErrorDataFrame,
+        conf: Config,
+        env: Environment,
+    ) -> Tuple[DataFrame, ErrorDataFrame]:
+        computed_rate = get_replaced_computed_rate(dataframe)
+        hours_approved = dataframe[VisitSchema.VISIT_HOURS_APPROVED].to_numpy(
+            dtype=float
+        )
+        total_pay = get_total_pay(
+            computed_rate,
+            dataframe[VisitSchema.VISIT_COMPUTED_RATE_UNITS].to_numpy(),
+            hours_approved,
+        )
+        dataframe[VisitSchema.VISIT_COMPUTED_RATE] = computed_rate
+        dataframe[VisitSchema.VISIT_TOTAL_PAY] = total_pay
+        dataframe[VisitSchema.VISIT_HOURLY_PAY] = get_hourly_pay(
+            total_pay, hours_approved
+        )
+        return super().__call__(dataframe, errors, conf, env)
+
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            VisitSchema.VISIT_COMPUTED_RATE.name,
+            VisitSchema.VISIT_APPROVAL_STATUS.name,
+            VisitSchema.VISIT_CANCEL_CODE.name,
+            VisitSchema.VISIT_HOURS_APPROVED.name,
+            VisitSchema.VISIT_COMPUTED_RATE_UNITS.name,
+        ]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            VisitSchema.VISIT_COMPUTED_RATE.name,
+            VisitSchema.VISIT_TOTAL_PAY.name,
+            VisitSchema.VISIT_HOURLY_PAY.name,
+        ]
+
+    def to_dict(self) -> dict:
+        """
+        This method returns the dictionary representation of the class.
+
+        Returns:
+            dict: The dictionary representation of the class.
+        """
+        return {
+            "name": self.__class__.__name__,
+        }
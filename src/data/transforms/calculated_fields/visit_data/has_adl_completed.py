@@ -2,7 +2,7 @@
 Has ADL completed calculated field
 """
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -17,6 +17,8 @@ class HasADLComplete(DataframeTransform):
     Will be used in employee history calculated field stage to compute ADL completion rate.
     """
 
+    row_local = True
+
     def __call__(
         self,
         dataframe: DataFrame,
@@ -30,6 +32,24 @@ class HasADLComplete(DataframeTransform):
         )
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [VisitSchema.VISIT_HAS_ADL.name, VisitSchema.VISIT_ADL_COMPLETE.name]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [VisitSchema.VISIT_HAS_ADL_COMPLETED.name]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
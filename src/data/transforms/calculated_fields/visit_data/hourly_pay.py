@@ -1,11 +1,14 @@
 """
 This module contains the HourlyPay class
 """
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
-from tqdm.autonotebook import tqdm
 
 from src.data.schema.visit_schema import VisitSchema
+from src.data.transforms.calculated_fields.visit_data.visit_pay import (
+    get_hourly_pay,
+    VISIT_PAY_CODE_VERSION,
+)
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.data.transforms.transform import DataframeTransform
 from src.utility.environment import Environment
@@ -17,6 +20,9 @@ class HourlyPay(DataframeTransform):
     This class is used to calculate the hourly pay during a visit
     """
 
+    code_version = VISIT_PAY_CODE_VERSION
+    row_local = True
+
     def __call__(
         self,
         dataframe: DataFrame,
@@ -24,19 +30,30 @@ class HourlyPay(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> Tuple[DataFrame, ErrorDataFrame]:
-        tqdm.pandas(desc="Calculating visit hourly rate", position=3, leave=False)
-        dataframe[VisitSchema.VISIT_HOURLY_PAY] = (
-            dataframe[VisitSchema.VISIT_TOTAL_PAY]
-            / dataframe[VisitSchema.VISIT_HOURS_APPROVED]
+        dataframe[VisitSchema.VISIT_HOURLY_PAY] = get_hourly_pay(
+            dataframe[VisitSchema.VISIT_TOTAL_PAY].to_numpy(dtype=float),
+            dataframe[VisitSchema.VISIT_HOURS_APPROVED].to_numpy(dtype=float),
         )
-        dataframe[VisitSchema.VISIT_HOURLY_PAY][
-            dataframe[VisitSchema.VISIT_HOURLY_PAY] == "nan"
-        ] = None
-        dataframe[VisitSchema.VISIT_HOURLY_PAY][
-            dataframe[VisitSchema.VISIT_HOURLY_PAY] == float("inf")
-        ] = None
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [VisitSchema.VISIT_TOTAL_PAY.name, VisitSchema.VISIT_HOURS_APPROVED.name]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [VisitSchema.VISIT_HOURLY_PAY.name]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -1,11 +1,14 @@
 """
 SumSalaryPerVisit is a class used to calculate the total pay per visit
 """
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
-from tqdm.autonotebook import tqdm
 
 from src.data.schema.visit_schema import VisitSchema
+from src.data.transforms.calculated_fields.visit_data.visit_pay import (
+    get_total_pay,
+    VISIT_PAY_CODE_VERSION,
+)
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.data.transforms.transform import DataframeTransform
 from src.utility.environment import Environment
@@ -17,6 +20,9 @@ class SumSalaryPerVisit(DataframeTransform):
     This class is used to calculate the total pay per visit
     """
 
+    code_version = VISIT_PAY_CODE_VERSION
+    row_local = True
+
     def __call__(
         self,
         dataframe: DataFrame,
@@ -24,12 +30,35 @@ class SumSalaryPerVisit(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> Tuple[DataFrame, ErrorDataFrame]:
-        tqdm.pandas(desc="Summing salary per visit", position=3, leave=False)
-        dataframe[VisitSchema.VISIT_TOTAL_PAY] = dataframe.progress_apply(
-            self.compute_total_pay, axis=1
+        dataframe[VisitSchema.VISIT_TOTAL_PAY] = get_total_pay(
+            dataframe[VisitSchema.VISIT_COMPUTED_RATE].to_numpy(dtype=float),
+            dataframe[VisitSchema.VISIT_COMPUTED_RATE_UNITS].to_numpy(),
+            dataframe[VisitSchema.VISIT_HOURS_APPROVED].to_numpy(dtype=float),
         )
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            VisitSchema.VISIT_COMPUTED_RATE_UNITS.name,
+            VisitSchema.VISIT_COMPUTED_RATE.name,
+            VisitSchema.VISIT_HOURS_APPROVED.name,
+        ]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [VisitSchema.VISIT_TOTAL_PAY.name]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -40,16 +69,3 @@ class SumSalaryPerVisit(DataframeTransform):
         return {
             "name": self.__class__.__name__,
         }
-
-    def compute_total_pay(self, row):
-        """
-        This method computes the total pay per visit
-        """
-        if row[VisitSchema.VISIT_COMPUTED_RATE_UNITS] == "hours":
-            return (
-                row[VisitSchema.VISIT_COMPUTED_RATE]
-                * row[VisitSchema.VISIT_HOURS_APPROVED]
-            )
-        if row[VisitSchema.VISIT_COMPUTED_RATE_UNITS] == "visits":
-            return row[VisitSchema.VISIT_COMPUTED_RATE]
-        return None
@@ -0,0 +1,84 @@
+"""
+This module contains the vectorized computations of the pay of the visits, shared by
+ReplaceInvalidComputedRate, SumSalaryPerVisit, HourlyPay and ComputeVisitPay.
+"""
+from numpy import errstate, isfinite, nan, ndarray, select, where
+from pandas import DataFrame
+
+from src.data.schema.visit_schema import VisitSchema
+
+COMPUTED_RATE_UNITS = ["hours", "visits"]
+
+# The code version of the transforms computing the pay with this module. It must be
+# bumped when this module changes, since their cached outputs would not be recomputed.
+VISIT_PAY_CODE_VERSION = "1"
+
+
+def get_replaced_computed_rate(dataframe: DataFrame) -> ndarray:
+    """
+    Replace the invalid computed rates by the mean computed rate of their unit. A computed
+    rate is invalid if it is equal to zero, the visit hours approved is higher than zero,
+    the approval status is 1 and there is no cancel code. The means include the invalid
+    rates.
+
+    Args:
+        dataframe (DataFrame): The visits.
+
+    Returns:
+        ndarray: The computed rates.
+    """
+    computed_rate = dataframe[VisitSchema.VISIT_COMPUTED_RATE].to_numpy(dtype=float)
+    units = dataframe[VisitSchema.VISIT_COMPUTED_RATE_UNITS].to_numpy()
+    invalid = (
+        (computed_rate == 0)
+        & (dataframe[VisitSchema.VISIT_APPROVAL_STATUS] == 1).to_numpy()
+        & dataframe[VisitSchema.VISIT_CANCEL_CODE].isnull().to_numpy()
+        & (dataframe[VisitSchema.VISIT_HOURS_APPROVED] > 0).to_numpy()
+    )
+    units_masks = [units == unit for unit in COMPUTED_RATE_UNITS]
+    return select(
+        [invalid & units_mask for units_mask in units_masks],
+        [
+            dataframe[VisitSchema.VISIT_COMPUTED_RATE][units_mask].mean()
+            for units_mask in units_masks
+        ],
+        default=computed_rate,
+    )
+
+
+def get_total_pay(
+    computed_rate: ndarray, units: ndarray, hours_approved: ndarray
+) -> ndarray:
+    """
+    Compute the total pay of the visits, the rate times the hours approved for the hourly
+    rates and the rate for the visit rates.
+
+    Args:
+        computed_rate (ndarray): The computed rates.
+        units (ndarray): The units of the computed rates, "hours" or "visits".
+        hours_approved (ndarray): The hours approved.
+
+    Returns:
+        ndarray: The total pay, NaN for the other units.
+    """
+    return select(
+        [units == "hours", units == "visits"],
+        [computed_rate * hours_approved, computed_rate],
+        default=nan,
+    )
+
+
+def get_hourly_pay(total_pay: ndarray, hours_approved: ndarray) -> ndarray:
+    """
+    Compute the hourly pay of the visits.
+
+    Args:
+        total_pay (ndarray): The total pay.
+        hours_approved (ndarray): The hours approved.
+
+    Returns:
+        ndarray: The hourly pay, NaN when there are no hours approved.
+    """
+    with errstate(divide="ignore", invalid="ignore"):
+        hourly_pay = total_pay / hours_approved
+    return where(isfinite(hourly_pay), hourly_pay, nan)
@@ -2,7 +2,7 @@
 This module contains a class that calculates if an employee did overtime
 """
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 from tqdm.autonotebook import tqdm
 from src.utility.environment import Environment
@@ -37,6 +37,27 @@ class WasLateToVisitCalculatedField(DataframeTransform):
 
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            AugmentedVisitSchema.START_TIME.name,
+            AugmentedVisitSchema.VISIT_START_AT.name,
+        ]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [AugmentedVisitSchema.WAS_LATE_TO_VISIT.name]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -2,7 +2,7 @@
 Work hours deviation calculated field
 """
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -16,6 +16,8 @@ class WorkHoursDeviationCalculatedField(DataframeTransform):
     This class is used to calculate the work hours deviation
     """
 
+    row_local = True
+
     def __call__(
         self,
         dataframe: DataFrame,
@@ -29,6 +31,27 @@ class WorkHoursDeviationCalculatedField(DataframeTransform):
         )
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            VisitSchema.VISIT_HOURS_APPROVED.name,
+            VisitSchema.VISIT_SCHEDULED_DURATION.name,
+        ]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [VisitSchema.VISIT_WORK_HOURS_DEVIATION.name]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
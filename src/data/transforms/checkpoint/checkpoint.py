@@ -0,0 +1,147 @@
+"""
+This module contains the Checkpoint transform and the store of the checkpoints of a stage.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from pandas import DataFrame
+from src.data.error.error_dataframe import ErrorDataFrame
+from src.data.transforms.transform import DataframeTransform
+from src.utility.configs.config import Config
+from src.utility.dataframe_cache import CacheFormat, DataFrameCache
+from src.utility.environment import Environment
+
+
+class Checkpoint(DataframeTransform):
+    """
+    This class marks a point of the transforms list where the dataframe and the errors
+    are cached. When only the transforms after the checkpoint change, the stage resumes
+    from the checkpoint instead of applying every transform again.
+    """
+
+    def __call__(
+        self,
+        dataframe: DataFrame,
+        errors: ErrorDataFrame,
+        # pylint: disable=unused-argument
+        conf: Config,
+        env: Environment,
+    ) -> Tuple[DataFrame, ErrorDataFrame]:
+        return dataframe, errors
+
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return []
+
+    def can_partition_by(self, _column: str) -> bool:
+        """
+        This method returns whether the transform can be applied to the partitions of the
+        dataframe by the values of a column.
+
+        Args:
+            _column (str): The name of the partition column.
+
+        Returns:
+            bool: True, the checkpoint does not change the dataframe.
+        """
+        return True
+
+    def to_dict(self) -> dict:
+        """
+        This method returns the dictionary representation of the class.
+
+        Returns:
+            dict: The dictionary representation of the class.
+        """
+        return {
+            "name": self.__class__.__name__,
+        }
+
+
+class TransformCheckpoints:
+    """
+    This class stores the checkpoints of a stage in the dataframe cache.
+
+    Args:
+        cache (DataFrameCache): The cache.
+        stage_name (str): The name of the stage.
+        keys (Dict[int, int]): The key of each checkpoint by index in the transforms list.
+            The key is a hash of the transforms before the checkpoint.
+        cache_format (Optional[CacheFormat]): The format used to cache the dataframes.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: DataFrameCache,
+        stage_name: str,
+        keys: Dict[int, int],
+        cache_format: Optional[CacheFormat] = None,
+    ) -> None:
+        self.cache = cache
+        self.stage_name = stage_name
+        self.keys = keys
+        self.cache_format = cache_format
+
+    @property
+    def dataframe_sub_directory(self) -> str:
+        """
+        The sub directory of the checkpoints dataframes.
+        """
+        return f"{self.stage_name}/checkpoints/dataframe"
+
+    @property
+    def errors_sub_directory(self) -> str:
+        """
+        The sub directory of the checkpoints errors.
+        """
+        return f"{self.stage_name}/checkpoints/errors"
+
+    def load_latest(self) -> Optional[Tuple[int, DataFrame, ErrorDataFrame]]:
+        """
+        Load the checkpoint with the longest cached prefix.
+
+        Returns:
+            Optional[Tuple[int, DataFrame, ErrorDataFrame]]: The index of the checkpoint,
+                the dataframe and the errors or None if no checkpoint is cached.
+        """
+        for index in sorted(self.keys, reverse=True):
+            key = self.keys[index]
+            if self.cache.has(
+                key=key, sub_directory=self.dataframe_sub_directory
+            ) and self.cache.has(key=key, sub_directory=self.errors_sub_directory):
+                return (
+                    index,
+                    self.cache.get(key=key, sub_directory=self.dataframe_sub_directory),
+                    self.cache.get(key=key, sub_directory=self.errors_sub_directory),
+                )
+        return None
+
+    def save(self, index: int, dataframe: DataFrame, errors: ErrorDataFrame) -> None:
+        """
+        Cache the dataframe and the errors of the checkpoint.
+
+        Args:
+            index (int): The index of the checkpoint in the transforms list.
+            dataframe (DataFrame): The dataframe.
+            errors (ErrorDataFrame): The errors.
+        """
+        key = self.keys[index]
+        if not self.cache.has(key=key, sub_directory=self.dataframe_sub_directory):
+            self.cache.add(
+                key=key,
+                value=dataframe,
+                sub_directory=self.dataframe_sub_directory,
+                cache_format=self.cache_format,
+            )
+        if not self.cache.has(key=key, sub_directory=self.errors_sub_directory):
+            self.cache.add(
+                key=key,
+                value=errors,
+                sub_directory=self.errors_sub_directory,
+                cache_format="pickle",
+            )
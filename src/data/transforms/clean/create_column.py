@@ -1,7 +1,7 @@
 """
 This module contains a class to create new float columns
 """
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.utility.environment import Environment
@@ -32,6 +32,24 @@ class CreateColumn(DataframeTransform):
 
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return []
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [str(column) for column in self.columns]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -3,13 +3,14 @@ Transformation that fills in missing rows with padding in the EmployeeHistory da
 """
 
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame, date_range
 from tqdm.autonotebook import tqdm
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.data.schema.feature_type import FeatureType
 from src.data.schema.employee_history_schema import EmployeeHistorySchema
 from src.data.transforms.transform import DataframeTransform
+from src.data.polars_backend import PolarsQuery, get_polars_duration, polars
 from src.utility.configs.config import Config
 from src.utility.environment import Environment
 
@@ -22,6 +23,9 @@ class FillGaps(DataframeTransform):
         period_duration: The period duration to fill in the gaps with
     """
 
+    # the demographics are filled from the other rows of the employee
+    needs_whole_history = True
+
     PERIOD_START_2 = "PERIOD_START_2"
     CAREER_START = "CAREER_START"
     CAREER_END = "CAREER_END"
@@ -153,16 +157,7 @@ class FillGaps(DataframeTransform):
             progress_bar.set_description(
                 "Filling gaps : Fill missing values with previous values for demographics"
             )
-            demographics_columns = [
-                col.name
-                for col in EmployeeHistorySchema.columns
-                if (
-                    (col.feature_type == FeatureType.DEMOGRAPHIC)
-                    and (
-                        col.name != EmployeeHistorySchema.EMPLOYEE_TENURE.name
-                    )  # EMPLOYEE_TENURE is computed after FillGaps
-                )
-            ]
+            demographics_columns = self.get_demographics_columns()
             dataframe = dataframe.sort_values(
                 [EmployeeHistorySchema.EMPLOYEE_ID, EmployeeHistorySchema.PERIOD_START]
             )
@@ -181,11 +176,7 @@ class FillGaps(DataframeTransform):
             progress_bar.set_description(
                 "Filling gaps : Fill missing values with 0 for behavioral totals"
             )
-            behavioral_columns = [
-                col.name
-                for col in EmployeeHistorySchema.columns
-                if col.feature_type == FeatureType.BEHAVIORAL
-            ]
+            behavioral_columns = self.get_behavioral_columns()
 
             dataframe.loc[dataframe[self.IS_ORIGINAL_ROW] != 1, behavioral_columns] = 0
             progress_bar.update(1)
@@ -193,6 +184,150 @@ class FillGaps(DataframeTransform):
             dataframe = dataframe.drop(columns=[self.IS_ORIGINAL_ROW])
         return super().__call__(dataframe, errors, conf, env)
 
+    @staticmethod
+    def get_demographics_columns() -> List[str]:
+        """
+        This method returns the demographic columns, filled with the values of the other
+        periods of the employee.
+
+        Returns:
+            List[str]: The names of the columns.
+        """
+        return [
+            col.name
+            for col in EmployeeHistorySchema.columns
+            if (
+                (col.feature_type == FeatureType.DEMOGRAPHIC)
+                and (
+                    col.name != EmployeeHistorySchema.EMPLOYEE_TENURE.name
+                )  # EMPLOYEE_TENURE is computed after FillGaps
+            )
+        ]
+
+    @staticmethod
+    def get_behavioral_columns() -> List[str]:
+        """
+        This method returns the behavioral columns, filled with 0.
+
+        Returns:
+            List[str]: The names of the columns.
+        """
+        return [
+            col.name
+            for col in EmployeeHistorySchema.columns
+            if col.feature_type == FeatureType.BEHAVIORAL
+        ]
+
+    def supports_polars(self) -> bool:
+        """
+        This method returns whether the transform has a Polars implementation.
+
+        Returns:
+            bool: True.
+        """
+        return True
+
+    def apply_polars(
+        self,
+        query: PolarsQuery,
+        # pylint: disable=unused-argument
+        conf: Config,
+    ) -> PolarsQuery:
+        """
+        This method adds the transform to the lazy query of the polars backend. The
+        integer columns become floats, like the pandas columns with filled gaps.
+
+        Args:
+            query (PolarsQuery): The query of the previous transforms.
+            conf (Config): The config.
+
+        Returns:
+            PolarsQuery: The query with the transform.
+        """
+        keys = [
+            EmployeeHistorySchema.EMPLOYEE_ID.name,
+            EmployeeHistorySchema.PERIOD_START.name,
+        ]
+        original = query.lazyframe
+        schema = original.schema
+        periods = (
+            original.filter(polars.col(keys[0]).is_not_null())
+            .group_by(keys[0])
+            .agg(
+                polars.min_horizontal(
+                    polars.col(keys[1]).min(),
+                    polars.col(EmployeeHistorySchema.EMPLOYEE_START_ON.name).min(),
+                ).alias(self.CAREER_START),
+                polars.max_horizontal(
+                    polars.col(keys[1]).max(),
+                    polars.col(
+                        EmployeeHistorySchema.EMPLOYEE_TERMINATION_DATE.name
+                    ).max(),
+                ).alias(self.CAREER_END),
+            )
+            .select(
+                polars.col(keys[0]),
+                polars.datetime_ranges(
+                    polars.col(self.CAREER_START),
+                    polars.col(self.CAREER_END),
+                    interval=get_polars_duration(self.period_duration),
+                    time_unit=schema[keys[1]].time_unit,
+                ).alias(keys[1]),
+            )
+            .explode(keys[1])
+        )
+        original = original.with_columns(
+            [
+                polars.col(column).cast(polars.Float64)
+                for column, dtype in schema.items()
+                if column not in keys and dtype in polars.INTEGER_DTYPES
+            ]
+            + [polars.lit(1).alias(self.IS_ORIGINAL_ROW)]
+        )
+        is_gap = polars.col(self.IS_ORIGINAL_ROW).is_null()
+        behavioral_columns = self.get_behavioral_columns()
+        query.lazyframe = (
+            periods.join(original, on=keys, how="left")
+            .sort(keys)
+            .with_columns(
+                [
+                    polars.col(column).forward_fill().backward_fill().over(keys[0])
+                    for column in self.get_demographics_columns()
+                ]
+                + [
+                    polars.when(is_gap)
+                    .then(0.0)
+                    .otherwise(polars.col(column))
+                    .alias(column)
+                    for column in behavioral_columns
+                    if column in schema
+                ]
+            )
+            .with_columns(
+                [
+                    polars.when(is_gap).then(0.0).alias(column)
+                    for column in behavioral_columns
+                    if column not in schema
+                ]
+            )
+            .drop(self.IS_ORIGINAL_ROW)
+        )
+        return query
+
+    def can_partition_by(self, column: str) -> bool:
+        """
+        This method returns whether the transform can be applied to the partitions of the
+        dataframe by the values of a column.
+
+        Args:
+            column (str): The name of the partition column.
+
+        Returns:
+            bool: True for EMPLOYEE_ID, the rows of an employee are only combined
+                together.
+        """
+        return column == EmployeeHistorySchema.EMPLOYEE_ID.name
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -8,6 +8,9 @@ from src.utility.environment import Environment
 from src.utility.configs.config import Config
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.data.transforms.transform import DataframeTransform
+from src.data.polars_backend import PolarsQuery, polars
+
+ROW_NUMBER_COLUMN = "__ROW_NUMBER__"
 
 
 class Join(DataframeTransform):
@@ -66,6 +69,72 @@ class Join(DataframeTransform):
         )
         return super().__call__(dataframe, errors, conf, env)
 
+    def supports_polars(self) -> bool:
+        """
+        This method returns whether the transform has a Polars implementation.
+
+        Returns:
+            bool: True for the left and inner joins of a dataframe on columns.
+        """
+        return (
+            self.how in ["left", "inner"]
+            and self.on is not None
+            and not self.left_index
+            and not self.right_index
+            and isinstance(self.right, DataFrame)
+        )
+
+    def apply_polars(
+        self,
+        query: PolarsQuery,
+        # pylint: disable=unused-argument
+        conf: Config,
+    ) -> PolarsQuery:
+        """
+        This method adds the transform to the lazy query of the polars backend. The rows
+        keep the order of the left rows and the columns on both sides get the suffixes,
+        like pandas.
+
+        Args:
+            query (PolarsQuery): The query of the previous transforms.
+            conf (Config): The config.
+
+        Returns:
+            PolarsQuery: The query with the transform.
+        """
+        on = [str(column) for column in self.on]
+        left = query.lazyframe
+        right = polars.from_pandas(self.right).lazy()
+        left_schema = left.schema
+        shared_columns = (set(left_schema) & set(right.columns)) - set(on)
+        left = left.rename(
+            {column: f"{column}{self.suffixes[0]}" for column in shared_columns}
+        )
+        right = right.rename(
+            {column: f"{column}{self.suffixes[1]}" for column in shared_columns}
+        ).with_columns([polars.col(column).cast(left_schema[column]) for column in on])
+        query.lazyframe = (
+            left.with_row_count(ROW_NUMBER_COLUMN)
+            .join(right, on=on, how=self.how, join_nulls=True)
+            .sort(ROW_NUMBER_COLUMN, maintain_order=True)
+            .drop(ROW_NUMBER_COLUMN)
+        )
+        return query
+
+    def can_partition_by(self, _column: str) -> bool:
+        """
+        This method returns whether the transform can be applied to the partitions of the
+        dataframe by the values of a column.
+
+        Args:
+            _column (str): The name of the partition column.
+
+        Returns:
+            bool: True for the left and inner joins, every partition is joined with the
+                whole right dataframe.
+        """
+        return self.how in ["left", "inner"]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -2,7 +2,7 @@
 KeepColumns is a class used to keep columns in the dataframe.
 """
 
-from typing import List, Union, Tuple
+from typing import List, Optional, Tuple, Union
 from pandas import DataFrame
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -19,6 +19,8 @@ class KeepColumns(DataframeTransform):
         drop: Drop the columns.
     """
 
+    row_local = True
+
     def __init__(
         self,
         *,
@@ -42,6 +44,15 @@ class KeepColumns(DataframeTransform):
             dataframe = dataframe[self.columns]
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [str(column) for column in self.columns]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
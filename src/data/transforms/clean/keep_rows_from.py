@@ -0,0 +1,72 @@
+"""
+This class is used to keep the rows whose date is on or after the start date of their key.
+"""
+from typing import List, Optional, Tuple
+from pandas import DataFrame, Series, to_datetime
+from src.data.error.error_dataframe import ErrorDataFrame
+from src.utility.environment import Environment
+from src.utility.configs.config import Config
+from src.data.transforms.transform import DataframeTransform
+
+
+class KeepRowsFrom(DataframeTransform):
+    """
+    This class is used to keep the rows whose date is on or after the start date of their
+    key. The rows of the keys without start date are dropped.
+
+    Args:
+        key_column: The column of the keys.
+        date_column: The column of the dates.
+        start_dates: The start date by key.
+    """
+
+    row_local = True
+
+    def __init__(
+        self,
+        *,
+        key_column: str,
+        date_column: str,
+        start_dates: Series,
+    ) -> None:
+        self.key_column = key_column
+        self.date_column = date_column
+        self.start_dates = start_dates
+
+    def __call__(
+        self,
+        dataframe: DataFrame,
+        errors: ErrorDataFrame,
+        conf: Config,
+        env: Environment,
+    ) -> Tuple[DataFrame, ErrorDataFrame]:
+        start_dates = dataframe[self.key_column].map(self.start_dates)
+        dates = to_datetime(dataframe[self.date_column], errors="coerce")
+        dataframe = dataframe[(dates >= start_dates).to_numpy()]
+        return super().__call__(dataframe, errors, conf, env)
+
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [self.key_column, self.date_column]
+
+    def to_dict(self) -> dict:
+        """
+        This method returns the dictionary representation of the class.
+
+        Returns:
+            dict: The dictionary representation of the class.
+        """
+        return {
+            "name": self.__class__.__name__,
+            "key_column": self.key_column,
+            "date_column": self.date_column,
+            "start_dates": {
+                str(key): str(start_date)
+                for key, start_date in self.start_dates.items()
+            },
+        }
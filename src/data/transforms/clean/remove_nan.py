@@ -1,7 +1,7 @@
 """
 This class is used to remove the nan values from the dataframe. and replace them with None
 """
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.utility.environment import Environment
@@ -17,6 +17,8 @@ class RemoveNan(DataframeTransform):
         columns: The columns to remove the nan values from.
     """
 
+    row_local = True
+
     def __init__(
         self,
         columns: List[str] = None,
@@ -35,6 +37,24 @@ class RemoveNan(DataframeTransform):
 
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [str(column) for column in self.columns]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [str(column) for column in self.columns]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -2,7 +2,7 @@
 This module contains the RenameColumns class.
 """
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.utility.environment import Environment
@@ -19,6 +19,8 @@ class RenameColumns(DataframeTransform):
         to_schema: The schema to rename the columns to.
     """
 
+    row_local = True
+
     def __init__(
         self,
         to_schema: Schema,
@@ -48,6 +50,15 @@ class RenameColumns(DataframeTransform):
             )
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return []
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -4,7 +4,7 @@
 SetDateValueRange is a class used to set a range of valid dates for a column.
 """
 
-from typing import List, Optional, Union, Tuple
+from typing import List, Optional, Tuple, Union
 from pandas import DataFrame, Timestamp
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -23,6 +23,8 @@ class SetDateValueRange(DataframeTransform):
         max_value: The maximum value.
     """
 
+    row_local = True
+
     def __init__(
         self,
         columns: Union[str, List[str]] = None,
@@ -62,6 +64,15 @@ class SetDateValueRange(DataframeTransform):
                 dataframe = dataframe[dataframe[column] <= self.max_value]
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [str(column) for column in self.columns]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
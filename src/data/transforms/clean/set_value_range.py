@@ -4,13 +4,14 @@
 SetValueRange is a class used to set a range of valid values for a column.
 """
 
-from typing import Optional, Union, Tuple
+from typing import List, Optional, Tuple, Union
 from pandas import DataFrame
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
 from src.data.transforms.transform import DataframeTransform
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.data.error.error_id import ErrorId
+from src.data.polars_backend import PolarsQuery, polars
 
 
 class SetValueRange(DataframeTransform):
@@ -23,6 +24,8 @@ class SetValueRange(DataframeTransform):
         max_value: The maximum value.
     """
 
+    row_local = True
+
     def __init__(
         self,
         columns: Optional[str] = None,
@@ -62,6 +65,57 @@ class SetValueRange(DataframeTransform):
                 dataframe = dataframe[dataframe[column] <= self.max_value]
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [str(column) for column in self.columns]
+
+    def supports_polars(self) -> bool:
+        """
+        This method returns whether the transform has a Polars implementation.
+
+        Returns:
+            bool: True.
+        """
+        return True
+
+    def apply_polars(
+        self,
+        query: PolarsQuery,
+        # pylint: disable=unused-argument
+        conf: Config,
+    ) -> PolarsQuery:
+        """
+        This method adds the transform to the lazy query of the polars backend.
+
+        Args:
+            query (PolarsQuery): The query of the previous transforms.
+            conf (Config): The config.
+
+        Returns:
+            PolarsQuery: The query with the transform.
+        """
+        for column in self.columns:
+            if self.min_value is not None:
+                query = query.filter_with_errors(
+                    keep=polars.col(str(column)) >= self.min_value,
+                    error_condition=polars.col(str(column)) < self.min_value,
+                    error_id=ErrorId.OUT_OF_RANGE,
+                    error=f"{column} is less than {self.min_value}",
+                )
+            if self.max_value is not None:
+                query = query.filter_with_errors(
+                    keep=polars.col(str(column)) <= self.max_value,
+                    error_condition=polars.col(str(column)) > self.max_value,
+                    error_id=ErrorId.OUT_OF_RANGE,
+                    error=f"{column} is greater than {self.max_value}",
+                )
+        return query
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
@@ -2,7 +2,7 @@
 CSV Must Value Equal
 """
 
-from typing import Optional, Union, Tuple
+from typing import List, Optional, Tuple, Union
 from pandas import DataFrame
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -21,6 +21,8 @@ class ValueMustEqual(DataframeTransform):
         invert: Invert the condition. Default is False.
     """
 
+    row_local = True
+
     def __init__(
         self,
         column: Optional[str] = None,
@@ -60,6 +62,15 @@ class ValueMustEqual(DataframeTransform):
             dataframe = dataframe[dataframe[self.column] == self.value]
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [str(self.column)]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
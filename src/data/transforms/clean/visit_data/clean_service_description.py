@@ -2,7 +2,7 @@
 This class is used to clean the service description of the visit
 """
 
-from typing import Tuple
+from typing import List, Optional, Tuple
 import nltk
 from pandas import DataFrame
 from tqdm.autonotebook import tqdm
@@ -82,6 +82,24 @@ class CleanServiceDescription(DataframeTransform):
             return False
         return corpus[token] >= MIN_FREQUENCY
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [str(self.column)]
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [str(self.column)]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
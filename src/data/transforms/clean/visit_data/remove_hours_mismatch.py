@@ -1,7 +1,7 @@
 """
 This module contains the RemoveHoursMismatch class.
 """
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 
 from src.data.schema.augmented_visit_schema import AugmentedVisitSchema
@@ -56,6 +56,19 @@ class RemoveHoursMismatch(DataframeTransform):
 
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            AugmentedVisitSchema.VISIT_HOURS_APPROVED.name,
+            AugmentedVisitSchema.DAY_HOURS.name,
+            AugmentedVisitSchema.NIGHT_HOURS.name,
+        ]
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
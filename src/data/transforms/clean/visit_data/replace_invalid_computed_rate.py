@@ -1,10 +1,14 @@
 """
 ReplaceInvalidComputedRate is a class used to replace invalid computed rate
 """
-from typing import Tuple
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 
 from src.data.schema.visit_schema import VisitSchema
+from src.data.transforms.calculated_fields.visit_data.visit_pay import (
+    get_replaced_computed_rate,
+    VISIT_PAY_CODE_VERSION,
+)
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.data.transforms.transform import DataframeTransform
 from src.utility.environment import Environment
@@ -18,6 +22,8 @@ class ReplaceInvalidComputedRate(DataframeTransform):
     higher than zero, the approval status is 1 and there is no cancel code.
     """
 
+    code_version = VISIT_PAY_CODE_VERSION
+
     def __call__(
         self,
         dataframe: DataFrame,
@@ -25,43 +31,34 @@ class ReplaceInvalidComputedRate(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> Tuple[DataFrame, ErrorDataFrame]:
-        # Get the rows with invalid computed rate
-        invalid_computed_rate = dataframe.loc[
-            (dataframe[VisitSchema.VISIT_COMPUTED_RATE] == 0)
-            & (dataframe[VisitSchema.VISIT_APPROVAL_STATUS] == 1)
-            & (dataframe[VisitSchema.VISIT_CANCEL_CODE].isnull())
-            & (dataframe[VisitSchema.VISIT_HOURS_APPROVED] > 0)
-        ]
-
-        # Get the mean hourly rate
-        mean_hourly_pay = dataframe.loc[
-            dataframe[VisitSchema.VISIT_COMPUTED_RATE_UNITS] == "hours",
-            VisitSchema.VISIT_COMPUTED_RATE,
-        ].mean()
-
-        # Replace the invalid hourly computed rate by the mean
-        invalid_computed_rate.loc[
-            dataframe[VisitSchema.VISIT_COMPUTED_RATE_UNITS] == "hours",
-            VisitSchema.VISIT_COMPUTED_RATE,
-        ] = mean_hourly_pay
-
-        dataframe.update(invalid_computed_rate)
+        dataframe[VisitSchema.VISIT_COMPUTED_RATE] = get_replaced_computed_rate(
+            dataframe
+        )
+        return super().__call__(dataframe, errors, conf, env)
 
-        # Get the mean visit rate
-        mean_visit_rate = dataframe.loc[
-            dataframe[VisitSchema.VISIT_COMPUTED_RATE_UNITS] == "visits",
-            VisitSchema.VISIT_COMPUTED_RATE,
-        ].mean()
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
 
-        # Replace the invalid visit computed rate by the mean
-        invalid_computed_rate.loc[
-            dataframe[VisitSchema.VISIT_COMPUTED_RATE_UNITS] == "visits",
-            VisitSchema.VISIT_COMPUTED_RATE,
-        ] = mean_visit_rate
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [
+            VisitSchema.VISIT_COMPUTED_RATE.name,
+            VisitSchema.VISIT_APPROVAL_STATUS.name,
+            VisitSchema.VISIT_CANCEL_CODE.name,
+            VisitSchema.VISIT_HOURS_APPROVED.name,
+            VisitSchema.VISIT_COMPUTED_RATE_UNITS.name,
+        ]
 
-        dataframe.update(invalid_computed_rate)
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes.
 
-        return super().__call__(dataframe, errors, conf, env)
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return [VisitSchema.VISIT_COMPUTED_RATE.name]
 
     def to_dict(self) -> dict:
         """
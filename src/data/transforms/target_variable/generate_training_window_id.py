@@ -1,9 +1,9 @@
 """
 This module is used to generate the training window id.
 """
-from typing import Tuple
+from typing import Optional, Tuple
+from numpy import diff, flatnonzero, maximum, minimum, ndarray
 from pandas import DataFrame, to_datetime
-from tqdm.autonotebook import tqdm
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -13,19 +13,31 @@ from src.data.schema.employee_history_schema import EmployeeHistorySchema
 
 class GenerateTrainingWindowId(DataframeTransform):
     """
-    This class is used to generate the training window id.
+    This class is used to generate the training window id. The most recent period of
+    each employee is dropped and the other periods, from the most recent, are grouped
+    in windows of window_size periods starting every stride periods. The periods which
+    are not in a complete window are dropped.
+
+    Every period is kept once, with the id of the last window starting at or before it,
+    so the windows of the same id are contiguous. When the windows overlap, a window
+    spans the window_size periods from its start, see get_training_window_starts.
 
     Args:
         window_size (int): The size of the window.
+        stride (Optional[int]): The number of periods between the starts of two
+            windows of an employee. Defaults to None which uses the window size.
     """
 
     def __init__(
         self,
         *,
         window_size: int = None,
+        stride: Optional[int] = None,
     ) -> None:
         assert window_size > 0
+        assert stride is None or stride > 0
         self.window_size = window_size
+        self.stride = stride if stride is not None else window_size
 
     def __call__(
         self,
@@ -34,70 +46,49 @@ class GenerateTrainingWindowId(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> Tuple[DataFrame, ErrorDataFrame]:
-        tqdm.pandas(desc="Generating training window id", position=3, leave=False)
         dataframe[EmployeeHistorySchema.PERIOD_START] = to_datetime(
             dataframe[EmployeeHistorySchema.PERIOD_START]
         )
+        dataframe = dataframe.dropna(subset=[EmployeeHistorySchema.EMPLOYEE_ID])
         dataframe = dataframe.sort_values(
             by=[EmployeeHistorySchema.EMPLOYEE_ID, EmployeeHistorySchema.PERIOD_START],
-            ascending=False,
+            ascending=[True, False],
+            kind="mergesort",
+        )
+        employees = dataframe.groupby(
+            by=[EmployeeHistorySchema.EMPLOYEE_ID], sort=False
+        )
+
+        # the position of each period from the most recent one, which is dropped
+        position = employees.cumcount().to_numpy() - 1
+        n_periods = employees[EmployeeHistorySchema.EMPLOYEE_ID].transform("size")
+        n_periods = n_periods.to_numpy() - 1
+        n_windows = maximum(
+            (n_periods - self.window_size) // self.stride + 1,
+            0,
         )
 
-        # drop the first row for each employee where it is the most recent period
-        dataframe = (
-            dataframe.groupby(
-                by=[EmployeeHistorySchema.EMPLOYEE_ID],
-                as_index=False,
-            )
-            .progress_apply(lambda x: x.iloc[1:])
-            .reset_index(
-                drop=True,
-            )
+        # the windows are numbered from the windows of the previous employees
+        is_most_recent = position == -1
+        first_window_ids = (
+            n_windows[is_most_recent].cumsum() - n_windows[is_most_recent]
+        )
+        window_ids = first_window_ids[is_most_recent.cumsum() - 1] + minimum(
+            position // self.stride, n_windows - 1
         )
 
-        # add training window id ignoring the fact that there is there are invalid windows
+        # keep the periods of the complete windows
+        is_kept = (
+            (n_windows > 0)
+            & (position >= 0)
+            & (position < (n_windows - 1) * self.stride + self.window_size)
+        )
+        dataframe = dataframe[is_kept].reset_index(drop=True)
         dataframe.insert(
             loc=0,
             column=EmployeeHistorySchema.TRAINING_WINDOW_ID.name,
-            value=0,
-        )
-
-        dataframe[EmployeeHistorySchema.TRAINING_WINDOW_ID] = dataframe.groupby(
-            by=[EmployeeHistorySchema.EMPLOYEE_ID],
-            as_index=False,
-        ).cumcount()
-
-        dataframe[EmployeeHistorySchema.TRAINING_WINDOW_ID] = dataframe[
-            EmployeeHistorySchema.TRAINING_WINDOW_ID
-        ].progress_apply(lambda x: x // self.window_size)
-
-        # keep only valid windows
-        valid_window_size = dataframe.groupby(
-            by=[
-                EmployeeHistorySchema.EMPLOYEE_ID,
-                EmployeeHistorySchema.TRAINING_WINDOW_ID,
-            ],
-        ).size()
-        valid_window_size = valid_window_size[valid_window_size == self.window_size]
-        valid_window_size = valid_window_size.reset_index().drop(columns=[0])
-
-        dataframe = dataframe.merge(
-            right=valid_window_size,
-            how="inner",
-            on=[
-                EmployeeHistorySchema.EMPLOYEE_ID,
-                EmployeeHistorySchema.TRAINING_WINDOW_ID,
-            ],
-        ).drop(columns=[EmployeeHistorySchema.TRAINING_WINDOW_ID])
-
-        # reindex with the proper training window id
-        dataframe = dataframe.reset_index(drop=True).reset_index()
-        dataframe = dataframe.rename(
-            columns={"index": EmployeeHistorySchema.TRAINING_WINDOW_ID.name}
+            value=window_ids[is_kept],
         )
-        dataframe[EmployeeHistorySchema.TRAINING_WINDOW_ID] = dataframe[
-            EmployeeHistorySchema.TRAINING_WINDOW_ID
-        ].progress_apply(lambda x: x // self.window_size)
 
         return super().__call__(dataframe, errors, conf, env)
 
@@ -108,7 +99,28 @@ class GenerateTrainingWindowId(DataframeTransform):
         Returns:
             dict: The dictionary representation of the class.
         """
+        if self.stride != self.window_size:
+            return {
+                "name": self.__class__.__name__,
+                "window_size": self.window_size,
+                "stride": self.stride,
+            }
         return {
             "name": self.__class__.__name__,
             "window_size": self.window_size,
         }
+
+
+def get_training_window_starts(dataframe: DataFrame) -> ndarray:
+    """
+    Get the position of the first period of every training window, the window spans
+    the window size periods from it.
+
+    Args:
+        dataframe (DataFrame): The dataframe with the training window ids.
+
+    Returns:
+        ndarray: The positions of the first periods.
+    """
+    window_ids = dataframe[EmployeeHistorySchema.TRAINING_WINDOW_ID].to_numpy()
+    return flatnonzero(diff(window_ids, prepend=window_ids[:1] - 1) != 0)
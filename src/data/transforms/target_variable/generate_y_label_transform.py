@@ -2,9 +2,9 @@
 This module is used to generate the y label.
 """
 
-from typing import Literal, Tuple
-from pandas import DataFrame, date_range, MultiIndex, Timedelta, Timestamp
-from tqdm.autonotebook import tqdm
+from typing import List, Literal, Optional, Tuple
+from numpy import arange, repeat, searchsorted, tile, unique, where
+from pandas import DataFrame, Timedelta, date_range, factorize
 from src.data.error.error_dataframe import ErrorDataFrame
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -13,33 +13,48 @@ from src.data.schema.status_schema import StatusSchema
 from src.data.schema.y_label_schema import YLabelSchema
 
 
-def label_policy_30_days(current_date, termination_date) -> bool:
-    """
-    This function is used to label the employee as churned if the termination date is
-    within 30 days of the current date.
+LABEL_POLICY_HORIZONS = {
+    "7Days": Timedelta(days=7),
+    "30Days": Timedelta(days=30),
+    "60Days": Timedelta(days=60),
+    "90Days": Timedelta(days=90),
+}
 
-    Args:
-        current_date (Timestamp): The current date.
-        termination_date (Timestamp): The termination date.
-    """
-    return (
-        current_date <= termination_date
-        and termination_date - current_date <= Timedelta(days=30)
-    )
+LABEL_POLICY_COLUMNS = {
+    "7Days": YLabelSchema.Y_LABEL_7_DAYS,
+    "30Days": YLabelSchema.Y_LABEL_30_DAYS,
+    "60Days": YLabelSchema.Y_LABEL_60_DAYS,
+    "90Days": YLabelSchema.Y_LABEL_90_DAYS,
+}
 
 
-def label_policy_90_days(current_date, termination_date) -> bool:
+def select_y_label(dataframe: DataFrame, label_policy: str) -> DataFrame:
     """
-    This function is used to label the employee as churned if the termination date is
-    within 90 days of the current date.
+    This function selects the labels of a label policy as the Y_LABEL column and drops
+    the labels of the other label policies, so that they are not used as features.
 
     Args:
-        current_date (Timestamp): The current date.
-        termination_date (Timestamp): The termination date.
+        dataframe (DataFrame): The dataframe with the labels of every label policy.
+        label_policy (str): The label policy.
+
+    Returns:
+        DataFrame: The dataframe with the Y_LABEL column at the place of the labels.
     """
-    return (
-        current_date <= termination_date
-        and termination_date - current_date <= Timedelta(days=90)
+    label_columns = [
+        str(column)
+        for column in LABEL_POLICY_COLUMNS.values()
+        if column in dataframe.columns
+    ]
+    if len(label_columns) == 0:
+        return dataframe
+    return dataframe.rename(
+        columns={str(LABEL_POLICY_COLUMNS[label_policy]): str(YLabelSchema.Y_LABEL)}
+    ).drop(
+        columns=[
+            column
+            for column in label_columns
+            if column != LABEL_POLICY_COLUMNS[label_policy]
+        ]
     )
 
 
@@ -48,16 +63,23 @@ class GenerateYLabelTransform(DataframeTransform):
     This class is used to generate the y label.
 
     Args:
-        label_policy: The label policy.
+        label_policy: The label policy of the Y_LABEL column.
+        label_policies: The label policies whose labels are generated in one pass, in
+            the column of each label policy instead of Y_LABEL.
     """
 
     def __init__(
         self,
-        label_policy: Literal["30Days", "90Days"] = None,
+        label_policy: Literal["7Days", "30Days", "60Days", "90Days"] = None,
+        label_policies: Optional[List[str]] = None,
     ) -> None:
-        assert label_policy in ["30Days", "90Days"]
+        assert (label_policy is None) != (label_policies is None)
+        assert all(
+            policy in LABEL_POLICY_HORIZONS
+            for policy in (label_policies or [label_policy])
+        )
         self.label_policy = label_policy
-        self.label_function = None
+        self.label_policies = label_policies
 
     def __call__(
         self,
@@ -66,16 +88,9 @@ class GenerateYLabelTransform(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> Tuple[DataFrame, ErrorDataFrame]:
-        tqdm.pandas(desc="Generating Y Label", position=3, leave=False)
-
-        if self.label_policy == "30Days":
-            self.label_function = label_policy_30_days
-        elif self.label_policy == "90Days":
-            self.label_function = label_policy_90_days
-
         dataframe[YLabelSchema.STATUS_DATE] = dataframe[
             StatusSchema.STATUS_START_DATE
-        ].progress_map(lambda x: x.floor("D"))
+        ].dt.floor("D")
 
         # remove duplicates for same day update
         dataframe = dataframe.sort_values(
@@ -90,42 +105,80 @@ class GenerateYLabelTransform(DataframeTransform):
         dataframe = dataframe.dropna(subset=[StatusSchema.STATUS_HISTORICAL])
         dataframe = dataframe[[YLabelSchema.STATUS_DATE, StatusSchema.EMPLOYEE_ID]]
 
-        # create the indexes for the y label dataframe
-        last_status = dataframe[YLabelSchema.STATUS_DATE].max()
-        first_status = dataframe[YLabelSchema.STATUS_DATE].min()
-        indexes = MultiIndex.from_product(
-            [
-                dataframe[StatusSchema.EMPLOYEE_ID],
-                date_range(start=first_status, end=last_status, freq="D"),
-            ],
-            names=[YLabelSchema.EMPLOYEE_ID, YLabelSchema.PERIOD_START],
+        label_dataframe = self.get_labels(
+            employee_ids=dataframe[StatusSchema.EMPLOYEE_ID],
+            termination_dates=dataframe[YLabelSchema.STATUS_DATE],
         )
 
-        employee_termination_date_mapping = (
-            dataframe.groupby(StatusSchema.EMPLOYEE_ID)
-            .progress_apply(lambda x: x[YLabelSchema.STATUS_DATE].tolist())
-            .to_dict()
-        )
-
-        def compute_label(index):
-            employee_id = index[0]
-            current_date = Timestamp(index[1])
-
-            if employee_id not in employee_termination_date_mapping:
-                return None
+        return super().__call__(label_dataframe, errors, conf, env)
 
-            dates: list = employee_termination_date_mapping[employee_id]
+    def get_labels(self, *, employee_ids, termination_dates) -> DataFrame:
+        """
+        This method labels every day between the first and the last termination for
+        every terminated employee. A day is labeled 1 if one of the terminations of the
+        employee is within the horizon of the label policy from that day. The next
+        termination of each day is found once with a binary search over the terminations
+        sorted by employee and date, and compared to the horizon of every label policy.
 
-            for date in dates:
-                if self.label_function(current_date, Timestamp(date)):
-                    return 1
-            return 0
+        Args:
+            employee_ids (Series): The employee id of each termination.
+            termination_dates (Series): The day of each termination.
 
-        label_dataframe = DataFrame(index=indexes, columns=[YLabelSchema.Y_LABEL])
-        label_dataframe[YLabelSchema.Y_LABEL] = label_dataframe.index.map(compute_label)
-        label_dataframe = label_dataframe.dropna().reset_index()
+        Returns:
+            DataFrame: The EMPLOYEE_ID, PERIOD_START and labels of every employee day.
+        """
+        label_columns = (
+            {self.label_policy: YLabelSchema.Y_LABEL}
+            if self.label_policies is None
+            else {
+                policy: LABEL_POLICY_COLUMNS[policy] for policy in self.label_policies
+            }
+        )
+        if len(termination_dates) == 0:
+            return DataFrame(
+                columns=[
+                    YLabelSchema.EMPLOYEE_ID,
+                    YLabelSchema.PERIOD_START,
+                    *label_columns.values(),
+                ]
+            )
+        days = date_range(
+            start=termination_dates.min(), end=termination_dates.max(), freq="D"
+        )
+        employee_codes, employees = factorize(employee_ids)
+        termination_days = (
+            (termination_dates - days[0]) // Timedelta(days=1)
+        ).to_numpy()
+
+        # the terminations and the days are sorted by employee then by day
+        n_keys = len(days) + 1
+        termination_keys = unique(employee_codes * n_keys + termination_days)
+        day_keys = repeat(arange(len(employees)) * n_keys, len(days)) + tile(
+            arange(len(days)), len(employees)
+        )
+        next_termination = searchsorted(termination_keys, day_keys)
+        next_termination_keys = termination_keys[
+            next_termination.clip(max=len(termination_keys) - 1)
+        ]
+        days_to_next_termination = where(
+            (next_termination < len(termination_keys))
+            & (next_termination_keys // n_keys == day_keys // n_keys),
+            next_termination_keys - day_keys,
+            n_keys,
+        )
 
-        return super().__call__(label_dataframe, errors, conf, env)
+        return DataFrame(
+            {
+                YLabelSchema.EMPLOYEE_ID: repeat(employees, len(days)),
+                YLabelSchema.PERIOD_START: tile(days, len(employees)),
+                **{
+                    column: (
+                        days_to_next_termination <= LABEL_POLICY_HORIZONS[policy].days
+                    ).astype(int)
+                    for policy, column in label_columns.items()
+                },
+            }
+        )
 
     def to_dict(self) -> dict:
         """
@@ -134,6 +187,11 @@ class GenerateYLabelTransform(DataframeTransform):
         Returns:
             dict: The dictionary representation of the class.
         """
+        if self.label_policies is not None:
+            return {
+                "name": self.__class__.__name__,
+                "label_policies": self.label_policies,
+            }
         return {
             "name": self.__class__.__name__,
             "label_policy": self.label_policy,
@@ -2,7 +2,10 @@
 DataframeTransform is an abstract class that defines the interface for all DataframeTransform.
 """
 from abc import ABC, abstractmethod
-from typing import Tuple
+from functools import lru_cache
+from hashlib import new
+from inspect import getmodule, getsource
+from typing import List, Optional, Tuple
 from pandas import DataFrame
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -12,8 +15,22 @@ from src.data.error.error_dataframe import ErrorDataFrame
 class DataframeTransform(ABC):
     """
     This class is an abstract class that defines the interface for all DataframeTransforms.
+
+    Attributes:
+        code_version (Optional[str]): An explicit version of the transform code. When it is
+            None the version is a hash of the source of the transform modules, without
+            the module of DataframeTransform.
+        row_local (bool): Whether each output row only depends on its input row, in which
+            case the transform can be applied to chunks of the dataframe.
+        needs_whole_history (bool): Whether the output rows of an employee depend on all
+            of its rows, such as its first visit date, in which case the transform can not
+            be run on the recent rows of an incremental run.
     """
 
+    code_version: Optional[str] = None
+    row_local: bool = False
+    needs_whole_history: bool = False
+
     @abstractmethod
     def __call__(
         self,
@@ -33,3 +50,93 @@ class DataframeTransform(ABC):
         Returns:
             dict: The dictionary representation of the class.
         """
+
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns or None when the transform may
+                read any column.
+        """
+        return None
+
+    def get_write_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform writes, when writing
+        them is all the transform does. A transform whose written columns are never read
+        afterwards can then be skipped.
+
+        Returns:
+            Optional[List[str]]: The names of the columns or None when the transform also
+                changes the rows, the index or has side effects.
+        """
+        return None
+
+    def can_partition_by(self, _column: str) -> bool:
+        """
+        This method returns whether the transform can be applied to the partitions of the
+        dataframe by the values of a column, each partition holding all the rows of its
+        values, and give the same rows as applied to the whole dataframe.
+
+        Args:
+            _column (str): The name of the partition column.
+
+        Returns:
+            bool: Whether the transform only combines the rows with the same value of
+                the column. Defaults to whether the transform is row local.
+        """
+        return self.row_local
+
+    def supports_polars(self) -> bool:
+        """
+        This method returns whether the transform has a Polars implementation, used by
+        the polars backend of process_dataframe. The transforms returning True define
+        apply_polars(query, conf), which adds the transform to the PolarsQuery of the
+        previous transforms, and the other transforms are applied with pandas. The pandas
+        implementation stays the reference and the Polars one must give the same rows.
+
+        Returns:
+            bool: Whether the transform defines apply_polars.
+        """
+        return False
+
+    @classmethod
+    def get_code_version(cls) -> str:
+        """
+        This method returns the version of the transform code, so that the cached
+        outputs are recomputed when the code changes.
+
+        Returns:
+            str: The explicit code version or a hash of the source of the modules
+                defining the class and its parent transforms.
+        """
+        if cls.code_version is not None:
+            return cls.code_version
+        return _hash_source(cls)
+
+
+@lru_cache(maxsize=None)
+def _hash_source(transform_class: type) -> str:
+    """
+    Hash the source of the modules defining the transform class and its parent
+    transforms, so that the helpers of these modules are part of the code version. The
+    module of DataframeTransform is left out, the interface does not change the output
+    of the transforms and an edit of it would invalidate every cached stage.
+    """
+    hasher = new("sha256")
+    modules = []
+    for parent_class in transform_class.__mro__:
+        if (
+            issubclass(parent_class, DataframeTransform)
+            and parent_class is not DataframeTransform
+        ):
+            module = getmodule(parent_class)
+            if module is not None and module in modules:
+                continue
+            modules.append(module)
+            try:
+                hasher.update(getsource(module or parent_class).encode())
+            except (OSError, TypeError):
+                hasher.update(parent_class.__qualname__.encode())
+    return hasher.hexdigest()
@@ -1,6 +1,7 @@
 """
 This module contains the SetTypesClient class, which is used to set the types of the client data.
 """
+from typing import List, Optional
 from pandas import DataFrame, to_datetime
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -12,6 +13,7 @@ from src.data.schema.client_schema import ClientSchema
 class SetTypesClient(DataframeTransform):
     """
     This class is used to set the types of the client data.
+    The columns that are not in the dataframe are skipped.
     """
 
     def __call__(
@@ -21,61 +23,83 @@ class SetTypesClient(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> DataFrame:
-        dataframe[ClientSchema.CLIENT_ID] = dataframe[ClientSchema.CLIENT_ID].astype(
-            int, errors="ignore"
-        )
-
-        dataframe[ClientSchema.CLIENT_AGE] = dataframe[ClientSchema.CLIENT_AGE].astype(
-            int, errors="ignore"
-        )
-
-        dataframe[ClientSchema.CLIENT_ADMISSION_DATE] = to_datetime(
-            dataframe[ClientSchema.CLIENT_ADMISSION_DATE],
-            errors="coerce",
-        )
-
-        dataframe[ClientSchema.CLIENT_DISCHARGE_DATE] = to_datetime(
-            dataframe[ClientSchema.CLIENT_DISCHARGE_DATE],
-            errors="coerce",
-        )
-
-        dataframe[ClientSchema.CLIENT_PREFERRED_LANGUAGE] = dataframe[
-            ClientSchema.CLIENT_PREFERRED_LANGUAGE
-        ].astype(str, errors="ignore")
-
-        dataframe[ClientSchema.CLIENT_LENGTH_OF_STAY] = dataframe[
-            ClientSchema.CLIENT_LENGTH_OF_STAY
-        ].astype(int, errors="ignore")
-
-        dataframe[ClientSchema.CLIENT_HAS_ADLS] = dataframe[
-            ClientSchema.CLIENT_HAS_ADLS
-        ].astype(int, errors="ignore")
-
-        dataframe[ClientSchema.CLIENT_COUNTRY] = dataframe[
-            ClientSchema.CLIENT_COUNTRY
-        ].astype(str, errors="ignore")
-
-        dataframe[ClientSchema.CLIENT_GENDER] = (
-            dataframe[ClientSchema.CLIENT_GENDER]
-            .fillna("O")
-            .astype(str, errors="ignore")
-        )
-
-        dataframe[ClientSchema.CLIENT_LATITUDE] = dataframe[
-            ClientSchema.CLIENT_LATITUDE
-        ].astype(float, errors="ignore")
-
-        dataframe[ClientSchema.CLIENT_LONGITUDE] = dataframe[
-            ClientSchema.CLIENT_LONGITUDE
-        ].astype(float, errors="ignore")
-
-        dataframe[ClientSchema.CLIENT_DIAGNOSIS] = (
-            dataframe[ClientSchema.CLIENT_DIAGNOSIS]
-            .fillna("")
-            .astype(str, errors="ignore")
-        )
+        if ClientSchema.CLIENT_ID in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_ID] = dataframe[
+                ClientSchema.CLIENT_ID
+            ].astype(int, errors="ignore")
+
+        if ClientSchema.CLIENT_AGE in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_AGE] = dataframe[
+                ClientSchema.CLIENT_AGE
+            ].astype(int, errors="ignore")
+
+        if ClientSchema.CLIENT_ADMISSION_DATE in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_ADMISSION_DATE] = to_datetime(
+                dataframe[ClientSchema.CLIENT_ADMISSION_DATE],
+                errors="coerce",
+            )
+
+        if ClientSchema.CLIENT_DISCHARGE_DATE in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_DISCHARGE_DATE] = to_datetime(
+                dataframe[ClientSchema.CLIENT_DISCHARGE_DATE],
+                errors="coerce",
+            )
+
+        if ClientSchema.CLIENT_PREFERRED_LANGUAGE in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_PREFERRED_LANGUAGE] = dataframe[
+                ClientSchema.CLIENT_PREFERRED_LANGUAGE
+            ].astype(str, errors="ignore")
+
+        if ClientSchema.CLIENT_LENGTH_OF_STAY in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_LENGTH_OF_STAY] = dataframe[
+                ClientSchema.CLIENT_LENGTH_OF_STAY
+            ].astype(int, errors="ignore")
+
+        if ClientSchema.CLIENT_HAS_ADLS in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_HAS_ADLS] = dataframe[
+                ClientSchema.CLIENT_HAS_ADLS
+            ].astype(int, errors="ignore")
+
+        if ClientSchema.CLIENT_COUNTRY in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_COUNTRY] = dataframe[
+                ClientSchema.CLIENT_COUNTRY
+            ].astype(str, errors="ignore")
+
+        if ClientSchema.CLIENT_GENDER in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_GENDER] = (
+                dataframe[ClientSchema.CLIENT_GENDER]
+                .fillna("O")
+                .astype(str, errors="ignore")
+            )
+
+        if ClientSchema.CLIENT_LATITUDE in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_LATITUDE] = dataframe[
+                ClientSchema.CLIENT_LATITUDE
+            ].astype(float, errors="ignore")
+
+        if ClientSchema.CLIENT_LONGITUDE in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_LONGITUDE] = dataframe[
+                ClientSchema.CLIENT_LONGITUDE
+            ].astype(float, errors="ignore")
+
+        if ClientSchema.CLIENT_DIAGNOSIS in dataframe.columns:
+            dataframe[ClientSchema.CLIENT_DIAGNOSIS] = (
+                dataframe[ClientSchema.CLIENT_DIAGNOSIS]
+                .fillna("")
+                .astype(str, errors="ignore")
+            )
+
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return []
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
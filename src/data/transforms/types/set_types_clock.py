@@ -1,6 +1,7 @@
 """
 This module contains the SetTypesClock class, which is used to set the types of the clock data.
 """
+from typing import List, Optional
 from pandas import DataFrame, to_datetime
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -12,8 +13,11 @@ from src.data.schema.clock_schema import ClockSchema
 class SetTypesClock(DataframeTransform):
     """
     This class is used to set the types of the clock data.
+    The columns that are not in the dataframe are skipped.
     """
 
+    row_local = True
+
     def __call__(
         self,
         dataframe: DataFrame,
@@ -21,22 +25,39 @@ class SetTypesClock(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> DataFrame:
-        dataframe[ClockSchema.VISIT_ID] = dataframe[ClockSchema.VISIT_ID].astype(
-            int, errors="ignore"
-        )
-        dataframe[ClockSchema.PUNCH] = dataframe[ClockSchema.PUNCH].astype(
-            int, errors="ignore"
-        )
-        dataframe[ClockSchema.START_TIME] = to_datetime(
-            dataframe[ClockSchema.START_TIME],
-            errors="coerce",
-        )
-        dataframe[ClockSchema.END_TIME] = to_datetime(
-            dataframe[ClockSchema.END_TIME],
-            errors="coerce",
-        )
+        if ClockSchema.VISIT_ID in dataframe.columns:
+            dataframe[ClockSchema.VISIT_ID] = dataframe[ClockSchema.VISIT_ID].astype(
+                int, errors="ignore"
+            )
+
+        if ClockSchema.PUNCH in dataframe.columns:
+            dataframe[ClockSchema.PUNCH] = dataframe[ClockSchema.PUNCH].astype(
+                int, errors="ignore"
+            )
+
+        if ClockSchema.START_TIME in dataframe.columns:
+            dataframe[ClockSchema.START_TIME] = to_datetime(
+                dataframe[ClockSchema.START_TIME],
+                errors="coerce",
+            )
+
+        if ClockSchema.END_TIME in dataframe.columns:
+            dataframe[ClockSchema.END_TIME] = to_datetime(
+                dataframe[ClockSchema.END_TIME],
+                errors="coerce",
+            )
+
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return []
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
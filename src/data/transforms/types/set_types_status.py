@@ -1,6 +1,7 @@
 """
 This module contains the SetTypesStatus class, which is used to set the types of the status data.
 """
+from typing import List, Optional
 from pandas import DataFrame, to_datetime
 from src.utility.environment import Environment
 from src.utility.configs.config import Config
@@ -12,6 +13,7 @@ from src.data.schema.status_schema import StatusSchema
 class SetTypesStatus(DataframeTransform):
     """
     This class is used to set the types of the status data.
+    The columns that are not in the dataframe are skipped.
     """
 
     def __call__(
@@ -21,25 +23,44 @@ class SetTypesStatus(DataframeTransform):
         conf: Config,
         env: Environment,
     ) -> DataFrame:
-        dataframe[StatusSchema.EMPLOYEE_ID] = dataframe[
-            StatusSchema.EMPLOYEE_ID
-        ].astype(int, errors="ignore")
-        dataframe[StatusSchema.STATUS_HISTORICAL] = dataframe[
-            StatusSchema.STATUS_HISTORICAL
-        ].astype(str, errors="ignore")
-        dataframe[StatusSchema.STATUS_START_DATE] = to_datetime(
-            dataframe[StatusSchema.STATUS_START_DATE],
-            errors="coerce",
-        )
-        dataframe[StatusSchema.STATUS_END_DATE] = to_datetime(
-            dataframe[StatusSchema.STATUS_END_DATE],
-            errors="coerce",
-        )
-        dataframe[StatusSchema.STATUS_DAYS] = dataframe[
-            StatusSchema.STATUS_DAYS
-        ].astype(int, errors="ignore")
+        if StatusSchema.EMPLOYEE_ID in dataframe.columns:
+            dataframe[StatusSchema.EMPLOYEE_ID] = dataframe[
+                StatusSchema.EMPLOYEE_ID
+            ].astype(int, errors="ignore")
+
+        if StatusSchema.STATUS_HISTORICAL in dataframe.columns:
+            dataframe[StatusSchema.STATUS_HISTORICAL] = dataframe[
+                StatusSchema.STATUS_HISTORICAL
+            ].astype(str, errors="ignore")
+
+        if StatusSchema.STATUS_START_DATE in dataframe.columns:
+            dataframe[StatusSchema.STATUS_START_DATE] = to_datetime(
+                dataframe[StatusSchema.STATUS_START_DATE],
+                errors="coerce",
+            )
+
+        if StatusSchema.STATUS_END_DATE in dataframe.columns:
+            dataframe[StatusSchema.STATUS_END_DATE] = to_datetime(
+                dataframe[StatusSchema.STATUS_END_DATE],
+                errors="coerce",
+            )
+
+        if StatusSchema.STATUS_DAYS in dataframe.columns:
+            dataframe[StatusSchema.STATUS_DAYS] = dataframe[
+                StatusSchema.STATUS_DAYS
+            ].astype(int, errors="ignore")
+
         return super().__call__(dataframe, errors, conf, env)
 
+    def get_read_columns(self) -> Optional[List[str]]:
+        """
+        This method returns the names of the columns the transform reads.
+
+        Returns:
+            Optional[List[str]]: The names of the columns.
+        """
+        return []
+
     def to_dict(self) -> dict:
         """
         This method returns the dictionary representation of the class.
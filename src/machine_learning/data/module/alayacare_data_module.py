@@ -16,6 +16,9 @@ from src.data.ingestion_pipeline.ingestion_pipeline_stages import (
 )
 from src.machine_learning.data.dataset.alayacare_dataset import AlayaCareDataset
 from src.data.schema.employee_history_schema import EmployeeHistorySchema
+from src.data.transforms.target_variable.generate_y_label_transform import (
+    select_y_label,
+)
 from src.machine_learning.data.tensor_schema import TensorSchema
 from src.machine_learning.data.over_sampler import OverSampler
 
@@ -106,9 +109,12 @@ class AlayaCareDataModule(LightningDataModule):
         self.ingestion_pipeline.run_pipeline(
             stage_name=IngestionPipelineStages.TRAINING_EMPLOYEE_HISTORY_STAGE
         )
-        dataframe = self.ingestion_pipeline.dataframes[
-            IngestionPipelineStages.TRAINING_EMPLOYEE_HISTORY_STAGE
-        ]
+        dataframe = select_y_label(
+            self.ingestion_pipeline.dataframes[
+                IngestionPipelineStages.TRAINING_EMPLOYEE_HISTORY_STAGE
+            ],
+            self.config.label_policy,
+        )
 
         dataframe = dataframe[
             [
@@ -13,6 +13,9 @@ from src.data.ingestion_pipeline.ingestion_pipeline import IngestionPipeline
 from src.data.ingestion_pipeline.ingestion_pipeline_stages import (
     IngestionPipelineStages,
 )
+from src.data.transforms.target_variable.generate_y_label_transform import (
+    select_y_label,
+)
 from src.machine_learning.data.tensor_schema import TensorSchema
 from src.machine_learning.data.over_sampler import OverSampler
 from src.machine_learning.data.dataset.timesnet_dataset import TimesNetDataset
@@ -70,9 +73,12 @@ class TimesNetDataModule(LightningDataModule):
             stage_name=IngestionPipelineStages.TRAINING_EMPLOYEE_HISTORY_STAGE
         )
         self.dataset = TimesNetDataset(
-            dataframe=self.ingestion_pipeline.dataframes[
-                IngestionPipelineStages.TRAINING_EMPLOYEE_HISTORY_STAGE
-            ],
+            dataframe=select_y_label(
+                self.ingestion_pipeline.dataframes[
+                    IngestionPipelineStages.TRAINING_EMPLOYEE_HISTORY_STAGE
+                ],
+                self.config.label_policy,
+            ),
             config=self.config,
             sequence_length=self.sequence_length,
             columns=self.columns,
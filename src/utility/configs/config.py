@@ -25,7 +25,8 @@ class Config:
             }
         batch_size: The batch size to use for the training.
         training_window_size: The size of the training window.
-        label_policy: The label policy to use.
+        label_policy: The label policy to use, the horizon of the labels selected for
+            training among the labels of every horizon.
         limit_dataframe_size: The limit of the dataframe size.
         period_duration: The duration of the period.
         cutoff: The cutoff to use for the training.
@@ -35,6 +36,8 @@ class Config:
         model_config: The configuration of the model.
         data_module: The data module to use.
         is_test_run: Whether this is a test run.
+        max_error_examples: The number of example rows kept by error id and error,
+            the errors are still all counted. None keeps every row.
     """
 
     # pylint: disable=too-many-arguments, too-many-instance-attributes, too-many-locals
@@ -51,7 +54,7 @@ class Config:
         training_window_size: int = None,
         limit_dataframe_size: int = None,
         debug_flags: dict = None,
-        label_policy: Literal["30Days", "90Days"] = None,
+        label_policy: Literal["7Days", "30Days", "60Days", "90Days"] = None,
         period_start: Timestamp = None,
         period_end: Timestamp = None,
         period_duration: Literal[
@@ -87,6 +90,7 @@ class Config:
         data_module_args: dict = None,
         is_test_run: bool = False,
         num_workers: int = 0,
+        max_error_examples: int = None,
     ) -> None:
         assert load_id is not None
         assert n_splits is not None
@@ -97,7 +101,7 @@ class Config:
         assert training_window_size is not None
         assert label_policy is not None
         assert period_duration is not None
-        assert label_policy in ["30Days", "90Days"]
+        assert label_policy in ["7Days", "30Days", "60Days", "90Days"]
         assert period_duration in ["1D", "2D", "3D", "4D", "5D", "7D", "14D", "30D"]
         assert model is not None
         assert cutoff is not None
@@ -125,6 +129,7 @@ class Config:
         self.data_module_args = data_module_args if data_module_args is not None else {}
         self.is_test_run = is_test_run
         self.num_workers = num_workers
+        self.max_error_examples = max_error_examples
         self.debug_flags = (
             debug_flags
             if debug_flags is not None
@@ -166,6 +171,7 @@ class Config:
             "data_module_args": self.data_module_args,
             "is_test_run": self.is_test_run,
             "num_workers": self.num_workers,
+            "max_error_examples": self.max_error_examples,
             "debug_flags": self.debug_flags,
         }
 
@@ -202,6 +208,9 @@ class Config:
             num_workers=config_dict["config"]["num_workers"]
             if "num_workers" in config_dict["config"]
             else 0,
+            max_error_examples=config_dict["config"]["max_error_examples"]
+            if "max_error_examples" in config_dict["config"]
+            else None,
             debug_flags=config_dict["config"]["debug_flags"]
             if "debug_flags" in config_dict["config"]
             else {
@@ -42,4 +42,5 @@ EBM_CONFIG = Config(
         "max_rounds": 15_000,
     },
     is_test_run=False,
+    max_error_examples=100,
 )
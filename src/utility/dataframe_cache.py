@@ -1,11 +1,27 @@
 """
 A module to represent a dataframe cache.
 """
-from os import path, removedirs, makedirs
-from typing import Optional
+from json import dump, load
+from os import makedirs, path, remove, replace, walk
+from shutil import rmtree
+from time import time
+from typing import Dict, Iterable, List, Literal, Optional, Set
 from pandas import DataFrame, read_pickle
+from pyarrow import (
+    ArrowInvalid,
+    ArrowNotImplementedError,
+    ArrowTypeError,
+    Schema,
+    Table,
+    ipc,
+    memory_map,
+)
+from pyarrow import parquet
+from colored import Fore, Style
 from src.utility.environment import Environment
 
+CacheFormat = Literal["pickle", "parquet", "feather"]
+
 
 class DataFrameCache:
     """
@@ -13,24 +29,104 @@ class DataFrameCache:
 
     Args:
         environment (Environment): The environment.
+        cache_format (CacheFormat): The default storage format of the dataframes.
+            "pickle" keeps the dataframe as is, "parquet" and "feather" (Arrow IPC) store
+            the dataframe by columns. Feather files are read memory-mapped.
+            Defaults to "pickle".
+        compression (Optional[str]): The default compression of the columnar formats.
+            Parquet defaults to "snappy" and feather to uncompressed, which is required
+            for the memory mapping to avoid copying the data. Defaults to None.
+        max_size (Optional[int]): The budget of the cache in bytes. When it is exceeded,
+            the least recently used entries that are not pinned are evicted.
+            Defaults to None which never evicts.
+
+    A manifest stored at the root of the cache directory records the stage, the size
+    and the last access time of every entry.
     """
 
-    def __init__(self, environment: Environment) -> None:
+    MANIFEST_FILENAME = "manifest.json"
+
+    EXTENSIONS = {
+        "pickle": "pkl",
+        "parquet": "parquet",
+        "feather": "feather",
+    }
+
+    def __init__(
+        self,
+        environment: Environment,
+        cache_format: CacheFormat = "pickle",
+        compression: Optional[str] = None,
+        max_size: Optional[int] = None,
+    ) -> None:
+        assert cache_format in self.EXTENSIONS
+        assert max_size is None or max_size > 0
         self.cache_dir = environment.cache_dir
+        self.cache_format = cache_format
+        self.compression = compression
+        self.max_size = max_size
+        self.pinned_keys: Set[str] = set()
+        self.__manifest: Optional[Dict[str, dict]] = None
+        self.__removed_paths: Set[str] = set()
 
-    def add(self, *, key: int, value: DataFrame, sub_directory: str) -> None:
+    def add(
+        self,
+        *,
+        key: int,
+        value: DataFrame,
+        sub_directory: str,
+        cache_format: Optional[CacheFormat] = None,
+        compression: Optional[str] = None,
+    ) -> None:
         """
         Cache the dataframe.
 
         Args:
             key (str): The key.
             value (DataFrame): The value.
+            sub_directory (str): The sub directory.
+            cache_format (Optional[CacheFormat]): The storage format.
+                Defaults to the format of the cache.
+            compression (Optional[str]): The compression of the columnar formats.
+                Defaults to the compression of the cache.
         """
+        cache_format = cache_format or self.cache_format
+        compression = compression or self.compression
+        assert cache_format in self.EXTENSIONS
         directory_path = path.join(self.cache_dir, sub_directory)
         if not path.exists(directory_path):
             makedirs(directory_path)
-        cache_path = path.join(self.cache_dir, sub_directory, f"{str(key)}.pkl")
-        value.to_pickle(cache_path)
+
+        table: Optional[Table] = None
+        if cache_format != "pickle":
+            try:
+                table = Table.from_pandas(value, preserve_index=True)
+            except (ArrowInvalid, ArrowTypeError, ArrowNotImplementedError) as err:
+                print(
+                    f"{Fore.yellow}WARNING: {Style.reset}{sub_directory} can not be"
+                    + f" stored as {cache_format}, falling back to pickle. {err}"
+                )
+                cache_format = "pickle"
+
+        cache_path = self.__get_cache_path(
+            key=key, sub_directory=sub_directory, cache_format=cache_format
+        )
+        if cache_format == "parquet":
+            parquet.write_table(table, cache_path, compression=compression or "snappy")
+        elif cache_format == "feather":
+            with ipc.new_file(
+                cache_path,
+                table.schema,
+                options=ipc.IpcWriteOptions(compression=compression),
+            ) as writer:
+                writer.write_table(table)
+        elif cache_format == "pickle":
+            value.to_pickle(cache_path)
+        else:
+            raise ValueError(f"Unknown cache format {cache_format}.")
+
+        self.__record(cache_path=cache_path, sub_directory=sub_directory, key=key)
+        self.evict()
 
     def has(self, *, key: int, sub_directory: str) -> bool:
         """
@@ -42,31 +138,97 @@ class DataFrameCache:
         Returns:
             bool: Whether the dataframe is cached.
         """
-        cache_path = path.join(self.cache_dir, sub_directory, f"{str(key)}.pkl")
-        return path.exists(cache_path)
+        return self.__find_cache_path(key=key, sub_directory=sub_directory) is not None
 
-    def get(self, *, key: int, sub_directory: str) -> DataFrame:
+    def get_size(self, *, key: int, sub_directory: str) -> Optional[int]:
         """
-        Get the dataframe.
+        Get the size of the cached dataframe on disk.
 
         Args:
             key (str): The key.
+            sub_directory (str): The sub directory.
+
+        Returns:
+            Optional[int]: The size in bytes, None if the dataframe is not cached.
+        """
+        cache_path = self.__find_cache_path(key=key, sub_directory=sub_directory)
+        return path.getsize(cache_path) if cache_path is not None else None
+
+    def get(
+        self, *, key: int, sub_directory: str, columns: Optional[List[str]] = None
+    ) -> DataFrame:
+        """
+        Get the dataframe. Whatever the current format is, the dataframe is read
+        from the format it was stored with.
+
+        Args:
+            key (str): The key.
+            sub_directory (str): The sub directory.
+            columns (Optional[List[str]]): The columns to read, the columnar formats only
+                read these columns from the disk. The columns that are not stored are
+                ignored. Defaults to None which reads every column.
 
         Returns:
             DataFrame: The dataframe.
         """
-        if not self.has(key=key, sub_directory=sub_directory):
+        cache_path = self.__find_cache_path(key=key, sub_directory=sub_directory)
+        if cache_path is None:
             raise OSError(
                 f"The dataframe {key} in sub_directory {sub_directory} is not present in cache."
             )
 
-        cache_path = path.join(self.cache_dir, sub_directory, f"{str(key)}.pkl")
+        self.__record(cache_path=cache_path, sub_directory=sub_directory, key=key)
+
+        if cache_path.endswith(self.EXTENSIONS["parquet"]):
+            return parquet.read_table(
+                cache_path,
+                columns=self.__get_stored_columns(
+                    columns, parquet.read_schema(cache_path)
+                ),
+                memory_map=True,
+            ).to_pandas()
+        if cache_path.endswith(self.EXTENSIONS["feather"]):
+            with memory_map(cache_path, "r") as source:
+                table = ipc.open_file(source).read_all()
+                if columns is not None:
+                    table = table.select(
+                        self.__get_stored_columns(columns, table.schema)
+                    )
+                return table.to_pandas(split_blocks=True)
 
-        return read_pickle(cache_path)
+        dataframe = read_pickle(cache_path)
+        if columns is None:
+            return dataframe
+        columns = {str(column) for column in columns}
+        return dataframe[
+            [column for column in dataframe.columns if str(column) in columns]
+        ]
+
+    @staticmethod
+    def __get_stored_columns(
+        columns: Optional[List[str]], schema: Schema
+    ) -> Optional[List[str]]:
+        """
+        Get the stored columns among the columns to read, with the index columns that
+        pandas stores with the table, in the stored order.
+        """
+        if columns is None:
+            return None
+        index_columns = [
+            column
+            for column in (schema.pandas_metadata or {}).get("index_columns", [])
+            if isinstance(column, str)
+        ]
+        columns = {str(column) for column in columns} | set(index_columns)
+        return [name for name in schema.names if name in columns]
 
     def clear(self, sub_directory: Optional[str] = None) -> None:
         """
         Clear the cache.
+
+        Args:
+            sub_directory (Optional[str]): The sub directory to clear.
+                Defaults to None which clears the whole cache.
         """
         cached_dir = (
             path.join(self.cache_dir, sub_directory)
@@ -74,4 +236,219 @@ class DataFrameCache:
             else self.cache_dir
         )
 
-        removedirs(cached_dir)
+        if path.exists(cached_dir):
+            rmtree(cached_dir)
+        manifest = self.__get_manifest()
+        for relative_path in list(manifest):
+            if sub_directory is None or relative_path.startswith(f"{sub_directory}/"):
+                del manifest[relative_path]
+                self.__removed_paths.add(relative_path)
+        self.__save_manifest()
+
+    @property
+    def size(self) -> int:
+        """
+        The size of the cached entries in bytes.
+        """
+        return sum(entry["size"] for entry in self.__get_manifest().values())
+
+    @property
+    def entries(self) -> Dict[str, dict]:
+        """
+        The entries of the manifest by path relative to the cache directory.
+        """
+        return dict(self.__get_manifest())
+
+    def pin(self, keys: Iterable[int]) -> None:
+        """
+        Pin the entries of the keys so they are never evicted.
+
+        Args:
+            keys (Iterable[int]): The keys to pin.
+        """
+        self.pinned_keys.update(str(key) for key in keys)
+
+    def unpin(self, keys: Optional[Iterable[int]] = None) -> None:
+        """
+        Unpin the entries of the keys so they can be evicted again.
+
+        Args:
+            keys (Optional[Iterable[int]]): The keys to unpin.
+                Defaults to None which unpins every key.
+        """
+        if keys is None:
+            self.pinned_keys.clear()
+        else:
+            self.pinned_keys.difference_update(str(key) for key in keys)
+
+    def evict(self) -> List[str]:
+        """
+        Remove the least recently used entries that are not pinned until the cache
+        fits in its budget.
+
+        Returns:
+            List[str]: The evicted entries.
+        """
+        if self.max_size is None:
+            return []
+        manifest = self.__get_manifest()
+        size = self.size
+        evicted_entries = []
+        for relative_path, entry in sorted(
+            manifest.items(), key=lambda item: item[1]["last_access"]
+        ):
+            if size <= self.max_size:
+                break
+            if entry["key"] in self.pinned_keys:
+                continue
+            size -= entry["size"]
+            self.__remove(relative_path)
+            evicted_entries.append(relative_path)
+        self.__save_manifest()
+        return evicted_entries
+
+    def gc(self, live_keys: Dict[str, Set[int]]) -> List[str]:
+        """
+        Remove the orphaned entries, those whose key can not be produced by any live stage.
+
+        Args:
+            live_keys (Dict[str, Set[int]]): The keys that the live stages produce
+                by stage name.
+
+        Returns:
+            List[str]: The removed entries.
+        """
+        live_keys = {
+            stage_name: {str(key) for key in keys}
+            for stage_name, keys in live_keys.items()
+        }
+        removed_entries = []
+        for relative_path, entry in list(self.__get_manifest().items()):
+            if entry["key"] not in live_keys.get(entry["stage"], set()):
+                self.__remove(relative_path)
+                removed_entries.append(relative_path)
+        self.__save_manifest()
+        return removed_entries
+
+    def __record(self, *, cache_path: str, sub_directory: str, key: int) -> None:
+        """
+        Record the size and the access time of the entry in the manifest.
+        """
+        manifest = self.__get_manifest()
+        manifest[path.relpath(cache_path, self.cache_dir)] = {
+            "stage": sub_directory.split("/")[0],
+            "sub_directory": sub_directory,
+            "key": str(key),
+            "size": path.getsize(cache_path),
+            "last_access": time(),
+        }
+        self.__save_manifest()
+
+    def __remove(self, relative_path: str) -> None:
+        """
+        Remove the entry from the disk and the manifest.
+        """
+        cache_path = path.join(self.cache_dir, relative_path)
+        if path.exists(cache_path):
+            remove(cache_path)
+        del self.__get_manifest()[relative_path]
+        self.__removed_paths.add(relative_path)
+
+    def __get_manifest(self) -> Dict[str, dict]:
+        """
+        Load the manifest. If there is no manifest yet, the cache directory is scanned so
+        that the entries written before the manifest existed are tracked too.
+        """
+        if self.__manifest is not None:
+            return self.__manifest
+
+        manifest_path = path.join(self.cache_dir, self.MANIFEST_FILENAME)
+        if path.exists(manifest_path):
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                self.__manifest = load(file)
+        else:
+            self.__manifest = self.__scan()
+
+        # forget the entries removed by hand
+        for relative_path in list(self.__manifest):
+            if not path.exists(path.join(self.cache_dir, relative_path)):
+                del self.__manifest[relative_path]
+        return self.__manifest
+
+    def __save_manifest(self) -> None:
+        """
+        Write the manifest, the file is replaced at once so it is never half written.
+        The entries written meanwhile by other processes, such as the pipeline workers,
+        are merged in.
+        """
+        if not path.exists(self.cache_dir):
+            makedirs(self.cache_dir)
+        manifest_path = path.join(self.cache_dir, self.MANIFEST_FILENAME)
+        manifest = self.__get_manifest()
+        if path.exists(manifest_path):
+            with open(manifest_path, "r", encoding="utf-8") as file:
+                for relative_path, entry in load(file).items():
+                    if (
+                        relative_path not in manifest
+                        and relative_path not in self.__removed_paths
+                        and path.exists(path.join(self.cache_dir, relative_path))
+                    ):
+                        manifest[relative_path] = entry
+        with open(f"{manifest_path}.tmp", "w", encoding="utf-8") as file:
+            dump(self.__get_manifest(), file)
+        replace(f"{manifest_path}.tmp", manifest_path)
+
+    def __scan(self) -> Dict[str, dict]:
+        """
+        Build the manifest entries from the files of the cache directory.
+        """
+        manifest = {}
+        if self.cache_dir is None or not path.exists(self.cache_dir):
+            return manifest
+        extensions = tuple(f".{extension}" for extension in self.EXTENSIONS.values())
+        for directory_path, _, filenames in walk(self.cache_dir):
+            for filename in filenames:
+                if not filename.endswith(extensions):
+                    continue
+                cache_path = path.join(directory_path, filename)
+                sub_directory = path.relpath(directory_path, self.cache_dir).replace(
+                    "\\", "/"
+                )
+                manifest[path.relpath(cache_path, self.cache_dir)] = {
+                    "stage": sub_directory.split("/")[0],
+                    "sub_directory": sub_directory,
+                    "key": filename.split(".")[0],
+                    "size": path.getsize(cache_path),
+                    "last_access": path.getatime(cache_path),
+                }
+        return manifest
+
+    def __get_cache_path(
+        self, *, key: int, sub_directory: str, cache_format: CacheFormat
+    ) -> str:
+        """
+        Get the path of the cached dataframe for the format.
+        """
+        return path.join(
+            self.cache_dir,
+            sub_directory,
+            f"{str(key)}.{self.EXTENSIONS[cache_format]}",
+        )
+
+    def __find_cache_path(self, *, key: int, sub_directory: str) -> Optional[str]:
+        """
+        Find the path of the cached dataframe. The current format is looked up first,
+        then the other formats so that a format switch does not force a recompute.
+        """
+        cache_formats = [self.cache_format] + [
+            cache_format
+            for cache_format in self.EXTENSIONS
+            if cache_format != self.cache_format
+        ]
+        for cache_format in cache_formats:
+            cache_path = self.__get_cache_path(
+                key=key, sub_directory=sub_directory, cache_format=cache_format
+            )
+            if path.exists(cache_path):
+                return cache_path
+        return None
@@ -0,0 +1,59 @@
+"""
+This module is used to fingerprint the source files without reading them fully.
+"""
+
+from functools import lru_cache
+from hashlib import new
+from os import path, stat
+from typing import Optional
+
+BLOCK_SIZE = 64 * 1024
+N_SAMPLED_BLOCKS = 16
+
+
+def get_file_fingerprint(file_path: str) -> Optional[str]:
+    """
+    Get a fingerprint of the file from its size, its modification time and a hash of
+    blocks sampled at evenly spaced offsets. The first and the last blocks are always
+    sampled so that appended rows and rewritten headers change the fingerprint.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        Optional[str]: The fingerprint or None if the file does not exist.
+    """
+    if not path.isfile(file_path):
+        return None
+    file_stat = stat(file_path)
+    return _get_file_fingerprint(
+        path.abspath(file_path), file_stat.st_size, file_stat.st_mtime_ns
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_file_fingerprint(file_path: str, size: int, mtime_ns: int) -> str:
+    """
+    Hash the sampled blocks. The size and the modification time are part of the
+    arguments so that a modified file is sampled again.
+    """
+    hasher = new("sha256")
+    hasher.update(f"{size}:{mtime_ns}".encode())
+
+    n_blocks = max(1, -(-size // BLOCK_SIZE))
+    if n_blocks <= N_SAMPLED_BLOCKS:
+        sampled_blocks = range(n_blocks)
+    else:
+        sampled_blocks = sorted(
+            {
+                index * (n_blocks - 1) // (N_SAMPLED_BLOCKS - 1)
+                for index in range(N_SAMPLED_BLOCKS)
+            }
+        )
+
+    with open(file_path, "rb") as file:
+        for block in sampled_blocks:
+            file.seek(block * BLOCK_SIZE)
+            hasher.update(file.read(BLOCK_SIZE))
+
+    return hasher.hexdigest()
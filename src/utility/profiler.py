@@ -0,0 +1,248 @@
+"""
+This module is used to profile the stages and the transforms of the ingestion pipeline.
+"""
+
+import tracemalloc
+from json import dump
+from os import makedirs, path
+from sys import platform
+from time import perf_counter, process_time
+from typing import Dict, List, Optional
+from pandas import DataFrame
+from psutil import Process
+
+try:
+    from resource import RUSAGE_SELF, getrusage
+except ImportError:  # the resource module is not available on Windows
+    getrusage = None
+
+
+class Profiler:
+    """
+    A class to record the wall time, the CPU time, the memory and the size of the
+    dataframes of each step of a stage.
+
+    Args:
+        stage_name (Optional[str]): The name of the profiled stage. Defaults to None.
+        trace_allocations (bool): Whether to trace the Python allocations with
+            tracemalloc to record the lines that allocate the most during each step.
+            The tracing slows down the steps a lot. Defaults to False.
+        n_top_allocations (int): The number of allocation lines recorded by step.
+            Defaults to 5.
+    """
+
+    def __init__(
+        self,
+        *,
+        stage_name: Optional[str] = None,
+        trace_allocations: bool = False,
+        n_top_allocations: int = 5,
+    ) -> None:
+        assert n_top_allocations > 0
+        self.stage_name = stage_name
+        self.trace_allocations = trace_allocations
+        self.n_top_allocations = n_top_allocations
+        self.records: List[dict] = []
+
+    def start(self, dataframe: Optional[DataFrame]) -> dict:
+        """
+        Start profiling a step.
+
+        Args:
+            dataframe (Optional[DataFrame]): The dataframe given to the step.
+
+        Returns:
+            dict: The measures taken before the step, to give to stop.
+        """
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        started = {
+            **get_dataframe_measures(dataframe, suffix="in"),
+            "peak_rss": get_peak_rss(),
+            "snapshot": tracemalloc.take_snapshot() if self.trace_allocations else None,
+        }
+        started["wall_time"] = perf_counter()
+        started["cpu_time"] = process_time()
+        return started
+
+    def stop(
+        self, started: dict, *, step_name: str, dataframe: Optional[DataFrame]
+    ) -> dict:
+        """
+        Stop profiling a step and record its measures.
+
+        Args:
+            started (dict): The measures returned by start.
+            step_name (str): The name of the step, the transform class name for the
+                transforms.
+            dataframe (Optional[DataFrame]): The dataframe returned by the step.
+
+        Returns:
+            dict: The record of the step.
+        """
+        wall_time = perf_counter() - started["wall_time"]
+        cpu_time = process_time() - started["cpu_time"]
+        record = {
+            "stage": self.stage_name,
+            "step": step_name,
+            "wall_time": wall_time,
+            "cpu_time": cpu_time,
+            "peak_rss_delta": get_peak_rss() - started["peak_rss"],
+            "rows_in": started["rows_in"],
+            "columns_in": started["columns_in"],
+            "memory_in": started["memory_in"],
+            **get_dataframe_measures(dataframe, suffix="out"),
+        }
+        if started["snapshot"] is not None:
+            statistics = tracemalloc.take_snapshot().compare_to(
+                started["snapshot"], "lineno"
+            )
+            record["top_allocations"] = [
+                f"{statistic.traceback}: {statistic.size_diff} B"
+                for statistic in statistics[: self.n_top_allocations]
+            ]
+        self.records.append(record)
+        return record
+
+
+def get_dataframe_measures(dataframe: Optional[DataFrame], *, suffix: str) -> dict:
+    """
+    Get the number of rows, the number of columns and the memory of the dataframe.
+
+    Args:
+        dataframe (Optional[DataFrame]): The dataframe.
+        suffix (str): The suffix of the keys, "in" or "out".
+
+    Returns:
+        dict: The measures.
+    """
+    if not isinstance(dataframe, DataFrame):
+        return {f"rows_{suffix}": 0, f"columns_{suffix}": 0, f"memory_{suffix}": 0}
+    return {
+        f"rows_{suffix}": len(dataframe),
+        f"columns_{suffix}": len(dataframe.columns),
+        f"memory_{suffix}": int(dataframe.memory_usage(deep=True).sum()),
+    }
+
+
+def get_peak_rss() -> int:
+    """
+    Get the peak resident set size of the process in bytes. Windows has no resource
+    module, the peak working set is used instead.
+
+    Returns:
+        int: The peak resident set size.
+    """
+    if getrusage is None:
+        return Process().memory_info().peak_wset
+    peak_rss = getrusage(RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak_rss if platform == "darwin" else peak_rss * 1024
+
+
+def write_profile_report(
+    records: List[dict], *, directory: str, name: str
+) -> Dict[str, str]:
+    """
+    Write the records as a JSON report, a CSV report and a flame style summary.
+    The JSON report also holds the totals of every stage.
+
+    Args:
+        records (List[dict]): The records of the profilers.
+        directory (str): The directory of the reports.
+        name (str): The name of the reports without extension.
+
+    Returns:
+        Dict[str, str]: The path of each report by format.
+    """
+    if not path.exists(directory):
+        makedirs(directory)
+    report_paths = {
+        extension: path.join(directory, f"{name}.{extension}")
+        for extension in ["json", "csv", "txt"]
+    }
+    with open(report_paths["json"], "w", encoding="utf-8") as file:
+        dump({"stages": get_stages_totals(records), "steps": records}, file, indent=4)
+    DataFrame(records).to_csv(report_paths["csv"], index=False)
+    with open(report_paths["txt"], "w", encoding="utf-8") as file:
+        file.write(get_flame_summary(records))
+    return report_paths
+
+
+def get_stages_totals(records: List[dict]) -> List[dict]:
+    """
+    Get the totals of the steps of every stage, the rows, the columns and the memory
+    going in are the ones of the first step and the ones going out of the last step.
+
+    Args:
+        records (List[dict]): The records of the profilers.
+
+    Returns:
+        List[dict]: The totals by stage in the order of the records.
+    """
+    stages_records: Dict[str, List[dict]] = {}
+    for record in records:
+        stages_records.setdefault(record["stage"], []).append(record)
+    return [
+        {
+            "stage": stage_name,
+            "wall_time": sum(record["wall_time"] for record in stage_records),
+            "cpu_time": sum(record["cpu_time"] for record in stage_records),
+            "peak_rss_delta": sum(record["peak_rss_delta"] for record in stage_records),
+            **{
+                key: stage_records[0][key]
+                for key in ["rows_in", "columns_in", "memory_in"]
+            },
+            **{
+                key: stage_records[-1][key]
+                for key in ["rows_out", "columns_out", "memory_out"]
+            },
+        }
+        for stage_name, stage_records in stages_records.items()
+    ]
+
+
+def get_flame_summary(records: List[dict], width: int = 40) -> str:
+    """
+    Get a flame style summary of the records. Every stage is followed by its steps,
+    with a bar proportional to the share of the wall time of the whole run.
+
+    Args:
+        records (List[dict]): The records of the profilers.
+        width (int): The width of the bar of the whole run. Defaults to 40.
+
+    Returns:
+        str: The summary.
+    """
+    stages_records: Dict[str, List[dict]] = {}
+    for record in records:
+        stages_records.setdefault(record["stage"], []).append(record)
+    total_time = sum(record["wall_time"] for record in records) or 1.0
+
+    lines = []
+    for stage_name, stage_records in stages_records.items():
+        stage_time = sum(record["wall_time"] for record in stage_records)
+        lines.append(get_flame_line(str(stage_name), stage_time, total_time, width))
+        for record in sorted(
+            stage_records, key=lambda record: record["wall_time"], reverse=True
+        ):
+            lines.append(
+                get_flame_line(
+                    f"  {record['step']}", record["wall_time"], total_time, width
+                )
+                + f" cpu {record['cpu_time']:.2f}s"
+                + f" rss +{record['peak_rss_delta'] / 2**20:.1f}MiB"
+                + f" rows {record['rows_in']}->{record['rows_out']}"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def get_flame_line(name: str, wall_time: float, total_time: float, width: int) -> str:
+    """
+    Get a line of the flame style summary.
+    """
+    share = wall_time / total_time
+    return (
+        f"{name:<60} {'#' * max(1, round(share * width)):<{width}}"
+        + f" {wall_time:8.2f}s {share:6.1%}"
+    )
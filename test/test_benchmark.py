@@ -0,0 +1,95 @@
+"""
+This module contains the tests for the synthetic data generator and the benchmark
+"""
+
+from pandas import read_csv
+from src.data.ingestion_pipeline.benchmark import compare_to_baseline
+from src.data.schema.client_schema import ClientSchemaRaw
+from src.data.schema.clock_schema import ClockSchemaRaw
+from src.data.schema.employee_schema import EmployeeSchemaRaw
+from src.data.schema.status_schema import StatusSchemaRaw
+from src.data.schema.visit_schema import VisitSchemaRaw
+from src.data.synthetic_data import generate_synthetic_data
+
+
+def test_generate_synthetic_data(tmp_path):
+    """
+    This method tests that the csv files match the raw schemas and reference each other.
+    """
+    csv_paths = generate_synthetic_data(
+        str(tmp_path), n_employees=10, n_days=30, termination_rate=0.5
+    )
+    dataframes = {
+        filename: read_csv(csv_path) for filename, csv_path in csv_paths.items()
+    }
+    for filename, schema in [
+        ("visit_data.csv", VisitSchemaRaw),
+        ("clock_data.csv", ClockSchemaRaw),
+        ("employee_data.csv", EmployeeSchemaRaw),
+        ("client_data.csv", ClientSchemaRaw),
+        ("status_data.csv", StatusSchemaRaw),
+    ]:
+        assert sorted(dataframes[filename].columns) == sorted(
+            column.name for column in schema.columns
+        )
+
+    visits = dataframes["visit_data.csv"]
+    employees = dataframes["employee_data.csv"]
+    assert len(visits) > 0
+    assert (
+        visits[VisitSchemaRaw.EMPLOYEE_ID.name]
+        .isin(employees[EmployeeSchemaRaw.EMPLOYEE_ID.name])
+        .all()
+    )
+    assert (
+        visits[VisitSchemaRaw.CLIENT_ID.name]
+        .isin(dataframes["client_data.csv"][ClientSchemaRaw.CLIENT_ID.name])
+        .all()
+    )
+    assert (
+        dataframes["clock_data.csv"][ClockSchemaRaw.VISIT_ID.name]
+        .isin(visits[VisitSchemaRaw.VISIT_ID.name])
+        .all()
+    )
+
+    status = dataframes["status_data.csv"]
+    terminated_employees = employees.loc[
+        employees[EmployeeSchemaRaw.TERMINATION_DATE.name].notna(),
+        EmployeeSchemaRaw.EMPLOYEE_ID.name,
+    ]
+    assert sorted(
+        status.loc[
+            status[StatusSchemaRaw.STATUS_HISTORICAL.name] == "terminated",
+            StatusSchemaRaw.EMPLOYEE_ID.name,
+        ]
+    ) == sorted(terminated_employees)
+
+    other_csv_paths = generate_synthetic_data(
+        str(tmp_path / "other"), n_employees=10, n_days=30, termination_rate=0.5
+    )
+    assert read_csv(other_csv_paths["visit_data.csv"]).equals(visits)
+
+
+def test_compare_to_baseline():
+    """
+    This method tests that only the durations much slower than the baseline are flagged.
+    """
+    baseline = {
+        "1x": {
+            "pipeline": {"pipeline": 10.0},
+            "transforms": {"Visit/SumSalaryPerVisit": 2.0, "Visit/HourlyPay": 0.1},
+        }
+    }
+    results = {
+        "1x": {
+            "pipeline": {"pipeline": 11.0},
+            "transforms": {
+                "Visit/SumSalaryPerVisit": 5.0,
+                "Visit/HourlyPay": 0.3,
+                "Visit/WorkHoursDeviationCalculatedField": 9.0,
+            },
+        }
+    }
+    assert compare_to_baseline(results, baseline) == [
+        "1x transforms Visit/SumSalaryPerVisit: 2.00s -> 5.00s"
+    ]
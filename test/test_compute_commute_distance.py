@@ -100,3 +100,35 @@ def test_employee_commute_distance_calculated_field():
 
     assert len(errors) == 0
     assert transformer.to_dict()["name"] == "ComputeCommuteDistance"
+
+
+def test_employee_commute_distance_vectorized():
+    """
+    This method tests that the repeated pairs of coordinates get the same distance and
+    that the invalid coordinates and the distances over the maximum are NaN.
+    """
+    dataframe = DataFrame(
+        {
+            AugmentedVisitSchema.CLIENT_LATITUDE: [42.48, 42.48, "x", 42.48, 0.0],
+            AugmentedVisitSchema.CLIENT_LONGITUDE: [-70.94, -70.94, -70.94, None, 0.0],
+            AugmentedVisitSchema.EMPLOYEE_LATITUDE: [42.54, 42.54, 42.54, 42.54, 0.0],
+            AugmentedVisitSchema.EMPLOYEE_LONGITUDE: [-71.1, -71.1, -71.1, -71.1, 2.0],
+        }
+    )
+
+    result_df, _ = ComputeCommuteDistance(max_distance_km=150)(
+        dataframe,
+        ErrorDataFrame(dataframe, config=conf),
+        conf=conf,
+        env=env,
+    )
+
+    distances = result_df[AugmentedVisitSchema.EMPLOYEE_COMMUTE_DISTANCE].tolist()
+    assert round(distances[0], 3) == round(distances[1], 3) == 14.714
+    assert all(isnan(distance) for distance in distances[2:])
+
+    empty_df = dataframe.head(0)
+    result_df, _ = ComputeCommuteDistance()(
+        empty_df, ErrorDataFrame(empty_df, config=conf), conf=conf, env=env
+    )
+    assert len(result_df[AugmentedVisitSchema.EMPLOYEE_COMMUTE_DISTANCE]) == 0
@@ -0,0 +1,91 @@
+"""
+This module contains the tests for the ComputeVisitPay class
+"""
+import numpy as np
+import pandas as pd
+from src.data.schema.visit_schema import VisitSchema
+from src.data.transforms.calculated_fields.visit_data.compute_visit_pay import (
+    ComputeVisitPay,
+)
+from src.data.transforms.calculated_fields.visit_data.hourly_pay import HourlyPay
+from src.data.transforms.calculated_fields.visit_data.sum_salary_per_visit import (
+    SumSalaryPerVisit,
+)
+from src.data.transforms.calculated_fields.visit_data.visit_pay import (
+    VISIT_PAY_CODE_VERSION,
+)
+from src.data.transforms.clean.visit_data.replace_invalid_computed_rate import (
+    ReplaceInvalidComputedRate,
+)
+
+# Mock data for testing. First and fourth column's computed rate are invalid
+df = pd.DataFrame(
+    {
+        "VISIT_HOURS_APPROVED": [8, 8, 8, 15, 0, 2, 3],
+        "VISIT_APPROVAL_STATUS": [1, 1, 1, 1, 1, 0, 1],
+        "VISIT_COMPUTED_RATE": [0, 50, 300, 0, 20, 0, 10],
+        "VISIT_CANCEL_CODE": [None, None, None, None, None, None, None],
+        "VISIT_COMPUTED_RATE_UNITS": [
+            "hours",
+            "hours",
+            "visits",
+            "visits",
+            "hours",
+            "hours",
+            "miles",
+        ],
+    }
+)
+
+
+def test_compute_visit_pay():
+    """
+    This method tests that ComputeVisitPay gives the rates and the pay of
+    ReplaceInvalidComputedRate, SumSalaryPerVisit and HourlyPay
+    """
+    transformer = ComputeVisitPay()
+    transformer.to_dict()
+
+    result_df, _ = transformer(df.copy(), errors=None, conf=None, env=None)
+
+    expected_df = df.copy()
+    for expected_transformer in [
+        ReplaceInvalidComputedRate(),
+        SumSalaryPerVisit(),
+        HourlyPay(),
+    ]:
+        expected_df, _ = expected_transformer(
+            expected_df, errors=None, conf=None, env=None
+        )
+    pd.testing.assert_frame_equal(result_df, expected_df)
+
+    assert result_df[VisitSchema.VISIT_COMPUTED_RATE].tolist()[:4] == [
+        17.5,
+        50,
+        300,
+        150,
+    ]
+    assert result_df[VisitSchema.VISIT_TOTAL_PAY].tolist()[:5] == [
+        140,
+        400,
+        300,
+        150,
+        0,
+    ]
+    assert np.isnan(result_df[VisitSchema.VISIT_TOTAL_PAY][6])
+    assert np.isnan(result_df[VisitSchema.VISIT_HOURLY_PAY][4])
+    assert result_df[VisitSchema.VISIT_HOURLY_PAY][2] == 37.5
+
+
+def test_visit_pay_code_version():
+    """
+    This method tests that the transforms computing the pay with the visit_pay module
+    share its code version, so that their cached outputs are recomputed together.
+    """
+    for transform in [
+        ComputeVisitPay,
+        ReplaceInvalidComputedRate,
+        SumSalaryPerVisit,
+        HourlyPay,
+    ]:
+        assert transform.get_code_version() == VISIT_PAY_CODE_VERSION
@@ -0,0 +1,120 @@
+"""
+This module contains the tests for the DataFrameCache class
+"""
+
+from pandas import DataFrame, Timestamp
+from src.utility.dataframe_cache import DataFrameCache
+from src.utility.environment import Environment
+
+input_df = DataFrame(
+    {
+        "EMPLOYEE_ID": [1, 1, 2],
+        "PERIOD_START": [
+            Timestamp(year=2023, month=1, day=1),
+            Timestamp(year=2023, month=1, day=2),
+            Timestamp(year=2023, month=1, day=1),
+        ],
+        "VISIT_HOURS_PER_PERIOD": [1.5, None, 3.0],
+        "EMPLOYEE_STATE": ["QC", "QC", None],
+    },
+    index=[3, 5, 8],
+)
+
+
+def build_cache(tmp_path, cache_format="pickle") -> DataFrameCache:
+    """
+    Build a cache in a temporary directory.
+    """
+    env = Environment()
+    env.cache_dir = str(tmp_path)
+    return DataFrameCache(environment=env, cache_format=cache_format)
+
+
+def test_dataframe_cache_formats(tmp_path):
+    """
+    This method tests that every format gives back the cached dataframe.
+    """
+    cache = build_cache(tmp_path)
+    for key, cache_format in enumerate(["pickle", "parquet", "feather"]):
+        assert not cache.has(key=key, sub_directory="stage/dataframe")
+        cache.add(
+            key=key,
+            value=input_df,
+            sub_directory="stage/dataframe",
+            cache_format=cache_format,
+        )
+        assert cache.has(key=key, sub_directory="stage/dataframe")
+        result_df = cache.get(key=key, sub_directory="stage/dataframe")
+        assert result_df.equals(input_df)
+        assert list(result_df.index) == [3, 5, 8]
+
+    for key in range(3):
+        result_df = cache.get(
+            key=key,
+            sub_directory="stage/dataframe",
+            columns=["PERIOD_START", "EMPLOYEE_ID", "NOT_STORED"],
+        )
+        assert result_df.equals(input_df[["EMPLOYEE_ID", "PERIOD_START"]])
+        assert list(result_df.index) == [3, 5, 8]
+
+
+def test_dataframe_cache_format_switch(tmp_path):
+    """
+    This method tests that a pickle entry is still read after a format switch.
+    """
+    build_cache(tmp_path, cache_format="pickle").add(
+        key=1, value=input_df, sub_directory="stage/dataframe"
+    )
+
+    cache = build_cache(tmp_path, cache_format="feather")
+    assert cache.has(key=1, sub_directory="stage/dataframe")
+    assert cache.get(key=1, sub_directory="stage/dataframe").equals(input_df)
+
+
+def test_dataframe_cache_eviction(tmp_path):
+    """
+    This method tests that the least recently used entries are evicted first
+    and that pinned entries are kept until they are unpinned.
+    """
+    cache = build_cache(tmp_path)
+    cache.add(key=1, value=input_df, sub_directory="stage/dataframe")
+    entry_size = cache.size
+    cache.max_size = 2 * entry_size
+    cache.pin([1])
+
+    cache.add(key=2, value=input_df, sub_directory="stage/dataframe")
+    cache.get(key=2, sub_directory="stage/dataframe")
+    cache.add(key=3, value=input_df, sub_directory="other_stage/dataframe")
+
+    assert cache.has(key=1, sub_directory="stage/dataframe")
+    assert not cache.has(key=2, sub_directory="stage/dataframe")
+    assert cache.has(key=3, sub_directory="other_stage/dataframe")
+    assert cache.size <= cache.max_size
+
+    cache.unpin([1])
+    cache.add(key=4, value=input_df, sub_directory="stage/dataframe")
+    assert not cache.has(key=1, sub_directory="stage/dataframe")
+
+
+def test_dataframe_cache_gc_and_clear(tmp_path):
+    """
+    This method tests that the orphaned entries are removed, including the ones
+    written before the manifest existed.
+    """
+    input_df.to_pickle(tmp_path / "legacy.pkl")
+    (tmp_path / "stage" / "dataframe").mkdir(parents=True)
+    input_df.to_pickle(tmp_path / "stage" / "dataframe" / "7.pkl")
+
+    cache = build_cache(tmp_path)
+    cache.add(key=1, value=input_df, sub_directory="stage/dataframe")
+    cache.add(key=1, value=input_df, sub_directory="stage/errors")
+
+    removed_entries = cache.gc({"stage": {1}})
+
+    assert len(removed_entries) == 2
+    assert not cache.has(key=7, sub_directory="stage/dataframe")
+    assert cache.has(key=1, sub_directory="stage/errors")
+
+    cache.clear("stage")
+    assert not cache.has(key=1, sub_directory="stage/dataframe")
+    assert cache.size == 0
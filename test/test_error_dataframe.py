@@ -0,0 +1,188 @@
+"""
+This module contains the tests for the ErrorDataFrame class
+"""
+
+from pandas import DataFrame, Timestamp, read_pickle
+from src.data.error.error_dataframe import ErrorDataFrame
+from src.data.error.error_id import ErrorId
+from src.utility.configs.config import Config
+
+conf = Config(
+    load_id="20240101_000000",
+    n_splits=2,
+    split_seed=5832391,
+    log_every_n_steps=50,
+    training_window_size=1,
+    n_epochs=5,
+    batch_size=16384,
+    label_policy="90Days",
+    period_duration="1D",
+    cutoff=0.5,
+    period_start=Timestamp(year=2018, month=1, day=1),
+    oversampler="SMOTE",
+    oversampler_args={},
+    model="ExplainableBoostingMachine",
+    model_config={},
+)
+
+
+def test_error_dataframe(tmp_path):
+    """
+    This method tests that the errors are appended, counted and built as a dataframe.
+    """
+    dataframe = DataFrame({"VISIT_ID": [1, 2, 3, 4], "VALUE": [-1, 5, 20, -3]})
+    errors = ErrorDataFrame(dataframe, config=conf)
+    assert len(errors) == 0
+    assert list(errors.to_dataframe().columns) == [
+        "load_id",
+        "error_id",
+        "error",
+        "VISIT_ID",
+        "VALUE",
+    ]
+
+    for _ in range(2):
+        errors = errors.add_errors(
+            dataframe=dataframe,
+            idx=dataframe["VALUE"] < 0,
+            config=conf,
+            error_id=ErrorId.OUT_OF_RANGE,
+            error="VALUE is less than 0",
+        )
+    errors = errors.add_errors(
+        dataframe=dataframe,
+        idx=dataframe["VALUE"] > 10,
+        config=conf,
+        error_id=ErrorId.OUT_OF_RANGE,
+        error="VALUE is greater than 10",
+    )
+    errors = ErrorDataFrame.concat([errors, ErrorDataFrame(dataframe, config=conf)])
+    assert len(errors) == 5
+
+    error_dataframe = errors.to_dataframe()
+    assert error_dataframe["VISIT_ID"].tolist() == [1, 4, 1, 4, 3]
+    assert (error_dataframe["load_id"] == conf.load_id).all()
+    assert (error_dataframe["error_id"] == ErrorId.OUT_OF_RANGE.name).all()
+    assert errors.get_counts().values.tolist() == [
+        [ErrorId.OUT_OF_RANGE.name, "VALUE is less than 0", 4],
+        [ErrorId.OUT_OF_RANGE.name, "VALUE is greater than 10", 1],
+    ]
+
+    errors.to_pickle(tmp_path / "errors.pkl")
+    assert read_pickle(tmp_path / "errors.pkl").to_dataframe().equals(error_dataframe)
+
+
+def test_error_dataframe_compact():
+    """
+    This method tests that the errors only hold the error rows of the dataframes they
+    were found in once they are compacted or the errors of another dataframe are added.
+    """
+    dataframe = DataFrame({"VISIT_ID": range(10), "VALUE": range(10)})
+    errors = ErrorDataFrame(dataframe, config=conf)
+    for threshold in [8, 6]:
+        errors = errors.add_errors(
+            dataframe=dataframe,
+            idx=dataframe["VALUE"] >= threshold,
+            config=conf,
+            error_id=ErrorId.OUT_OF_RANGE,
+            error=f"VALUE is at least {threshold}",
+        )
+        dataframe = dataframe[dataframe["VALUE"] < threshold]
+    assert [len(source) for source in errors.sources] == [2, 8]
+
+    errors = errors.compact()
+    assert [len(source) for source in errors.sources] == [2, 2]
+    assert errors.to_dataframe()["VISIT_ID"].tolist() == [8, 9, 6, 7]
+
+
+def test_error_dataframe_max_error_examples():
+    """
+    This method tests that the errors are all counted but only a sample of rows is kept.
+    """
+    bounded_conf = Config(**{**conf.to_dict(), "max_error_examples": 3})
+    dataframe = DataFrame({"VISIT_ID": range(100), "VALUE": range(100)})
+    errors = []
+    for chunk in [dataframe.iloc[:40], dataframe.iloc[40:]]:
+        chunk_errors = ErrorDataFrame(chunk, config=bounded_conf)
+        for threshold in [10, 50]:
+            chunk_errors = chunk_errors.add_errors(
+                dataframe=chunk,
+                idx=chunk["VALUE"] >= threshold,
+                config=bounded_conf,
+                error_id=ErrorId.OUT_OF_RANGE,
+                error=f"VALUE is greater than {threshold}",
+            )
+        errors.append(chunk_errors)
+    errors = ErrorDataFrame.concat(errors)
+
+    assert len(errors) == 90 + 50
+    assert errors.get_counts()["count"].tolist() == [90, 50]
+    error_dataframe = errors.to_dataframe()
+    assert len(error_dataframe) == 6
+    for threshold in [10, 50]:
+        examples = error_dataframe[
+            error_dataframe["error"] == f"VALUE is greater than {threshold}"
+        ]
+        assert len(examples) == 3
+        assert (examples["VALUE"] >= threshold).all()
+        assert examples["VISIT_ID"].is_unique
+
+
+def test_error_dataframe_max_error_examples_chunks():
+    """
+    This method tests that the samples of many chunks are concatenated in a sample of
+    at most max_error_examples rows drawn from several chunks.
+    """
+    bounded_conf = Config(**{**conf.to_dict(), "max_error_examples": 5})
+    chunks = [
+        DataFrame({"VISIT_ID": range(start, start + 10), "VALUE": range(10)})
+        for start in range(0, 1000, 10)
+    ]
+    errors = ErrorDataFrame.concat(
+        [
+            ErrorDataFrame(chunk, config=bounded_conf, stream=chunk_number).add_errors(
+                dataframe=chunk,
+                idx=[True] * len(chunk),
+                config=bounded_conf,
+                error_id=ErrorId.OUT_OF_RANGE,
+                error="VALUE is invalid",
+            )
+            for chunk_number, chunk in enumerate(chunks)
+        ]
+    )
+
+    assert len(errors) == 1000
+    examples = errors.to_dataframe()
+    assert len(examples) == 5
+    assert examples["VISIT_ID"].is_unique
+    assert (examples["VISIT_ID"] // 10).nunique() > 1
+    assert examples["VALUE"].nunique() > 1
+
+
+def test_error_dataframe_max_error_examples_seed():
+    """
+    This method tests that the sample of the examples only depends on the split seed,
+    the stage name and the stream.
+    """
+    bounded_conf = Config(**{**conf.to_dict(), "max_error_examples": 3})
+    dataframe = DataFrame({"VISIT_ID": range(100), "VALUE": range(100)})
+
+    def sample(stage_name: str, stream: int = 0) -> list:
+        return (
+            ErrorDataFrame(
+                dataframe, config=bounded_conf, stage_name=stage_name, stream=stream
+            )
+            .add_errors(
+                dataframe=dataframe,
+                idx=[True] * len(dataframe),
+                config=bounded_conf,
+                error_id=ErrorId.OUT_OF_RANGE,
+                error="VALUE is invalid",
+            )
+            .to_dataframe()["VISIT_ID"]
+            .tolist()
+        )
+
+    assert sample("Visit") == sample("Visit")
+    assert sample("Visit") != sample("Clock")
+    assert sample("Visit") != sample("Visit", stream=1)
@@ -0,0 +1,82 @@
+"""
+This module contains the tests for the GenerateTrainingWindowId class
+"""
+
+from pandas import DataFrame, Timestamp
+from src.data.schema.employee_history_schema import EmployeeHistorySchema
+from src.data.transforms.target_variable.generate_training_window_id import (
+    GenerateTrainingWindowId,
+    get_training_window_starts,
+)
+
+# the employee 1 has 8 periods, the employee 2 has 3 periods
+input_df = DataFrame(
+    {
+        "EMPLOYEE_ID": [2.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0],
+        "PERIOD_START": [
+            Timestamp(year=2023, month=1, day=day)
+            for day in [1, 1, 2, 2, 3, 4, 5, 6, 3, 7, 8]
+        ],
+    }
+)
+
+
+def test_generate_training_window_id():
+    """
+    This method tests that the most recent period and the incomplete windows are
+    dropped and that the windows are numbered across the employees.
+    """
+    transformer = GenerateTrainingWindowId(window_size=3)
+    assert transformer.to_dict() == {
+        "name": "GenerateTrainingWindowId",
+        "window_size": 3,
+    }
+
+    result_df, _ = transformer(input_df.copy(), errors=None, conf=None, env=None)
+
+    assert list(result_df.columns)[0] == EmployeeHistorySchema.TRAINING_WINDOW_ID
+    assert result_df[EmployeeHistorySchema.EMPLOYEE_ID].tolist() == [1.0] * 6
+    assert [period.day for period in result_df[EmployeeHistorySchema.PERIOD_START]] == [
+        7,
+        6,
+        5,
+        4,
+        3,
+        2,
+    ]
+    assert result_df[EmployeeHistorySchema.TRAINING_WINDOW_ID].tolist() == [
+        0,
+        0,
+        0,
+        1,
+        1,
+        1,
+    ]
+    assert get_training_window_starts(result_df).tolist() == [0, 3]
+
+
+def test_generate_training_window_id_stride():
+    """
+    This method tests that the overlapping windows keep every period once and give
+    the start of each window.
+    """
+    transformer = GenerateTrainingWindowId(window_size=2, stride=1)
+    assert transformer.to_dict()["stride"] == 1
+
+    result_df, _ = transformer(input_df.copy(), errors=None, conf=None, env=None)
+
+    assert (
+        result_df[EmployeeHistorySchema.EMPLOYEE_ID].tolist() == [1.0] * 7 + [2.0] * 2
+    )
+    assert result_df[EmployeeHistorySchema.TRAINING_WINDOW_ID].tolist() == [
+        0,
+        1,
+        2,
+        3,
+        4,
+        5,
+        5,
+        6,
+        6,
+    ]
+    assert get_training_window_starts(result_df).tolist() == [0, 1, 2, 3, 4, 5, 7]
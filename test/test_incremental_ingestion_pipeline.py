@@ -0,0 +1,217 @@
+"""
+This module contains the tests for the IncrementalIngestionPipeline class
+"""
+
+from datetime import datetime
+from typing import Tuple
+from pandas import DataFrame, Timedelta, Timestamp
+from src.data.error.error_dataframe import ErrorDataFrame
+from src.data.ingestion_pipeline.incremental_ingestion_pipeline import (
+    IncrementalIngestionPipeline,
+)
+from src.data.ingestion_pipeline.ingestion_pipeline_stage import IngestionPipelineStage
+from src.data.schema.visit_schema import VisitSchema, VisitSchemaRaw
+from src.data.transforms.aggregate.aggregate_by import AggregateBy
+from src.data.transforms.clean.create_column import CreateColumn
+from src.data.transforms.copy.duplicate_column import DuplicateColumn
+from src.data.transforms.transform import DataframeTransform
+from src.utility.configs.config import Config
+from src.utility.environment import Environment
+
+conf = Config(
+    load_id=datetime.now().strftime("%Y%m%d_%H%M%S"),
+    n_splits=2,
+    split_seed=5832391,
+    log_every_n_steps=50,
+    training_window_size=1,
+    n_epochs=5,
+    batch_size=16384,
+    label_policy="90Days",
+    period_duration="1D",
+    cutoff=0.5,
+    oversampler="SMOTE",
+    oversampler_args={},
+    model="ExplainableBoostingMachine",
+    model_config={},
+)
+
+
+class PreviousHours(DataframeTransform):
+    """
+    Add the hours of the previous period of the employee.
+    """
+
+    def __call__(
+        self,
+        dataframe: DataFrame,
+        errors: ErrorDataFrame,
+        conf: Config,
+        env: Environment,
+    ) -> Tuple[DataFrame, ErrorDataFrame]:
+        dataframe = dataframe.sort_values(by=["EMPLOYEE_ID", "PERIOD_START"])
+        dataframe["PREVIOUS_HOURS"] = dataframe.groupby("EMPLOYEE_ID")["HOURS"].shift()
+        return super().__call__(dataframe, errors, conf, env)
+
+    def to_dict(self) -> dict:
+        return {"name": self.__class__.__name__}
+
+
+def build_pipeline(tmp_path, cache_name: str) -> IncrementalIngestionPipeline:
+    """
+    Build a pipeline aggregating the visits by employee and day.
+    """
+    cache_env = Environment()
+    cache_env.cache_dir = str(tmp_path / cache_name)
+    return IncrementalIngestionPipeline(
+        config=conf,
+        environment=cache_env,
+        use_caching=True,
+        stages=[
+            IngestionPipelineStage(
+                name="Visit",
+                config=conf,
+                from_schema=VisitSchemaRaw,
+                to_schema=VisitSchema,
+                load_dataframe_csv_path=str(tmp_path / "visit.csv"),
+                watermark_column=VisitSchemaRaw.START_AT,
+                transforms=[DuplicateColumn({"PERIOD_START": "START_AT"})],
+            ),
+            IngestionPipelineStage(
+                name="History",
+                config=conf,
+                from_schema=VisitSchema,
+                to_schema=VisitSchema,
+                required_stages_names=["Visit"],
+                incremental_lookback=Timedelta(0),
+                transforms=[
+                    AggregateBy(
+                        ["EMPLOYEE_ID", "PERIOD_START"],
+                        aggregation_functions={"HOURS": "sum"},
+                    )
+                ],
+            ),
+            IngestionPipelineStage(
+                name="Previous",
+                config=conf,
+                from_schema=VisitSchema,
+                to_schema=VisitSchema,
+                required_stages_names=["History"],
+                incremental_lookback=Timedelta(days=1),
+                transforms=[PreviousHours()],
+            ),
+            IngestionPipelineStage(
+                name="Flagged",
+                config=conf,
+                from_schema=VisitSchema,
+                to_schema=VisitSchema,
+                required_stages_names=["Previous"],
+                transforms=[CreateColumn({VisitSchema.VISIT_COMPLETED: 1.0})],
+            ),
+        ],
+    ).build_pipeline()
+
+
+def write_visits(tmp_path, visits: list) -> None:
+    """
+    Write the (employee id, day, hours) visits of January 2023.
+    """
+    DataFrame(
+        {
+            "VISIT_ID": range(len(visits)),
+            "EMPLOYEE_ID": [employee_id for employee_id, _, _ in visits],
+            "START_AT": [
+                Timestamp(year=2023, month=1, day=day).isoformat()
+                for _, day, _ in visits
+            ],
+            "HOURS": [hours for _, _, hours in visits],
+        }
+    ).to_csv(tmp_path / "visit.csv", index=False)
+
+
+def test_run_incremental(tmp_path):
+    """
+    This method tests that only the rows after the watermark are run and merged into
+    the previous outputs.
+    """
+    visits = [(1, day, float(day)) for day in range(1, 5)] + [
+        (2, day, 10.0 * day) for day in range(1, 5)
+    ]
+    write_visits(tmp_path, visits)
+    pipeline = build_pipeline(tmp_path, "cache")
+    pipeline.run_incremental("Flagged")
+    state = pipeline.load_incremental_state("Flagged")
+    assert Timestamp(state["watermark"]) == Timestamp(year=2023, month=1, day=4)
+
+    # the old visit of the employee 2 is changed but only the new rows are read
+    visits[5] = (2, 2, 0.0)
+    write_visits(tmp_path, visits + [(1, 5, 5.0), (1, 6, 2.0), (1, 6, 4.0)])
+    pipeline = build_pipeline(tmp_path, "cache")
+    pipeline.run_incremental("Flagged")
+    result_df = pipeline.dataframes["Flagged"]
+    state = pipeline.load_incremental_state("Flagged")
+    assert Timestamp(state["watermark"]) == Timestamp(year=2023, month=1, day=6)
+    # the merged outputs are not cached as the outputs of the whole history
+    assert not pipeline.cache.has(
+        key=hash(pipeline.stages["History"]), sub_directory="History/dataframe"
+    )
+    assert pipeline.cache.has(
+        key=state["keys"]["History"], sub_directory="History/dataframe"
+    )
+
+    expected_df = (
+        build_pipeline(tmp_path, "full_cache")
+        .run_pipeline(stage_name="Flagged")
+        .dataframes["Flagged"]
+        .sort_values(by=["EMPLOYEE_ID", "PERIOD_START"])
+        .reset_index(drop=True)
+    )
+    assert result_df["HOURS"].tolist() == [
+        *[1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        *[10.0, 20.0, 30.0, 40.0],
+    ]
+    assert result_df["PREVIOUS_HOURS"].tolist()[1:6] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    employee_rows = result_df["EMPLOYEE_ID"] == 1
+    assert result_df[employee_rows].equals(expected_df[employee_rows])
+
+    full_df = (
+        pipeline.run_pipeline(stage_name="Flagged")
+        .dataframes["Flagged"]
+        .sort_values(by=["EMPLOYEE_ID", "PERIOD_START"])
+        .reset_index(drop=True)
+    )
+    assert full_df.equals(expected_df)
+
+
+def test_run_incremental_whole_history(tmp_path):
+    """
+    This method tests that the whole history is run when a transform needs it.
+    """
+
+    class FirstPeriod(DataframeTransform):
+        """
+        Add the first period of the employee.
+        """
+
+        needs_whole_history = True
+
+        def __call__(self, dataframe, errors, conf, env):
+            dataframe["FIRST_PERIOD"] = dataframe.groupby("EMPLOYEE_ID")[
+                "PERIOD_START"
+            ].transform("min")
+            return super().__call__(dataframe, errors, conf, env)
+
+        def to_dict(self) -> dict:
+            return {"name": self.__class__.__name__}
+
+    write_visits(tmp_path, [(1, day, 1.0) for day in range(1, 5)])
+    pipeline = build_pipeline(tmp_path, "cache")
+    pipeline.run_incremental("Flagged")
+    write_visits(tmp_path, [(1, day, 1.0) for day in range(1, 7)])
+    pipeline = build_pipeline(tmp_path, "cache")
+    pipeline.stages["Previous"].transforms.append(FirstPeriod())
+    pipeline.run_incremental("Flagged")
+
+    assert set(pipeline.dataframes["Flagged"]["FIRST_PERIOD"]) == {
+        Timestamp(year=2023, month=1, day=1)
+    }
+    assert pipeline.load_incremental_state("Flagged")["keys"] == {}
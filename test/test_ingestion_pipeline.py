@@ -0,0 +1,580 @@
+"""
+This module contains the tests for the IngestionPipeline class
+"""
+
+from datetime import datetime
+from importlib.util import module_from_spec, spec_from_file_location
+from inspect import getsource
+from sys import modules
+from json import load
+from os import listdir, path
+from pandas import DataFrame
+from pytest import raises
+from src.data.ingestion_pipeline.ingestion_pipeline import IngestionPipeline
+from src.data.ingestion_pipeline.ingestion_pipeline_stage import IngestionPipelineStage
+from src.data.schema.schema_column import SchemaColumn
+from src.data.schema.visit_schema import VisitSchema
+from src.data.transforms.aggregate.aggregate_by import AggregateBy
+from src.data.transforms.clean.create_column import CreateColumn
+from src.data.transforms.clean.join import Join
+from src.data.transforms.clean.keep_columns import KeepColumns
+from src.data.transforms.checkpoint.checkpoint import Checkpoint
+from src.data.transforms import transform as transform_module
+from src.data.transforms.transform import _hash_source
+from src.utility.configs.config import Config
+from src.utility.environment import Environment
+
+conf = Config(
+    load_id=datetime.now().strftime("%Y%m%d_%H%M%S"),
+    n_splits=2,
+    split_seed=5832391,
+    log_every_n_steps=50,
+    training_window_size=1,
+    n_epochs=5,
+    batch_size=16384,
+    label_policy="90Days",
+    period_duration="1D",
+    cutoff=0.5,
+    oversampler="SMOTE",
+    oversampler_args={},
+    model="ExplainableBoostingMachine",
+    model_config={},
+)
+
+env = Environment()
+
+VISIT_DATAFRAME = DataFrame({"VISIT_ID": [1, 2, 3], "VISIT_X": [1.0, 2.0, 3.0]})
+CLOCK_DATAFRAME = DataFrame({"VISIT_ID": [1, 2, 3], "VISIT_Y": [4.0, 5.0, 6.0]})
+
+
+def build_stages(tmp_path) -> [IngestionPipelineStage]:
+    """
+    Build a small diamond shaped pipeline with two roots.
+    """
+    visit_path = tmp_path / "visit.csv"
+    clock_path = tmp_path / "clock.csv"
+    if not visit_path.exists():
+        VISIT_DATAFRAME.to_csv(visit_path, index=False)
+    if not clock_path.exists():
+        CLOCK_DATAFRAME.to_csv(clock_path, index=False)
+    return [
+        IngestionPipelineStage(
+            name="Visit",
+            config=conf,
+            from_schema=VisitSchema,
+            to_schema=VisitSchema,
+            load_dataframe_csv_path=str(visit_path),
+            transforms=[],
+        ),
+        IngestionPipelineStage(
+            name="Clock",
+            config=conf,
+            from_schema=VisitSchema,
+            to_schema=VisitSchema,
+            load_dataframe_csv_path=str(clock_path),
+            transforms=[],
+        ),
+        IngestionPipelineStage(
+            name="Augmented",
+            config=conf,
+            from_schema=VisitSchema,
+            to_schema=VisitSchema,
+            required_stages_names=["Visit", "Clock"],
+            transforms=[
+                Join(right="Clock", how="left", on=[VisitSchema.VISIT_ID]),
+            ],
+        ),
+        IngestionPipelineStage(
+            name="Flagged",
+            config=conf,
+            from_schema=VisitSchema,
+            to_schema=VisitSchema,
+            required_stages_names=["Augmented"],
+            transforms=[CreateColumn({VisitSchema.VISIT_COMPLETED: 1.0})],
+        ),
+    ]
+
+
+def test_run_pipeline_sequential(tmp_path):
+    """
+    This method tests that every stage runs after its required stages.
+    """
+    pipeline = IngestionPipeline(
+        config=conf,
+        environment=env,
+        stages=build_stages(tmp_path),
+    )
+    pipeline.build_pipeline().run_pipeline()
+
+    assert list(pipeline.completed_stages)[-2:] == ["Augmented", "Flagged"]
+    result_df = pipeline.dataframes["Flagged"]
+    assert list(result_df.columns) == [
+        "VISIT_ID",
+        "VISIT_X",
+        "VISIT_Y",
+        "VISIT_COMPLETED",
+    ]
+    assert result_df["VISIT_Y"].tolist() == [4.0, 5.0, 6.0]
+
+    critical_path, duration = pipeline.get_critical_path()
+    assert critical_path[-2:] == ["Augmented", "Flagged"]
+    assert critical_path[0] in ["Visit", "Clock"]
+    assert duration >= 0
+
+
+def test_run_pipeline_parallel(tmp_path):
+    """
+    This method tests that the process pool gives the same result as the sequential run.
+    """
+    pipeline = IngestionPipeline(
+        config=conf,
+        environment=env,
+        max_workers=2,
+        stages=build_stages(tmp_path),
+    )
+    pipeline.build_pipeline().run_pipeline()
+
+    assert set(pipeline.completed_stages) == {"Visit", "Clock", "Augmented", "Flagged"}
+    assert pipeline.dataframes["Flagged"]["VISIT_Y"].tolist() == [4.0, 5.0, 6.0]
+    assert len(pipeline.dataframes["Flagged"]) == 3
+
+
+def test_run_pipeline_requested_stage(tmp_path):
+    """
+    This method tests that only the ancestors of the requested stage are run.
+    """
+    pipeline = IngestionPipeline(
+        config=conf,
+        environment=env,
+        stages=build_stages(tmp_path),
+    ).build_pipeline()
+
+    assert list(pipeline.get_required_stages(["Augmented"])) == [
+        "Visit",
+        "Clock",
+        "Augmented",
+    ]
+    assert list(pipeline.get_required_stages(["Visit"])) == ["Visit"]
+
+    pipeline.run_pipeline(stage_name="Augmented")
+
+    assert set(pipeline.completed_stages) == {"Visit", "Clock", "Augmented"}
+    assert pipeline.dataframes["Flagged"] is None
+
+    pipeline.run_pipeline(stage_name=["Flagged"])
+
+    assert list(pipeline.completed_stages)[-1] == "Flagged"
+
+
+def test_run_pipeline_eliminates_dead_columns(tmp_path):
+    """
+    This method tests that the columns that the requested stage does not read are
+    dropped and that the transforms that only write them are skipped.
+    """
+    expected_df = None
+    for eliminate_dead_columns in [False, True]:
+        pipeline = IngestionPipeline(
+            config=conf,
+            environment=env,
+            eliminate_dead_columns=eliminate_dead_columns,
+            stages=[
+                *build_stages(tmp_path),
+                IngestionPipelineStage(
+                    name="Kept",
+                    config=conf,
+                    from_schema=VisitSchema,
+                    to_schema=VisitSchema,
+                    required_stages_names=["Flagged"],
+                    transforms=[
+                        KeepColumns(
+                            columns=[VisitSchema.VISIT_ID, SchemaColumn("VISIT_Y")]
+                        )
+                    ],
+                ),
+            ],
+        )
+        pipeline.build_pipeline().run_pipeline(stage_name="Kept")
+        if expected_df is None:
+            expected_df = pipeline.dataframes["Kept"]
+
+    assert pipeline.dataframes["Kept"].equals(expected_df)
+    assert pipeline.stages["Flagged"].dead_transforms == {0}
+    assert list(pipeline.dataframes["Flagged"].columns) == ["VISIT_ID", "VISIT_Y"]
+    assert list(pipeline.dataframes["Visit"].columns) == ["VISIT_ID"]
+    assert list(pipeline.dataframes["Clock"].columns) == ["VISIT_ID", "VISIT_Y"]
+
+
+def test_plan_pipeline_does_not_plan_columns(tmp_path):
+    """
+    This method tests that the plan of a pipeline eliminating the dead columns does not
+    apply the column plan to the stages, and that the run does.
+    """
+    pipeline = IngestionPipeline(
+        config=conf,
+        environment=env,
+        eliminate_dead_columns=True,
+        stages=[
+            *build_stages(tmp_path),
+            IngestionPipelineStage(
+                name="Kept",
+                config=conf,
+                from_schema=VisitSchema,
+                to_schema=VisitSchema,
+                required_stages_names=["Flagged"],
+                transforms=[KeepColumns(columns=[VisitSchema.VISIT_ID])],
+            ),
+        ],
+    ).build_pipeline()
+    pipeline.run_pipeline(stage_name="Flagged")
+    completed_stages_names = list(pipeline.completed_stages)
+    hashes = pipeline.get_stage_hashes()
+
+    plan = pipeline.plan("Kept", verbose=False)
+    assert plan.stages["Flagged"].status == "compute"
+    assert plan.stages["Kept"].status == "compute"
+    assert list(pipeline.completed_stages) == completed_stages_names
+    assert pipeline.get_stage_hashes() == hashes
+    assert pipeline.stages["Flagged"].output_columns is None
+    assert pipeline.stages["Flagged"].dead_transforms == set()
+
+    pipeline.run_pipeline(stage_name="Kept")
+    assert pipeline.get_stage_hashes() == plan.hashes
+    assert pipeline.stages["Flagged"].output_columns == ["VISIT_ID"]
+
+
+def test_run_pipeline_releases_dataframes(tmp_path, capsys):
+    """
+    This method tests that the dataframes without children left to run are released
+    and reloaded when they are read or tested.
+    """
+    for spill_released_dataframes in [False, True]:
+        cache_env = Environment()
+        cache_env.cache_dir = str(tmp_path / f"cache_{spill_released_dataframes}")
+        pipeline = IngestionPipeline(
+            config=conf,
+            environment=cache_env,
+            release_dataframes=True,
+            spill_released_dataframes=spill_released_dataframes,
+            stages=build_stages(tmp_path),
+        )
+        pipeline.build_pipeline().run_pipeline(stage_name="Flagged")
+
+        assert set(pipeline.completed_stages) == {"Flagged"}
+        assert pipeline.released_stages_names == {"Visit", "Clock", "Augmented"}
+        assert all(
+            pipeline.stages[stage_name].dataframe is None
+            for stage_name in ["Visit", "Clock", "Augmented"]
+        )
+        assert pipeline.stages["Augmented"].transforms[0].right == "Clock"
+        assert len(pipeline.cache.entries) == (3 if spill_released_dataframes else 0)
+
+        capsys.readouterr()
+        pipeline.data_integrity_test()
+        assert "Augmented's Data integrity test has passed" in capsys.readouterr().out
+        assert pipeline.released_stages_names == {"Visit", "Clock", "Augmented"}
+        assert pipeline.stages["Augmented"].dataframe is None
+
+        assert pipeline.dataframes["Augmented"]["VISIT_Y"].tolist() == [4.0, 5.0, 6.0]
+        assert "Augmented" in pipeline.completed_stages
+        assert pipeline.dataframes["Flagged"]["VISIT_Y"].tolist() == [4.0, 5.0, 6.0]
+
+
+def test_run_pipeline_partitioned(tmp_path):
+    """
+    This method tests that a stage processed by partitions gives the rows of the whole
+    dataframe and that the transforms which can not be partitioned are refused.
+    """
+    build_stages(tmp_path)
+    DataFrame(
+        {"VISIT_ID": [index % 7 for index in range(20)], "VISIT_X": range(20)}
+    ).to_csv(tmp_path / "visit.csv", index=False)
+
+    def build_partitioned_stage(n_partitions: int) -> IngestionPipelineStage:
+        return IngestionPipelineStage(
+            name="Partitioned",
+            config=conf,
+            from_schema=VisitSchema,
+            to_schema=VisitSchema,
+            required_stages_names=["Visit", "Clock"],
+            partition_by=VisitSchema.VISIT_ID,
+            n_partitions=n_partitions,
+            transforms=[
+                AggregateBy(
+                    [VisitSchema.VISIT_ID], aggregation_functions={"VISIT_X": "sum"}
+                ),
+                Join(right="Clock", how="left", on=[VisitSchema.VISIT_ID]),
+            ],
+        )
+
+    result_dfs = []
+    for n_partitions in [1, 3]:
+        pipeline = IngestionPipeline(
+            config=conf,
+            environment=env,
+            stages=[*build_stages(tmp_path)[:2], build_partitioned_stage(n_partitions)],
+        )
+        pipeline.build_pipeline().run_pipeline("Partitioned")
+        result_dfs.append(pipeline.dataframes["Partitioned"])
+    assert pipeline.stages["Partitioned"].is_partitioned
+    assert len(result_dfs[1]) == 7
+    assert (
+        result_dfs[1]
+        .sort_values(by="VISIT_ID")
+        .reset_index(drop=True)
+        .equals(result_dfs[0])
+    )
+
+    with raises(ValueError):
+        IngestionPipelineStage(
+            name="Flagged",
+            config=conf,
+            from_schema=VisitSchema,
+            to_schema=VisitSchema,
+            required_stages_names=["Visit"],
+            partition_by=VisitSchema.VISIT_ID,
+            n_partitions=2,
+            transforms=[CreateColumn({VisitSchema.VISIT_COMPLETED: 1.0})],
+        )
+
+
+def test_run_pipeline_profile(tmp_path):
+    """
+    This method tests that the profiled run records every step of every stage and
+    writes its reports next to the cache.
+    """
+    cache_env = Environment()
+    cache_env.cache_dir = str(tmp_path / "cache")
+    pipeline = IngestionPipeline(
+        config=conf,
+        environment=cache_env,
+        max_workers=2,
+        profile=True,
+        stages=build_stages(tmp_path),
+    )
+    pipeline.build_pipeline().run_pipeline()
+
+    steps = {(record["stage"], record["step"]) for record in pipeline.profile_records}
+    assert steps == {
+        ("Visit", "load_csv"),
+        ("Clock", "load_csv"),
+        ("Augmented", "Join"),
+        ("Flagged", "CreateColumn"),
+    }
+    flagged_record = pipeline.profile_records[-1]
+    assert flagged_record["rows_in"] == flagged_record["rows_out"] == 3
+    assert flagged_record["columns_out"] == flagged_record["columns_in"] + 1
+    assert flagged_record["wall_time"] >= 0
+
+    profiles_dir = path.join(cache_env.cache_dir, "profiles")
+    (report_name,) = {filename.split(".")[0] for filename in listdir(profiles_dir)}
+    with open(
+        path.join(profiles_dir, f"{report_name}.json"), "r", encoding="utf-8"
+    ) as file:
+        report = load(file)
+    assert [stage["stage"] for stage in report["stages"]][-2:] == [
+        "Augmented",
+        "Flagged",
+    ]
+    assert len(report["steps"]) == 4
+    assert path.exists(path.join(profiles_dir, f"{report_name}.csv"))
+    assert path.exists(path.join(profiles_dir, f"{report_name}.txt"))
+
+
+def test_run_pipeline_resumes_from_checkpoint(tmp_path):
+    """
+    This method tests that a stage resumes from its checkpoint when only the transforms
+    after the checkpoint change.
+    """
+    cache_env = Environment()
+    cache_env.cache_dir = str(tmp_path / "cache")
+
+    def build_pipeline(last_column) -> IngestionPipeline:
+        stages = build_stages(tmp_path)
+        stages[-1].transforms = [
+            CreateColumn({VisitSchema.VISIT_COMPLETED: 1.0}),
+            Checkpoint(),
+            CreateColumn({last_column: 2.0}),
+        ]
+        return IngestionPipeline(
+            config=conf,
+            environment=cache_env,
+            use_caching=True,
+            stages=stages,
+        ).build_pipeline()
+
+    first_pipeline = build_pipeline(VisitSchema.VISIT_UNIT_QTY)
+    first_pipeline.run_pipeline()
+    second_pipeline = build_pipeline(VisitSchema.VISIT_HOURS_APPROVED)
+
+    first_stage = first_pipeline.stages["Flagged"]
+    second_stage = second_pipeline.stages["Flagged"]
+    assert hash(first_stage) != hash(second_stage)
+    assert first_stage.get_checkpoint_keys() == second_stage.get_checkpoint_keys()
+    assert any(
+        entry["sub_directory"] == "Flagged/checkpoints/dataframe"
+        for entry in first_pipeline.cache.entries.values()
+    )
+
+    second_pipeline.run_pipeline()
+
+    result_df = second_pipeline.dataframes["Flagged"]
+    assert result_df["VISIT_COMPLETED"].tolist() == [1.0, 1.0, 1.0]
+    assert result_df["VISIT_HOURS_APPROVED"].tolist() == [2.0, 2.0, 2.0]
+    assert "VISIT_UNIT_QTY" not in result_df.columns
+    assert sorted(second_pipeline.gc_cache()) == [
+        f"Flagged/dataframe/{hash(first_stage)}.pkl",
+        f"Flagged/errors/{hash(first_stage)}.pkl",
+    ]
+
+
+def test_stage_hash_follows_source_file(tmp_path):
+    """
+    This method tests that only the stages downstream of a modified csv change hash.
+    """
+    pipeline = IngestionPipeline(
+        config=conf,
+        environment=env,
+        stages=build_stages(tmp_path),
+    ).build_pipeline()
+    hashes = {name: hash(stage) for name, stage in pipeline.stages.items()}
+
+    VISIT_DATAFRAME.head(2).to_csv(tmp_path / "visit.csv", index=False)
+
+    new_hashes = {name: hash(stage) for name, stage in pipeline.stages.items()}
+    assert new_hashes["Clock"] == hashes["Clock"]
+    for name in ["Visit", "Augmented", "Flagged"]:
+        assert new_hashes[name] != hashes[name]
+
+
+def test_stage_hash_follows_transform_code(tmp_path):
+    """
+    This method tests that a new version of a transform code changes the hash of its
+    stage and of the downstream stages only.
+    """
+    pipeline = IngestionPipeline(
+        config=conf,
+        environment=env,
+        stages=build_stages(tmp_path),
+    ).build_pipeline()
+    hashes = {name: hash(stage) for name, stage in pipeline.stages.items()}
+
+    class VersionedCreateColumn(CreateColumn):
+        """
+        A CreateColumn with an explicit code version.
+        """
+
+        code_version = "2"
+
+    assert VersionedCreateColumn.get_code_version() == "2"
+    assert CreateColumn.get_code_version() == CreateColumn.get_code_version()
+    assert len(CreateColumn.get_code_version()) == 64
+
+    pipeline.stages["Augmented"].transforms.append(VersionedCreateColumn())
+    hashes_with_transform = {
+        name: hash(stage) for name, stage in pipeline.stages.items()
+    }
+    VersionedCreateColumn.code_version = "3"
+    new_hashes = {name: hash(stage) for name, stage in pipeline.stages.items()}
+
+    for name in ["Visit", "Clock"]:
+        assert new_hashes[name] == hashes[name]
+    for name in ["Augmented", "Flagged"]:
+        assert len({hashes[name], hashes_with_transform[name], new_hashes[name]}) == 3
+
+
+def test_transform_code_version_follows_module(tmp_path, monkeypatch):
+    """
+    This method tests that the code version of a transform changes when a helper of
+    its module changes.
+    """
+    module_path = tmp_path / "helper_transform.py"
+
+    def load_transform(helper_value):
+        module_path.write_text(
+            "from src.data.transforms.clean.create_column import CreateColumn\n"
+            f"def get_value():\n    return {helper_value}\n"
+            "class HelperTransform(CreateColumn):\n    pass\n"
+        )
+        spec = spec_from_file_location("helper_transform", module_path)
+        module = module_from_spec(spec)
+        monkeypatch.setitem(modules, "helper_transform", module)
+        spec.loader.exec_module(module)
+        return module.HelperTransform
+
+    version = load_transform(1).get_code_version()
+    assert load_transform(1).get_code_version() == version
+    assert load_transform(100).get_code_version() != version
+
+
+def test_transform_code_version_skips_base_module(monkeypatch):
+    """
+    This method tests that the module of DataframeTransform is not part of the code
+    version of the transforms, so that an edit of it keeps the cached stages.
+    """
+    hashed_modules = []
+
+    def record_getsource(module):
+        hashed_modules.append(module)
+        return getsource(module)
+
+    monkeypatch.setattr(transform_module, "getsource", record_getsource)
+    _hash_source.cache_clear()
+    try:
+        CreateColumn.get_code_version()
+    finally:
+        _hash_source.cache_clear()
+    assert modules[CreateColumn.__module__] in hashed_modules
+    assert transform_module not in hashed_modules
+
+
+def test_plan_pipeline(tmp_path):
+    """
+    This method tests that the plan resolves the cached stages and explains why the
+    others are computed.
+    """
+    cache_env = Environment()
+    cache_env.cache_dir = str(tmp_path / "cache")
+
+    def build_pipeline(column: SchemaColumn) -> IngestionPipeline:
+        stages = build_stages(tmp_path)
+        stages[-1].transforms = [CreateColumn({column: 1.0})]
+        return IngestionPipeline(
+            config=conf,
+            environment=cache_env,
+            use_caching=True,
+            stages=stages,
+        ).build_pipeline()
+
+    pipeline = build_pipeline(VisitSchema.VISIT_COMPLETED)
+    plan = pipeline.plan("Flagged", verbose=False)
+    assert list(plan.stages) == ["Visit", "Clock", "Augmented", "Flagged"]
+    assert {stage.status for stage in plan.stages.values()} == {"compute"}
+    assert {stage.reason for stage in plan.stages.values()} == {"never cached"}
+    assert plan.stages["Visit"].estimated_input_size == path.getsize(
+        tmp_path / "visit.csv"
+    )
+    assert plan.hashes == {name: hash(stage) for name, stage in pipeline.stages.items()}
+    pipeline.cache.pin([0])
+    pipeline.run_pipeline("Flagged")
+    assert pipeline.cache.pinned_keys == {"0"}
+
+    plan = build_pipeline(VisitSchema.VISIT_COMPLETED).plan("Flagged", verbose=False)
+    assert list(plan.stages) == ["Flagged"]
+    assert plan.stages["Flagged"].status == "cached"
+    assert plan.stages["Flagged"].estimated_input_size > 0
+
+    plan = build_pipeline(VisitSchema.VISIT_UNIT_QTY).plan("Flagged", verbose=False)
+    assert [stage.status for stage in plan.stages.values()] == ["cached", "compute"]
+    assert plan.stages["Flagged"].reason == "CreateColumn changed"
+    assert plan.stages["Flagged"].estimated_input_size == (
+        plan.stages["Augmented"].estimated_input_size
+    )
+    assert plan.stages_to_run_names == ["Augmented", "Flagged"]
+    assert "PLAN" in str(plan)
+
+    VISIT_DATAFRAME.head(2).to_csv(tmp_path / "visit.csv", index=False)
+    plan = build_pipeline(VisitSchema.VISIT_COMPLETED).plan("Flagged", verbose=False)
+    assert plan.stages["Visit"].reason == "csv changed"
+    assert plan.stages["Clock"].status == "cached"
+    assert plan.stages["Augmented"].reason == "required stages changed: Visit"
+    assert plan.stages["Flagged"].reason == "required stages changed: Augmented"
@@ -0,0 +1,167 @@
+"""
+This module contains the tests for the polars backend of process_dataframe
+"""
+
+from datetime import datetime
+from os import path
+from pandas import DataFrame, read_csv, to_datetime
+from pandas.testing import assert_frame_equal
+from src.data.process_dataframe import process_dataframe
+from src.data.schema.augmented_visit_schema import AugmentedVisitSchema
+from src.data.schema.employee_history_schema import EmployeeHistorySchema
+from src.data.transforms.aggregate.aggregate_by import AggregateBy
+from src.data.transforms.calculated_fields.compute_period_start import (
+    ComputePeriodStart,
+)
+from src.data.transforms.clean.fill_gaps import FillGaps
+from src.data.transforms.clean.join import Join
+from src.data.transforms.clean.rename_columns import RenameColumns
+from src.data.transforms.clean.set_value_range import SetValueRange
+from src.utility.configs.config import Config
+from src.utility.dataframe_set_types import set_datetime
+from src.utility.environment import Environment
+from src.utility.profiler import Profiler
+
+INPUT_DATAFRAME_PATH = path.join("test", "csv", "test_fill_gaps_input.csv")
+
+conf = Config(
+    load_id=datetime.now().strftime("%Y%m%d_%H%M%S"),
+    n_splits=2,
+    split_seed=5832391,
+    log_every_n_steps=50,
+    training_window_size=1,
+    n_epochs=5,
+    batch_size=16384,
+    label_policy="90Days",
+    period_duration="1D",
+    cutoff=0.5,
+    oversampler="SMOTE",
+    oversampler_args={},
+    model="ExplainableBoostingMachine",
+    model_config={},
+)
+
+env = Environment()
+
+
+def process_with_backends(dataframe: DataFrame, build_transforms) -> list:
+    """
+    Process a copy of the dataframe with the pandas and the polars backends.
+    """
+    return [
+        process_dataframe(
+            dataframe=dataframe.copy(),
+            transforms=build_transforms(),
+            conf=conf,
+            env=env,
+            backend=backend,
+        )
+        for backend in ["pandas", "polars"]
+    ]
+
+
+def test_process_dataframe_polars_visits():
+    """
+    This method tests that the fused joins, period start, value range and aggregation
+    give the rows and the errors of pandas.
+    """
+    visits = DataFrame(
+        {
+            "VISIT_ID": range(8),
+            "EMPLOYEE_ID": [1, 1, 2, 2, 2, 3, 3, None],
+            "VISIT_START_AT": to_datetime(
+                [
+                    "2023-01-01 08:00",
+                    "2023-01-01 14:00",
+                    "2023-01-01 09:00",
+                    "2023-01-02 09:00",
+                    "2023-01-03 23:00",
+                    "2023-01-02 10:00",
+                    "2023-01-02 12:00",
+                    "2023-01-02 12:00",
+                ]
+            ),
+            "VISIT_HOURS_APPROVED": [4.0, 30.0, 2.0, None, 3.5, -1.0, 6.0, 1.0],
+            "CLIENT_ID": [10, 11, 10, 10, 12, 11, 11, 10],
+        }
+    )
+    employees = DataFrame(
+        {"EMPLOYEE_ID": [1.0, 2.0, 3.0], "EMPLOYEE_AGE": [30.0, 41.0, 25.0]}
+    )
+
+    def build_transforms():
+        return [
+            Join(right=employees, how="left", on=[AugmentedVisitSchema.EMPLOYEE_ID]),
+            ComputePeriodStart(period="1D"),
+            SetValueRange(
+                columns=[AugmentedVisitSchema.VISIT_HOURS_APPROVED],
+                min_value=0,
+                max_value=24,
+            ),
+            AggregateBy(
+                [
+                    AugmentedVisitSchema.EMPLOYEE_ID.name,
+                    AugmentedVisitSchema.PERIOD_START.name,
+                ],
+                aggregation_functions={
+                    AugmentedVisitSchema.EMPLOYEE_AGE: "mean",
+                    AugmentedVisitSchema.VISIT_ID: "count",
+                    AugmentedVisitSchema.VISIT_HOURS_APPROVED: "sum",
+                    AugmentedVisitSchema.CLIENT_ID: "nunique",
+                },
+            ),
+        ]
+
+    (pandas_df, pandas_errors), (polars_df, polars_errors) = process_with_backends(
+        visits, build_transforms
+    )
+    assert_frame_equal(polars_df, pandas_df)
+    assert polars_errors.get_counts().equals(pandas_errors.get_counts())
+    assert (
+        polars_errors.to_dataframe()["VISIT_ID"].tolist()
+        == pandas_errors.to_dataframe()["VISIT_ID"].tolist()
+        == [5, 1]
+    )
+
+
+def test_process_dataframe_polars_fill_gaps():
+    """
+    This method tests that FillGaps after a pandas transform gives the values of pandas.
+    """
+    input_df = set_datetime(
+        read_csv(INPUT_DATAFRAME_PATH, encoding="utf-8", low_memory=False),
+        [
+            EmployeeHistorySchema.EMPLOYEE_TERMINATION_DATE,
+            EmployeeHistorySchema.PERIOD_START,
+            EmployeeHistorySchema.EMPLOYEE_START_ON,
+        ],
+    )
+
+    (pandas_df, _), (polars_df, _) = process_with_backends(
+        input_df, lambda: [RenameColumns(to_schema=EmployeeHistorySchema), FillGaps()]
+    )
+    assert len(polars_df) > len(input_df)
+    assert_frame_equal(polars_df, pandas_df, check_dtype=False)
+
+
+def test_process_dataframe_polars_profile():
+    """
+    This method tests that the fused transforms are profiled as one step.
+    """
+    profiler = Profiler(stage_name="Visit")
+    process_dataframe(
+        dataframe=DataFrame(
+            {"VISIT_START_AT": to_datetime(["2023-01-01 08:00"]), "VALUE": [1.0]}
+        ),
+        transforms=[
+            ComputePeriodStart(period="1D"),
+            SetValueRange(columns=["VALUE"], min_value=0),
+        ],
+        conf=conf,
+        env=env,
+        profiler=profiler,
+        backend="polars",
+    )
+    assert [record["step"] for record in profiler.records] == [
+        "polars(ComputePeriodStart, SetValueRange)"
+    ]
@@ -0,0 +1,92 @@
+"""
+This module contains the tests for the process_dataframe function
+"""
+
+from datetime import datetime
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
+from src.data.process_dataframe import get_row_local_prefix_length, process_dataframe
+from src.data.schema.visit_schema import VisitSchema
+from src.data.transforms.clean.create_column import CreateColumn
+from src.data.transforms.clean.set_value_range import SetValueRange
+from src.data.transforms.clean.value_must_equal import ValueMustEqual
+from src.utility.configs.config import Config
+from src.utility.environment import Environment
+
+conf = Config(
+    load_id=datetime.now().strftime("%Y%m%d_%H%M%S"),
+    n_splits=2,
+    split_seed=5832391,
+    log_every_n_steps=50,
+    training_window_size=1,
+    n_epochs=5,
+    batch_size=16384,
+    label_policy="90Days",
+    period_duration="1D",
+    cutoff=0.5,
+    oversampler="SMOTE",
+    oversampler_args={},
+    model="ExplainableBoostingMachine",
+    model_config={},
+)
+
+env = Environment()
+
+dataframe = DataFrame(
+    {
+        VisitSchema.VISIT_ID.name: list(range(10)),
+        VisitSchema.EMPLOYEE_ID.name: [1, 2, 2, 3, 2, 4, 5, 2, 6, 7],
+        VisitSchema.VISIT_UNIT_QTY.name: [1.0, 2.0, 30.0, 4.0, 5.0, 60.0, 7, 8, 9, 10],
+    }
+)
+
+
+def build_transforms():
+    """
+    Build row local transforms followed by a transform that needs the whole dataframe.
+    """
+    return [
+        ValueMustEqual(column=VisitSchema.EMPLOYEE_ID, value=2, invert=True),
+        SetValueRange(columns=[VisitSchema.VISIT_UNIT_QTY], max_value=20),
+        CreateColumn({VisitSchema.VISIT_COMPLETED: 1.0}),
+    ]
+
+
+def test_process_dataframe_chunked(tmp_path):
+    """
+    This method tests that streaming the csv by chunks gives the same result as loading
+    the whole csv.
+    """
+    csv_path = tmp_path / "visit.csv"
+    dataframe.to_csv(csv_path, index=False)
+
+    assert get_row_local_prefix_length(build_transforms()) == 2
+
+    expected_df, expected_errors = process_dataframe(
+        load_dataframe_csv_path=csv_path,
+        transforms=build_transforms(),
+        conf=conf,
+        env=env,
+    )
+    for chunk_size in [1, 3, 100]:
+        result_df, result_errors = process_dataframe(
+            load_dataframe_csv_path=csv_path,
+            transforms=build_transforms(),
+            conf=conf,
+            env=env,
+            chunk_size=chunk_size,
+        )
+        assert_frame_equal(result_df, expected_df)
+        assert sorted(result_errors.to_dataframe()["VISIT_ID"].tolist()) == sorted(
+            expected_errors.to_dataframe()["VISIT_ID"].tolist()
+        )
+
+    result_df, _ = process_dataframe(
+        load_dataframe_csv_path=csv_path,
+        transforms=build_transforms(),
+        conf=conf,
+        env=env,
+        limit=4,
+        chunk_size=3,
+    )
+    assert result_df["VISIT_ID"].tolist() == [0, 3]
@@ -0,0 +1,220 @@
+"""
+This module contains the tests for the schema csv reader
+"""
+
+from datetime import datetime
+from numpy import isnan
+from pandas import DataFrame
+from pandas.api.types import is_datetime64_any_dtype
+from src.data.process_dataframe import process_dataframe
+from src.data.read_schema_csv import (
+    get_used_columns,
+    read_schema_csv,
+    set_schema_dtypes,
+)
+from src.data.schema.visit_schema import VisitSchema, VisitSchemaRaw
+from src.data.transforms.calculated_fields.visit_data.has_adl_completed import (
+    HasADLComplete,
+)
+from src.data.transforms.clean.keep_columns import KeepColumns
+from src.data.transforms.clean.rename_columns import RenameColumns
+from src.data.transforms.clean.value_must_equal import ValueMustEqual
+from src.data.transforms.clean.create_column import CreateColumn
+from src.data.transforms.types.set_types_visit import SetTypesVisit
+from src.utility.configs.config import Config
+from src.utility.environment import Environment
+
+conf = Config(
+    load_id=datetime.now().strftime("%Y%m%d_%H%M%S"),
+    n_splits=2,
+    split_seed=5832391,
+    log_every_n_steps=50,
+    training_window_size=1,
+    n_epochs=5,
+    batch_size=16384,
+    label_policy="90Days",
+    period_duration="1D",
+    cutoff=0.5,
+    oversampler="SMOTE",
+    oversampler_args={},
+    model="ExplainableBoostingMachine",
+    model_config={},
+)
+
+env = Environment()
+
+dataframe = DataFrame(
+    {
+        VisitSchemaRaw.VISIT_ID.name: [1, 2, 3],
+        VisitSchemaRaw.EMPLOYEE_ID.name: [10, 2, 30],
+        VisitSchemaRaw.START_AT.name: ["2023-01-01 08:00:00", "invalid", None],
+        VisitSchemaRaw.SERVICE_DESCRIPTION.name: ["Personal care", None, "Visit"],
+        VisitSchemaRaw.VISIT_UNIT_QTY.name: [1, None, 3],
+        VisitSchemaRaw.HAS_ADL.name: [1, 0, 1],
+        VisitSchemaRaw.ADL_COMPLETE.name: [1, 1, 0],
+        VisitSchemaRaw.CANCEL_CODE.name: [None, None, None],
+        "UNKNOWN_COLUMN": ["a", "b", "c"],
+    }
+)
+
+
+def build_transforms():
+    """
+    Build the transforms of a cleaning stage.
+    """
+    return [
+        RenameColumns(to_schema=VisitSchema),
+        SetTypesVisit(),
+        ValueMustEqual(column=VisitSchema.EMPLOYEE_ID, value=2, invert=True),
+        HasADLComplete(),
+        KeepColumns(
+            columns=[
+                VisitSchema.VISIT_ID,
+                VisitSchema.VISIT_START_AT,
+                VisitSchema.VISIT_SERVICE_DESCRIPTION,
+                VisitSchema.VISIT_UNIT_QTY,
+                VisitSchema.VISIT_HAS_ADL_COMPLETED,
+            ],
+        ),
+    ]
+
+
+def test_get_used_columns():
+    """
+    This method tests that the used columns are the kept ones and the ones read before.
+    """
+    assert sorted(get_used_columns(VisitSchemaRaw, build_transforms())) == sorted(
+        [
+            VisitSchemaRaw.VISIT_ID.name,
+            VisitSchemaRaw.EMPLOYEE_ID.name,
+            VisitSchemaRaw.START_AT.name,
+            VisitSchemaRaw.SERVICE_DESCRIPTION.name,
+            VisitSchemaRaw.VISIT_UNIT_QTY.name,
+            VisitSchemaRaw.HAS_ADL.name,
+            VisitSchemaRaw.ADL_COMPLETE.name,
+        ]
+    )
+    assert get_used_columns(VisitSchemaRaw, build_transforms()[:-1]) is None
+    assert (
+        get_used_columns(
+            VisitSchemaRaw, [CreateColumn({VisitSchema.VISIT_COMPLETED: 1.0})]
+        )
+        is None
+    )
+
+
+def test_read_schema_csv(tmp_path):
+    """
+    This method tests that the csv is read with the types of the schema.
+    """
+    csv_path = tmp_path / "visit.csv"
+    dataframe.to_csv(csv_path, index=False)
+
+    result_df = read_schema_csv(
+        csv_path,
+        schema=VisitSchemaRaw,
+        columns=get_used_columns(VisitSchemaRaw, build_transforms()),
+    )
+
+    assert VisitSchemaRaw.CANCEL_CODE.name not in result_df.columns
+    assert "UNKNOWN_COLUMN" not in result_df.columns
+    assert is_datetime64_any_dtype(result_df[VisitSchemaRaw.START_AT.name])
+    assert result_df[VisitSchemaRaw.START_AT.name].isna().tolist() == [
+        False,
+        True,
+        True,
+    ]
+    assert result_df[VisitSchemaRaw.VISIT_UNIT_QTY.name].dtype == "float64"
+    assert isnan(result_df[VisitSchemaRaw.SERVICE_DESCRIPTION.name][1])
+
+    result_df, _ = process_dataframe(
+        load_dataframe_csv_path=csv_path,
+        transforms=build_transforms(),
+        conf=conf,
+        env=env,
+        from_schema=VisitSchemaRaw,
+    )
+    expected_df, _ = process_dataframe(
+        load_dataframe_csv_path=csv_path,
+        transforms=build_transforms(),
+        conf=conf,
+        env=env,
+    )
+    assert result_df.equals(expected_df)
+
+    chunked_df, _ = process_dataframe(
+        load_dataframe_csv_path=csv_path,
+        transforms=build_transforms(),
+        conf=conf,
+        env=env,
+        chunk_size=2,
+        from_schema=VisitSchemaRaw,
+    )
+    assert chunked_df.equals(expected_df)
+
+
+def test_read_schema_csv_malformed_numbers(tmp_path):
+    """
+    This method tests that the invalid values of the numeric columns become NaN.
+    """
+    csv_path = tmp_path / "visit.csv"
+    malformed_df = dataframe.copy()
+    malformed_df[VisitSchemaRaw.VISIT_UNIT_QTY.name] = ["1", "2 units", "3"]
+    malformed_df.to_csv(csv_path, index=False)
+
+    result_df = read_schema_csv(csv_path, schema=VisitSchemaRaw)
+    assert result_df[VisitSchemaRaw.VISIT_UNIT_QTY.name].dtype == "float64"
+    assert result_df[VisitSchemaRaw.VISIT_UNIT_QTY.name].isna().tolist() == [
+        False,
+        True,
+        False,
+    ]
+    assert result_df[VisitSchemaRaw.VISIT_ID.name].tolist() == [1, 2, 3]
+
+    expected_df, _ = process_dataframe(
+        load_dataframe_csv_path=csv_path,
+        transforms=build_transforms(),
+        conf=conf,
+        env=env,
+        from_schema=VisitSchemaRaw,
+    )
+    assert expected_df[VisitSchemaRaw.VISIT_UNIT_QTY.name].tolist() == [1.0, 3.0]
+    chunked_df, _ = process_dataframe(
+        load_dataframe_csv_path=csv_path,
+        transforms=build_transforms(),
+        conf=conf,
+        env=env,
+        chunk_size=2,
+        from_schema=VisitSchemaRaw,
+    )
+    assert chunked_df.equals(expected_df)
+
+
+def test_set_schema_dtypes():
+    """
+    This method tests that the columns are cast to the dtypes of the schema and that the
+    columns which cannot be cast keep their dtypes.
+    """
+    visit_df = DataFrame(
+        {
+            VisitSchema.VISIT_ID.name: [1.0, 2.0],
+            VisitSchema.EMPLOYEE_ID.name: [1.0, None],
+            VisitSchema.VISIT_UNIT_QTY.name: [1, 2],
+            VisitSchema.VISIT_START_AT_UTC.name: ["2023-01-01 08:00:00", "invalid"],
+        }
+    )
+
+    result_df = set_schema_dtypes(
+        visit_df,
+        schema=VisitSchema,
+        datetime_arguments={VisitSchema.VISIT_START_AT_UTC.name: {"utc": True}},
+    )
+
+    assert result_df[VisitSchema.VISIT_ID.name].dtype == "int64"
+    assert result_df[VisitSchema.EMPLOYEE_ID.name].dtype == "float64"
+    assert result_df[VisitSchema.VISIT_UNIT_QTY.name].dtype == "float64"
+    assert str(result_df[VisitSchema.VISIT_START_AT_UTC.name].dt.tz) == "UTC"
+    assert result_df[VisitSchema.VISIT_START_AT_UTC.name].isna().tolist() == [
+        False,
+        True,
+    ]
@@ -118,3 +118,44 @@ def test_shift_hours_transform() -> None:
         expected_results["WEEKEND_HOURS"],
     ):
         assert round(result, 3) == round(expected, 3)
+
+
+def test_shift_hours_transform_multi_day_punch() -> None:
+    """
+    Test that a punch over three days is split by day and that the punches without
+    an end are dropped
+    """
+    punch_df = DataFrame(
+        {
+            "START_TIME": [
+                Timestamp(year=2023, month=1, day=5, hour=16),
+                Timestamp(year=2023, month=1, day=5, hour=16),
+            ],
+            "END_TIME": [Timestamp(year=2023, month=1, day=7, hour=8), None],
+        }
+    )
+    results_df, _ = ShiftHoursCalculatedFields()(
+        punch_df, errors=None, conf=None, env=None
+    )
+
+    assert results_df.index.tolist() == [0, 0, 0]
+    assert results_df[ClockSchema.START_TIME].tolist() == [
+        Timestamp(year=2023, month=1, day=5, hour=16),
+        Timestamp(year=2023, month=1, day=6),
+        Timestamp(year=2023, month=1, day=7),
+    ]
+    assert [round(hours, 3) for hours in results_df[ClockSchema.DAY_HOURS]] == [
+        1.0,
+        10.0,
+        1.0,
+    ]
+    assert [round(hours, 3) for hours in results_df[ClockSchema.NIGHT_HOURS]] == [
+        7.0,
+        14.0,
+        7.0,
+    ]
+    assert [round(hours, 3) for hours in results_df[ClockSchema.WEEKEND_HOURS]] == [
+        0.0,
+        0.0,
+        8.0,
+    ]
@@ -4,9 +4,12 @@ This module contains the tests for the GenerateYLabelTransform class
 
 from os import path
 from datetime import datetime
-from pandas import read_csv
+from pandas import DataFrame, Timestamp, read_csv, to_datetime
 from src.data.transforms.target_variable.generate_y_label_transform import (
+    LABEL_POLICY_COLUMNS,
+    LABEL_POLICY_HORIZONS,
     GenerateYLabelTransform,
+    select_y_label,
 )
 from src.data.schema.status_schema import StatusSchema
 from src.data.schema.y_label_schema import YLabelSchema
@@ -74,3 +77,76 @@ def test_y_label():
 
     assert result_df.equals(expected_df)
     assert len(errors) == 0
+
+
+def test_y_label_several_terminations():
+    """
+    This method tests that an employee terminated twice gets one label per day, set
+    when one of the terminations is within the horizon.
+    """
+    status_df = DataFrame(
+        {
+            StatusSchema.EMPLOYEE_ID: [1, 1, 2, 1],
+            StatusSchema.STATUS_HISTORICAL: [
+                "terminated",
+                "terminated",
+                "terminated",
+                "active",
+            ],
+            StatusSchema.STATUS_START_DATE: to_datetime(
+                ["2023-01-01 10:00", "2023-03-01 08:00", "2023-06-01", "2023-02-01"]
+            ),
+        }
+    )
+
+    result_df, _ = GenerateYLabelTransform(label_policy="30Days")(
+        status_df, ErrorDataFrame(status_df, config=conf), conf=conf, env=env
+    )
+
+    assert len(result_df) == 2 * 152
+    labels = result_df.set_index([YLabelSchema.EMPLOYEE_ID, YLabelSchema.PERIOD_START])[
+        YLabelSchema.Y_LABEL
+    ]
+    assert labels[(1, Timestamp("2023-01-01"))] == 1
+    assert labels[(1, Timestamp("2023-01-02"))] == 0
+    assert labels[(1, Timestamp("2023-01-30"))] == 1
+    assert labels[(1, Timestamp("2023-03-02"))] == 0
+    assert labels[(2, Timestamp("2023-05-02"))] == 1
+    assert labels[(2, Timestamp("2023-05-01"))] == 0
+    assert labels.sum() == 1 + 31 + 31
+
+
+def test_y_label_several_label_policies():
+    """
+    This method tests that the labels of every label policy are generated in one pass
+    and that the labels of a label policy are selected as Y_LABEL.
+    """
+    transformer = GenerateYLabelTransform(label_policies=list(LABEL_POLICY_HORIZONS))
+    assert transformer.to_dict()["label_policies"] == [
+        "7Days",
+        "30Days",
+        "60Days",
+        "90Days",
+    ]
+
+    result_df, _ = transformer(
+        input_df.copy(), ErrorDataFrame(input_df, config=conf), conf=conf, env=env
+    )
+
+    assert list(result_df.columns) == [
+        YLabelSchema.EMPLOYEE_ID,
+        YLabelSchema.PERIOD_START,
+        *LABEL_POLICY_COLUMNS.values(),
+    ]
+    for label_policy in LABEL_POLICY_HORIZONS:
+        expected_labels, _ = GenerateYLabelTransform(label_policy=label_policy)(
+            input_df.copy(), ErrorDataFrame(input_df, config=conf), conf=conf, env=env
+        )
+        selected_df = select_y_label(result_df, label_policy)
+        assert list(selected_df.columns) == list(expected_labels.columns)
+        assert selected_df.equals(expected_labels)
+    assert select_y_label(result_df, "90Days").equals(expected_df)
+    assert (
+        result_df[YLabelSchema.Y_LABEL_7_DAYS].sum()
+        < result_df[YLabelSchema.Y_LABEL_90_DAYS].sum()
+    )